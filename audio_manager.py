@@ -138,3 +138,48 @@ class AudioManager:
         """Clean up audio resources"""
         self.stop_music()
         pygame.mixer.quit()
+
+
+class SilentAudioManager:
+    """Stand-in for AudioManager that never touches the mixer, for headless runs"""
+    
+    def __init__(self):
+        self.music_volume = 0.5
+        self.sfx_volume = 0.7
+        self.sounds = {}
+    
+    def load_sounds(self):
+        pass
+    
+    def play_music(self, music_file=None, loops=-1):
+        return False
+    
+    def restart_music(self, music_file=None, loops=-1):
+        return False
+    
+    def stop_music(self):
+        pass
+    
+    def pause_music(self):
+        pass
+    
+    def resume_music(self):
+        pass
+    
+    def play_sound(self, sound_name):
+        pass
+    
+    def set_music_volume(self, volume):
+        self.music_volume = max(0.0, min(1.0, volume))
+    
+    def set_sfx_volume(self, volume):
+        self.sfx_volume = max(0.0, min(1.0, volume))
+    
+    def toggle_music(self):
+        return False
+    
+    def set_music_speed(self, speed):
+        pass
+    
+    def cleanup(self):
+        pass
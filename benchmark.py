@@ -0,0 +1,643 @@
+"""
+Benchmarks - Measures the cost of hot paths in the game
+Run with: python benchmark.py
+Scenarios: python benchmark.py --scenario all --frames 600 --output results.json
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import contextlib
+import tracemalloc
+import numpy as np
+
+# Run without a window or sound device
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# The game logs progress to stdout; send it to stderr so stdout carries only reports
+with contextlib.redirect_stdout(sys.stderr):
+    import pygame
+    from config_loader import config
+    from profiler import profiler
+
+
+def surface_bytes(surfaces):
+    """Total pixel memory of the distinct surfaces in an iterable"""
+    unique = {id(surface): surface for surface in surfaces}
+    return sum(s.get_bytesize() * s.get_width() * s.get_height() for s in unique.values())
+
+
+def measure(func, iterations, surfaces_of=None):
+    """Time and trace allocations of func over a number of iterations
+
+    Python allocations are traced with tracemalloc. Surface pixel memory lives
+    outside the Python heap, so surfaces_of maps each result to the surfaces it
+    holds and their distinct pixel memory is counted separately.
+
+    Returns: (microseconds per call, Python bytes per call, pixel bytes per call)
+    """
+    # Warm up caches so the first-call cost does not skew the numbers
+    func()
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [func() for _ in range(iterations)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    pixels = 0
+    if surfaces_of is not None:
+        pixels = surface_bytes(s for result in kept for s in surfaces_of(result))
+
+    return elapsed / iterations * 1e6, (after - before) / iterations, pixels / iterations
+
+
+def report(name, variants):
+    """Print one benchmark line per variant"""
+    for label, (usec, py_bytes, px_bytes) in variants:
+        print(f"{name:<24} {label:<10} {usec:9.2f} us/op {py_bytes:10.1f} py B/op {px_bytes:10.1f} px B/op")
+
+
+def bench_bullet_creation(iterations=5000):
+    """Bullets sharing cached images vs drawing a private surface per shot"""
+    from entities import Bullet
+
+    def cached():
+        return Bullet(400, 300, 4.9, -4.9, (255, 255, 100), is_enemy=False)
+
+    def uncached():
+        # What every shot cost before the image cache
+        image = pygame.Surface((12, 12), pygame.SRCALPHA)
+        Bullet.draw_bullet(image, (255, 255, 100), False)
+        return image.convert_alpha()
+
+    report("bullet_creation", [
+        ("cached", measure(cached, iterations, lambda bullet: [bullet.image])),
+        ("uncached", measure(uncached, iterations, lambda image: [image])),
+    ])
+
+
+def bench_particle_fade(iterations=20, bursts=20):
+    """Particle storm faded through pre-baked ramps vs a new surface per frame"""
+    import random
+    from entities import Particle
+
+    class UncachedParticle(Particle):
+        """Particle that fades the way it did before the ramp cache"""
+
+        def update(self):
+            self.age += 1
+            self.rect.x += self.speed_x
+            self.rect.y += self.speed_y
+            self.speed_y += 0.15
+            if self.age > self.lifetime * 0.5:
+                fade = 1.0 - (self.age - self.lifetime * 0.5) / (self.lifetime * 0.5)
+                self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+                color_with_alpha = (*self.base_color[:3], int(255 * fade))
+                pygame.draw.circle(self.image, color_with_alpha, (self.size // 2, self.size // 2), self.size // 2)
+            if self.age >= self.lifetime:
+                self.kill()
+
+    lifetime = config.get('particles', 'explosion_lifetime')
+    count = 25  # Square kill explosion
+
+    def storm(particle_cls):
+        rng = random.Random(0)
+        group = pygame.sprite.Group()
+        for _ in range(bursts):
+            for _ in range(count):
+                variation = rng.randint(-30, 30)
+                color = tuple(max(0, min(255, c + variation)) for c in (255, 180, 50))
+                group.add(particle_cls(400, 300, color, rng.uniform(-4, 4), rng.uniform(-4, 4),
+                                       rng.randint(2, 5), lifetime))
+        # Every image shown over the storm's lifetime
+        shown = []
+        while group:
+            group.update()
+            shown.extend(particle.image for particle in group)
+        return shown
+
+    report("particle_fade", [
+        ("ramp", measure(lambda: storm(Particle), iterations, lambda shown: shown)),
+        ("uncached", measure(lambda: storm(UncachedParticle), iterations, lambda shown: shown)),
+    ])
+
+
+def bench_particle_engine(iterations=20, bursts=40):
+    """Chain-kill explosions through the vectorized engine vs one sprite per particle"""
+    import math
+    import random
+    from entities import Particle
+    from particle_system import ParticleSystem
+
+    screen = pygame.display.get_surface()
+    lifetime = config.get('particles', 'explosion_lifetime')
+    count = 25  # Square kill explosion
+
+    def sprites():
+        rng = random.Random(0)
+        group = pygame.sprite.Group()
+        for _ in range(bursts):
+            for _ in range(count):
+                angle = rng.uniform(0, 2 * math.pi)
+                speed = rng.uniform(1, 4)
+                group.add(Particle(400, 300, (255, 180, 50), math.cos(angle) * speed, math.sin(angle) * speed,
+                                   rng.randint(2, 5), lifetime))
+        while group:
+            group.update()
+            for particle in group:
+                screen.blit(particle.image, particle.rect)
+
+    system = ParticleSystem(bursts * count, seed=0)
+
+    def vectorized():
+        for _ in range(bursts):
+            system.emit(400, 300, (255, 180, 50), count, 1, 4, 2, 5, lifetime)
+        while len(system):
+            system.update()
+            system.draw(screen)
+
+    report("particle_engine", [
+        ("vectorized", measure(vectorized, iterations)),
+        ("sprites", measure(sprites, iterations)),
+    ])
+
+
+def bench_bullet_movement(iterations=200, bullets=5000):
+    """Advancing thousands of live bullets through the array store vs Bullet.update"""
+    import random
+    from entities import Bullet
+    from sprite_store import BulletStore
+
+    width = config.get('game', 'screen_width')
+    height = config.get('game', 'screen_height')
+    rng = random.Random(0)
+    specs = [(rng.uniform(0, width), rng.uniform(0, height), rng.uniform(-3, 3), rng.uniform(-3, 3))
+             for _ in range(bullets)]
+
+    def spawn():
+        group = pygame.sprite.Group()
+        for x, y, vx, vy in specs:
+            group.add(Bullet(x, y, vx, vy, (255, 100, 100), is_enemy=True))
+        return group
+
+    # Refill bullets that left the screen so every frame moves the full count
+    group = spawn()
+    store = BulletStore(bullets)
+    for bullet in group:
+        store.add(bullet)
+
+    def array_store():
+        store.update(width, height)
+        for x, y, vx, vy in specs[:bullets - len(store)]:
+            bullet = Bullet(x, y, vx, vy, (255, 100, 100), is_enemy=True)
+            group.add(bullet)
+            store.add(bullet)
+
+    sprites = spawn()
+
+    def per_bullet():
+        for bullet in sprites:
+            bullet.update(width, height)
+        for x, y, vx, vy in specs[:bullets - len(sprites)]:
+            sprites.add(Bullet(x, y, vx, vy, (255, 100, 100), is_enemy=True))
+
+    report("bullet_movement", [
+        ("array", measure(array_store, iterations)),
+        ("sprites", measure(per_bullet, iterations)),
+    ])
+
+
+def bench_enemy_homing(iterations=200, enemies=500):
+    """Homing step for hundreds of enemies through the swarm vs Enemy.update"""
+    import random
+    from entities import Enemy, TriangleEnemy, SquareEnemy
+    from sprite_store import EnemySwarm
+
+    width = config.get('game', 'screen_width')
+    height = config.get('game', 'screen_height')
+    player_pos = (width // 2, height // 2)
+
+    def spawn():
+        rng = random.Random(0)
+        kinds = (Enemy, TriangleEnemy, SquareEnemy)
+        return [rng.choice(kinds)(rng.uniform(-50, width + 50), rng.uniform(-50, height + 50), width, height)
+                for _ in range(enemies)]
+
+    swarm = EnemySwarm(enemies)
+    swarm_enemies = spawn()
+    for enemy in swarm_enemies:
+        swarm.add(enemy)
+
+    def batched():
+        swarm.update(player_pos)
+        for enemy in swarm_enemies:
+            enemy.update_timers()
+
+    sprite_enemies = spawn()
+
+    def per_enemy():
+        for enemy in sprite_enemies:
+            enemy.update(player_pos)
+
+    report("enemy_homing", [
+        ("batched", measure(batched, iterations)),
+        ("per_enemy", measure(per_enemy, iterations)),
+    ])
+
+
+def bench_collision(iterations=50, enemies=500, bullets=300):
+    """Bullet-enemy collision phase through the spatial hash vs spritecollide per bullet"""
+    import random
+    from entities import Enemy, Bullet
+    from spatial_hash import SpatialHash
+
+    width = config.get('game', 'screen_width')
+    height = config.get('game', 'screen_height')
+    rng = random.Random(0)
+    enemy_group = pygame.sprite.Group(
+        Enemy(rng.uniform(-50, width + 50), rng.uniform(-50, height + 50), width, height) for _ in range(enemies))
+    bullet_list = [Bullet(rng.uniform(0, width), rng.uniform(0, height), 0, 0) for _ in range(bullets)]
+    grid = SpatialHash(width, config.get('collision', 'grid_columns'))
+
+    def hashed():
+        grid.build(enemy_group)
+        return [grid.collide(bullet.rect) for bullet in bullet_list]
+
+    def linear():
+        return [pygame.sprite.spritecollide(bullet, enemy_group, False) for bullet in bullet_list]
+
+    # The broadphase must not change which enemies are hit
+    assert hashed() == linear()
+
+    report("collision", [
+        ("hashed", measure(hashed, iterations)),
+        ("linear", measure(linear, iterations)),
+    ])
+
+
+def bench_bullet_pool(iterations=200, shots=300):
+    """Bullet churn through the object pool vs constructing every bullet"""
+    from entities import Bullet, bullet_pool
+
+    group = pygame.sprite.Group()
+
+    def pooled():
+        for _ in range(shots):
+            group.add(bullet_pool.acquire(400, 300, 4.9, -4.9, (255, 255, 100), is_enemy=False))
+        for bullet in group.sprites():
+            bullet.kill()
+
+    def constructed():
+        for _ in range(shots):
+            group.add(Bullet(400, 300, 4.9, -4.9, (255, 255, 100), is_enemy=False))
+        for bullet in group.sprites():
+            bullet.kill()
+
+    bullet_pool.reset_stats()
+    report("bullet_pool", [
+        ("pooled", measure(pooled, iterations)),
+        ("new", measure(constructed, iterations)),
+    ])
+    stats = bullet_pool.stats()
+    print(f"{'bullet_pool':<24} {'counters':<10} hits={stats['hits']} misses={stats['misses']} dropped={stats['dropped']}")
+
+
+def bench_starfield(iterations=100, stars=2000):
+    """Scrolling and drawing thousands of stars as arrays vs a list of star dicts"""
+    import math
+    import random
+    from starfield import Starfield
+
+    width = config.get('game', 'screen_width')
+    height = config.get('game', 'screen_height')
+    screen = pygame.display.get_surface()
+
+    starfield = Starfield(stars, width, height, seed=0)
+
+    def vectorized():
+        starfield.update()
+        starfield.draw(screen, time.time())
+
+    # What update_starfield and draw_starfield did per star before
+    rng = random.Random(0)
+    star_dicts = [{
+        'x': rng.randint(0, width),
+        'y': rng.randint(0, height),
+        'size': size,
+        'brightness': rng.randint(150, 255),
+        'speed': rng.uniform(0.1, 0.8) * (size * 0.5),
+        'twinkle_speed': rng.uniform(0.02, 0.05),
+        'twinkle_offset': rng.uniform(0, 6.28)
+    } for size in (rng.choice([1, 1, 1, 2, 2, 3]) for _ in range(stars))]
+
+    def dicts():
+        for star in star_dicts:
+            star['y'] += star['speed']
+            if star['y'] > height:
+                star['y'] = 0
+                star['x'] = rng.randint(0, width)
+        game_time = time.time()
+        for star in star_dicts:
+            twinkle = math.sin(game_time * star['twinkle_speed'] + star['twinkle_offset'])
+            brightness = max(100, min(255, int(star['brightness'] + twinkle * 30)))
+            pygame.draw.circle(screen, (brightness, brightness, brightness),
+                               (int(star['x']), int(star['y'])), star['size'])
+
+    report("starfield", [
+        ("arrays", measure(vectorized, iterations)),
+        ("dicts", measure(dicts, iterations)),
+    ])
+
+
+def bench_headless(iterations=600):
+    """One game frame simulated headless vs updated and drawn with rendering"""
+    import random
+    from game_manager import GameManager, KeyState
+
+    width = config.get('game', 'screen_width')
+    height = config.get('game', 'screen_height')
+    keys = [pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d, pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT]
+
+    def frame_runner(game, draw):
+        rng = random.Random(0)
+        game.reset_game()
+
+        def frame():
+            game.update(KeyState(rng.sample(keys, 3)))
+            if game.state != game.PLAYING:
+                game.reset_game()
+            if draw:
+                game.draw()
+        return frame
+
+    headless_game = GameManager(None, width, height, headless=True)
+    rendered_game = GameManager(pygame.display.get_surface(), width, height)
+    headless = measure(frame_runner(headless_game, False), iterations)
+    rendered = measure(frame_runner(rendered_game, True), iterations)
+
+    report("game_frame", [
+        ("headless", headless),
+        ("rendered", rendered),
+    ])
+
+
+BENCHMARKS = [
+    bench_bullet_creation,
+    bench_particle_fade,
+    bench_particle_engine,
+    bench_bullet_movement,
+    bench_enemy_homing,
+    bench_collision,
+    bench_bullet_pool,
+    bench_starfield,
+    bench_headless,
+]
+
+
+# Scenarios - whole-game frames under a fixed load, timed per phase
+#
+# Each scenario is called before every frame with (game, frame, rnd) to top
+# its load back up, and returns the keys held that frame. The player cannot
+# die: health is restored after every update, so hits still cost what they
+# cost in play but the load never resets.
+
+ARROW_KEYS = (pygame.K_UP, pygame.K_RIGHT, pygame.K_DOWN, pygame.K_LEFT)
+
+
+def add_enemy_bullet(game, x, y, speed_x, speed_y):
+    """Add an enemy bullet to the game the way an enemy shot does"""
+    from entities import bullet_pool
+
+    bullet = bullet_pool.acquire(x, y, speed_x, speed_y, (255, 100, 100), is_enemy=True)
+    game.enemy_bullets.add(bullet)
+    game.all_sprites.add(bullet)
+    if game.bullet_store is not None:
+        game.bullet_store.add(bullet)
+
+
+def scenario_enemies(game, frame, rnd, count=500):
+    """500 enemies homing on an idle player"""
+    from game_manager import NO_KEYS
+
+    while len(game.enemies) < count:
+        game.spawn_enemy()
+    return NO_KEYS
+
+
+def scenario_enemy_bullets(game, frame, rnd, count=5000):
+    """5,000 enemy bullets crossing the screen"""
+    from game_manager import NO_KEYS
+
+    width, height = game.screen_width, game.screen_height
+    while len(game.enemy_bullets) < count:
+        angle = rnd.uniform(0, 2 * np.pi)
+        add_enemy_bullet(game, rnd.uniform(0, width), rnd.uniform(0, height),
+                         3 * np.cos(angle), 3 * np.sin(angle))
+    return NO_KEYS
+
+
+def scenario_particle_storm(game, frame, rnd, kills=8):
+    """Eight square-enemy kills a frame: big explosions and screen shake"""
+    from game_manager import NO_KEYS
+
+    for _ in range(kills):
+        game.create_explosion_particles(rnd.uniform(0, game.screen_width), rnd.uniform(0, game.screen_height),
+                                        (255, 180, 50), count=25)
+    game.add_screen_shake(config.get('screen_shake', 'square_kill_intensity'),
+                          config.get('screen_shake', 'square_kill_duration'))
+    return NO_KEYS
+
+
+def scenario_triple_shot(game, frame, rnd, count=100):
+    """Powered-up triple shot sweeping through 100 enemies"""
+    from game_manager import KeyState
+
+    if not game.player.powered_up:
+        game.player.activate_powerup(config.get('powerup', 'duration_seconds'))
+    while len(game.enemies) < count:
+        game.spawn_enemy()
+    # Turn the barrage a quarter every second
+    return KeyState([ARROW_KEYS[frame // 60 % len(ARROW_KEYS)]])
+
+
+SCENARIOS = {
+    'enemies_500': scenario_enemies,
+    'enemy_bullets_5000': scenario_enemy_bullets,
+    'particle_storm': scenario_particle_storm,
+    'triple_shot_barrage': scenario_triple_shot,
+}
+
+PHASES = ('update', 'draw', 'frame')
+PERCENTILES = (50, 90, 99)
+
+
+def run_frame(game, scenario, frame, rnd, max_health, clock):
+    """Run one scenario frame, returning the end time of each phase after clock()"""
+    keys = scenario(game, frame, rnd)
+    start = clock()
+    game.update(keys)
+    updated = clock()
+
+    # Keep the player alive so the load never resets
+    game.state = game.PLAYING
+    game.player.health = max_health
+
+    game.draw()
+    drawn = clock()
+    return start, updated, drawn
+
+
+def summarize_ms(ms):
+    """Mean, percentiles and max of a series of millisecond timings"""
+    summary = {'mean_ms': round(float(ms.mean()), 4)}
+    for p in PERCENTILES:
+        summary[f'p{p}_ms'] = round(float(np.percentile(ms, p)), 4)
+    summary['max_ms'] = round(float(ms.max()), 4)
+    return summary
+
+
+def run_scenario(name, frames, warmup, alloc_frames, headless=False, seed=0, scopes=False):
+    """Run a scenario and summarize its per-phase frame times and allocations
+
+    Frames are timed first; allocations are traced in a separate pass, since
+    tracing slows every allocation down. With scopes, the timed pass also
+    records the game's profiler scopes (player, enemies, collisions, HUD...).
+
+    Allocations are reported as the peak Python memory each phase allocates
+    above what it started with (never negative), and separately as the net
+    bytes it leaves allocated, which goes negative when a phase frees more
+    than it allocates.
+
+    Returns: Dict of timing percentiles (ms), allocations (bytes) and load counts
+    """
+    from game_manager import GameManager
+
+    scenario = SCENARIOS[name]
+    width = config.get('game', 'screen_width')
+    height = config.get('game', 'screen_height')
+    game = GameManager(None if headless else pygame.display.get_surface(), width, height,
+                       headless=headless, seed=seed)
+    game.reset_game()
+    max_health = config.get('player', 'max_health')
+    rnd = random.Random(seed)
+
+    for frame in range(warmup):
+        run_frame(game, scenario, frame, rnd, max_health, time.perf_counter)
+
+    if scopes:
+        profiler.window = frames
+        profiler.set_enabled(True)
+    times = np.zeros((frames, len(PHASES)))
+    for i in range(frames):
+        start, updated, drawn = run_frame(game, scenario, warmup + i, rnd, max_health, time.perf_counter)
+        times[i] = (updated - start, drawn - updated, drawn - start)
+        profiler.end_frame()
+    scope_history = {scope: np.array(samples) * 1000 for scope, samples in profiler.history.items()}
+    profiler.set_enabled(False)
+
+    # Net bytes each phase leaves allocated, and the peak it allocates above its start
+    net = np.zeros((alloc_frames, len(PHASES)))
+    peak = np.zeros((alloc_frames, len(PHASES)))
+    tracemalloc.start()
+    for i in range(alloc_frames):
+        marks = []
+
+        def clock():
+            current, phase_peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            marks.append((current, phase_peak))
+            return current
+
+        start, updated, drawn = run_frame(game, scenario, warmup + frames + i, rnd, max_health, clock)
+        net[i] = (updated - start, drawn - updated, drawn - start)
+        peak[i] = (marks[1][1] - start, marks[2][1] - updated, max(marks[1][1], marks[2][1]) - start)
+    tracemalloc.stop()
+
+    result = {
+        'description': scenario.__doc__,
+        'frames': frames,
+        'phases': {},
+        'load': {
+            'enemies': len(game.enemies),
+            'enemy_bullets': len(game.enemy_bullets),
+            'player_bullets': len(game.player_bullets),
+            'particles': len(game.particle_system) if game.particle_system is not None else len(game.particles),
+        },
+    }
+    for col, phase in enumerate(PHASES):
+        summary = summarize_ms(times[:, col] * 1000)
+        if alloc_frames:
+            summary['peak_alloc_bytes_mean'] = round(float(peak[:, col].mean()), 1)
+            summary['peak_alloc_bytes_max'] = int(peak[:, col].max())
+            summary['net_bytes_per_frame'] = round(float(net[:, col].mean()), 1)
+        result['phases'][phase] = summary
+    if scopes:
+        result['scopes'] = {scope: summarize_ms(ms) for scope, ms in scope_history.items()}
+    return result
+
+
+def run_scenarios(names, frames, warmup, alloc_frames, headless=False, scopes=False):
+    """Run named scenarios and return the machine-readable report"""
+    return {
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'numpy': np.__version__,
+        'video_driver': pygame.display.get_driver(),
+        'headless': headless,
+        'scenarios': {name: run_scenario(name, frames, warmup, alloc_frames, headless, scopes=scopes)
+                      for name in names},
+    }
+
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Game performance benchmarks")
+    parser.add_argument('--scenario', action='append', choices=['all', *SCENARIOS],
+                        help="Run a scenario instead of the micro benchmarks (repeatable)")
+    parser.add_argument('--frames', type=int, default=600, help="Timed frames per scenario")
+    parser.add_argument('--warmup', type=int, default=60, help="Untimed frames before timing")
+    parser.add_argument('--alloc-frames', type=int, default=60, help="Frames traced for allocations, 0 to skip")
+    parser.add_argument('--headless', action='store_true', help="Time the game rules only, without drawing")
+    parser.add_argument('--scopes', action='store_true', help="Also report the game's profiler scopes")
+    parser.add_argument('--output', metavar='FILE', help="Write the JSON report to FILE instead of stdout")
+    return parser.parse_args()
+
+
+def main():
+    """Run every benchmark, or the requested scenarios"""
+    args = parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((config.get('game', 'screen_width'), config.get('game', 'screen_height')))
+
+    if args.scenario:
+        names = list(SCENARIOS) if 'all' in args.scenario else args.scenario
+        with contextlib.redirect_stdout(sys.stderr):
+            results = run_scenarios(names, args.frames, args.warmup, args.alloc_frames, args.headless, args.scopes)
+        report_json = json.dumps(results, indent=2)
+        if args.output:
+            with open(args.output, 'w') as f:
+                f.write(report_json + '\n')
+        else:
+            print(report_json)
+    else:
+        for bench in BENCHMARKS:
+            bench()
+
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,17 +3,67 @@ Game Entities - Player, Enemy, Bullet classes
 """
 
 import pygame
-import random
 import math
+import random
 from config_loader import config
+from sprite_store import StoredSprite
+from object_pool import ObjectPool, PooledSprite
+
+
+# Blank shared images standing in for sprite images in headless games, keyed by size
+_placeholders = {}
+
+
+def placeholder_image(size):
+    """Return the shared blank surface standing in for every sprite image of a size"""
+    image = _placeholders.get(size)
+    if image is None:
+        image = pygame.Surface(size)
+        _placeholders[size] = image
+    return image
+
+
+def convert_for_display(surface):
+    """Convert a pre-rendered surface to the display pixel format when a display exists"""
+    if pygame.display.get_surface() is not None:
+        return surface.convert_alpha()
+    return surface
+
+
+def render_frame(size, draw_func, *args, headless=False):
+    """Pre-render a single frame by calling draw_func(surface, *args) on a new surface
+
+    Headless frames are the shared placeholder of the size instead.
+    """
+    if headless:
+        return placeholder_image(size)
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    draw_func(surface, *args)
+    return convert_for_display(surface)
+
+
+def render_flash_frames(size, flash_duration, draw_func, headless=False):
+    """Pre-render an enemy's normal frame followed by one frame per hit_flash value
+
+    draw_func(surface, hit_flash) draws a single frame onto a cleared surface.
+    """
+    return [render_frame(size, draw_func, hit_flash, headless=headless) for hit_flash in range(flash_duration + 1)]
+
+
+class MovingSprite:
+    """Sprite mixin for sprites drawn stepped back along their last move between updates"""
+
+    last_move = (0, 0)  # Pixels moved by the latest update
+
 
 class Player(pygame.sprite.Sprite):
     """Player character class"""
     
-    def __init__(self, x, y, screen_width, screen_height):
+    def __init__(self, x, y, screen_width, screen_height, headless=False):
         super().__init__()
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.headless = headless  # Blank image and blank bullets, for games run without rendering
         
         # Load player stats from config
         self.speed = config.get('player', 'speed')
@@ -36,13 +86,19 @@ class Player(pygame.sprite.Sprite):
         self.invincible_duration = config.get('player', 'invincibility_duration_frames')  # 0.5 seconds at 60 FPS (30 frames)
         
         # Create player surface with transparency (after all attributes are initialized)
-        self.image = pygame.Surface((50, 40), pygame.SRCALPHA)
+        if headless:
+            self.image = placeholder_image((50, 40))
+        else:
+            self.image = pygame.Surface((50, 40), pygame.SRCALPHA)
         self.draw_player()
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
     
     def draw_player(self):
         """Draw player in retro space game style - simple square ship"""
+        if self.headless:
+            return
+        
         # Clear surface
         self.image.fill((0, 0, 0, 0))
         
@@ -160,7 +216,8 @@ class Player(pygame.sprite.Sprite):
             bullet_speed = config.get('player', 'bullet_speed')
             
             # Normal shot - center bullet
-            bullet = Bullet(self.rect.centerx, self.rect.centery, shoot_x * bullet_speed, shoot_y * bullet_speed, (255, 255, 0), is_enemy=False)
+            bullet = bullet_pool.acquire(self.rect.centerx, self.rect.centery, shoot_x * bullet_speed, shoot_y * bullet_speed, (255, 255, 0), is_enemy=False,
+                                         headless=self.headless)
             bullets.append(bullet)
             
             # Determine sound effect
@@ -175,24 +232,26 @@ class Player(pygame.sprite.Sprite):
                 
                 # Left bullet (offset perpendicular to shoot direction)
                 offset = 15
-                left_bullet = Bullet(
+                left_bullet = bullet_pool.acquire(
                     self.rect.centerx + perp_x * offset,
                     self.rect.centery + perp_y * offset,
                     shoot_x * bullet_speed,
                     shoot_y * bullet_speed,
                     (255, 255, 100),  # Slightly different color when powered
-                    is_enemy=False
+                    is_enemy=False,
+                    headless=self.headless
                 )
                 bullets.append(left_bullet)
                 
                 # Right bullet
-                right_bullet = Bullet(
+                right_bullet = bullet_pool.acquire(
                     self.rect.centerx - perp_x * offset,
                     self.rect.centery - perp_y * offset,
                     shoot_x * bullet_speed,
                     shoot_y * bullet_speed,
                     (255, 255, 100),
-                    is_enemy=False
+                    is_enemy=False,
+                    headless=self.headless
                 )
                 bullets.append(right_bullet)
                 
@@ -246,28 +305,36 @@ class Player(pygame.sprite.Sprite):
         return self.health <= 0
 
 
-class Enemy(pygame.sprite.Sprite):
+class Enemy(StoredSprite, pygame.sprite.Sprite):
     """Enemy character class - Circle type (slow, common)"""
     
-    def __init__(self, x, y, screen_width, screen_height):
+    SIZE = (40, 40)
+    HIT_FLASH_DURATION = 6  # Frames to flash white
+    
+    # Frames shared by all circle enemies, indexed by hit_flash (0 = normal look), per headless mode
+    _frames = {}
+    
+    def __init__(self, x, y, screen_width, screen_height, headless=False, rules=None):
         super().__init__()
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.headless = headless
+        self.rules = random if rules is None else rules  # Random stream for shoot cooldowns, unseeded if None
         
-        # Hit effect (initialize before drawing)
+        # Hit effect
         self.hit_flash = 0  # Flash duration when hit
-        self.hit_flash_duration = 6  # Frames to flash white
+        self.hit_flash_duration = self.HIT_FLASH_DURATION
         
-        # Create enemy surface with transparency
-        self.image = pygame.Surface((40, 40), pygame.SRCALPHA)
-        self.draw_circle_enemy()
+        # Use the shared pre-rendered frames instead of a private surface
+        self.frames = self.get_frames(headless)
+        self.image = self.frames[0]
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
         
         # Circle enemy stats from config
         self.speed = config.get('enemy_circle', 'speed')
         self.health = config.get('enemy_circle', 'health')
-        self.shoot_cooldown = random.randint(
+        self.shoot_cooldown = self.rules.randint(
             config.get('enemy_circle', 'shoot_cooldown_min'),
             config.get('enemy_circle', 'shoot_cooldown_max')
         )
@@ -277,59 +344,64 @@ class Enemy(pygame.sprite.Sprite):
         self.bullet_damage = config.get('enemy_circle', 'bullet_damage')
         self.collision_damage = config.get('enemy_circle', 'collision_damage')
     
-    def draw_circle_enemy(self):
+    @classmethod
+    def get_frames(cls, headless=False):
+        """Return the shared normal and hit-flash frames, rendering them on first use"""
+        frames = cls._frames.get(headless)
+        if frames is None:
+            frames = render_flash_frames(cls.SIZE, cls.HIT_FLASH_DURATION, cls.draw_circle_enemy, headless)
+            cls._frames[headless] = frames
+        return frames
+    
+    @classmethod
+    def draw_circle_enemy(cls, surface, hit_flash):
         """Draw circle enemy in retro space game style"""
         # Clear surface
-        self.image.fill((0, 0, 0, 0))
+        surface.fill((0, 0, 0, 0))
         
         center = (20, 20)
         
         # Hit flash effect - flash white when hit
-        if self.hit_flash > 0:
+        if hit_flash > 0:
             # White flash overlay
-            flash_intensity = int(255 * (self.hit_flash / self.hit_flash_duration))
-            pygame.draw.circle(self.image, (255, 255, 255), center, 18)
-            pygame.draw.circle(self.image, (255, 255, flash_intensity), center, 16)
+            flash_intensity = int(255 * (hit_flash / cls.HIT_FLASH_DURATION))
+            pygame.draw.circle(surface, (255, 255, 255), center, 18)
+            pygame.draw.circle(surface, (255, 255, flash_intensity), center, 16)
         else:
             # Normal appearance
             # Main body - solid red circle
-            pygame.draw.circle(self.image, (220, 0, 0), center, 16)
+            pygame.draw.circle(surface, (220, 0, 0), center, 16)
             
             # Darker inner ring (depth)
-            pygame.draw.circle(self.image, (150, 0, 0), center, 12)
+            pygame.draw.circle(surface, (150, 0, 0), center, 12)
             
             # Central core panel (darker red square)
-            pygame.draw.rect(self.image, (180, 0, 0), (14, 14, 12, 12))
+            pygame.draw.rect(surface, (180, 0, 0), (14, 14, 12, 12))
             
             # Center energy indicator (small yellow square)
-            pygame.draw.rect(self.image, (255, 200, 0), (17, 17, 6, 6))
+            pygame.draw.rect(surface, (255, 200, 0), (17, 17, 6, 6))
         
         # Four directional panels (retro sci-fi details)
         panel_color = (100, 0, 0)
-        pygame.draw.rect(self.image, panel_color, (18, 8, 4, 4))   # Top
-        pygame.draw.rect(self.image, panel_color, (18, 28, 4, 4))  # Bottom
-        pygame.draw.rect(self.image, panel_color, (8, 18, 4, 4))   # Left
-        pygame.draw.rect(self.image, panel_color, (28, 18, 4, 4))  # Right
+        pygame.draw.rect(surface, panel_color, (18, 8, 4, 4))   # Top
+        pygame.draw.rect(surface, panel_color, (18, 28, 4, 4))  # Bottom
+        pygame.draw.rect(surface, panel_color, (8, 18, 4, 4))   # Left
+        pygame.draw.rect(surface, panel_color, (28, 18, 4, 4))  # Right
         
         # Small accent lights on panels (orange dots)
-        pygame.draw.circle(self.image, (255, 150, 0), (20, 10), 1)
-        pygame.draw.circle(self.image, (255, 150, 0), (20, 30), 1)
-        pygame.draw.circle(self.image, (255, 150, 0), (10, 20), 1)
-        pygame.draw.circle(self.image, (255, 150, 0), (30, 20), 1)
+        pygame.draw.circle(surface, (255, 150, 0), (20, 10), 1)
+        pygame.draw.circle(surface, (255, 150, 0), (20, 30), 1)
+        pygame.draw.circle(surface, (255, 150, 0), (10, 20), 1)
+        pygame.draw.circle(surface, (255, 150, 0), (30, 20), 1)
         
         # Outer ring highlight (retro glow effect)
-        pygame.draw.circle(self.image, (255, 100, 100), center, 16, width=2)
+        pygame.draw.circle(surface, (255, 100, 100), center, 16, width=2)
         
         # Inner highlight ring
-        pygame.draw.circle(self.image, (255, 50, 50), center, 12, width=1)
+        pygame.draw.circle(surface, (255, 50, 50), center, 12, width=1)
         
     def update(self, player_pos):
         """Move enemy toward player and handle shooting"""
-        # Update hit flash effect
-        if self.hit_flash > 0:
-            self.hit_flash -= 1
-            self.draw_circle_enemy()  # Redraw with flash effect
-        
         # Calculate direction to player
         dx = player_pos[0] - self.rect.centerx
         dy = player_pos[1] - self.rect.centery
@@ -342,6 +414,15 @@ class Enemy(pygame.sprite.Sprite):
             self.rect.x += dx * self.speed
             self.rect.y += dy * self.speed
         
+        self.update_timers()
+    
+    def update_timers(self):
+        """Advance hit flash and shoot cooldown (movement may be batched separately)"""
+        # Update hit flash effect
+        if self.hit_flash > 0:
+            self.hit_flash -= 1
+            self.image = self.frames[self.hit_flash]  # Swap to the matching shared frame
+        
         # Update shoot cooldown
         if self.shoot_cooldown > 0:
             self.shoot_cooldown -= 1
@@ -367,12 +448,13 @@ class Enemy(pygame.sprite.Sprite):
             dy = dy / distance * bullet_speed
             
             # Reset cooldown from config
-            self.shoot_cooldown = random.randint(
+            self.shoot_cooldown = self.rules.randint(
                 config.get('enemy_circle', 'shoot_cooldown_min'),
                 config.get('enemy_circle', 'shoot_cooldown_max')
             )
-            return Bullet(self.rect.centerx, self.rect.centery, dx, dy, 
-                         (255, 100, 100), is_enemy=True, damage=self.bullet_damage)
+            return bullet_pool.acquire(self.rect.centerx, self.rect.centery, dx, dy, 
+                         (255, 100, 100), is_enemy=True, damage=self.bullet_damage,
+                         headless=self.headless)
         
         return None
     
@@ -382,7 +464,7 @@ class Enemy(pygame.sprite.Sprite):
         
         # Trigger hit flash effect
         self.hit_flash = self.hit_flash_duration
-        self.draw_circle_enemy()  # Redraw immediately with flash
+        self.image = self.frames[self.hit_flash]  # Show the flash frame immediately
         
         if self.health <= 0:
             self.kill()
@@ -390,33 +472,36 @@ class Enemy(pygame.sprite.Sprite):
         return False
 
 
-class TriangleEnemy(pygame.sprite.Sprite):
+class TriangleEnemy(StoredSprite, pygame.sprite.Sprite):
     """Triangle Enemy - Fast and aggressive"""
     
-    def __init__(self, x, y, screen_width, screen_height):
-        super().__init__()
-        self.screen_width = screen_width
-        self.screen_height = screen_height
-        
-    def __init__(self, x, y, screen_width, screen_height):
+    SIZE = (36, 36)
+    HIT_FLASH_DURATION = 6  # Frames to flash white
+    
+    # Frames shared by all triangle enemies, indexed by hit_flash (0 = normal look), per headless mode
+    _frames = {}
+    
+    def __init__(self, x, y, screen_width, screen_height, headless=False, rules=None):
         super().__init__()
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.headless = headless
+        self.rules = random if rules is None else rules  # Random stream for shoot cooldowns, unseeded if None
         
-        # Hit effect (initialize before drawing)
+        # Hit effect
         self.hit_flash = 0  # Flash duration when hit
-        self.hit_flash_duration = 6  # Frames to flash white
+        self.hit_flash_duration = self.HIT_FLASH_DURATION
         
-        # Create triangle enemy surface
-        self.image = pygame.Surface((36, 36), pygame.SRCALPHA)
-        self.draw_triangle_enemy()
+        # Use the shared pre-rendered frames instead of a private surface
+        self.frames = self.get_frames(headless)
+        self.image = self.frames[0]
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
         
         # Triangle enemy stats from config
         self.speed = config.get('enemy_triangle', 'speed')
         self.health = config.get('enemy_triangle', 'health')
-        self.shoot_cooldown = random.randint(
+        self.shoot_cooldown = self.rules.randint(
             config.get('enemy_triangle', 'shoot_cooldown_min'),
             config.get('enemy_triangle', 'shoot_cooldown_max')
         )
@@ -426,18 +511,28 @@ class TriangleEnemy(pygame.sprite.Sprite):
         self.bullet_damage = config.get('enemy_triangle', 'bullet_damage')
         self.collision_damage = config.get('enemy_triangle', 'collision_damage')
     
-    def draw_triangle_enemy(self):
+    @classmethod
+    def get_frames(cls, headless=False):
+        """Return the shared normal and hit-flash frames, rendering them on first use"""
+        frames = cls._frames.get(headless)
+        if frames is None:
+            frames = render_flash_frames(cls.SIZE, cls.HIT_FLASH_DURATION, cls.draw_triangle_enemy, headless)
+            cls._frames[headless] = frames
+        return frames
+    
+    @classmethod
+    def draw_triangle_enemy(cls, surface, hit_flash):
         """Draw triangle enemy in retro space game style"""
         # Clear surface
-        self.image.fill((0, 0, 0, 0))
+        surface.fill((0, 0, 0, 0))
         
         # Hit flash effect - flash white when hit
-        if self.hit_flash > 0:
+        if hit_flash > 0:
             # White flash overlay
-            flash_intensity = int(255 * (self.hit_flash / self.hit_flash_duration))
+            flash_intensity = int(255 * (hit_flash / cls.HIT_FLASH_DURATION))
             points = [(18, 6), (6, 28), (30, 28)]
-            pygame.draw.polygon(self.image, (255, 255, 255), points)
-            pygame.draw.polygon(self.image, (255, 255, flash_intensity), points, width=3)
+            pygame.draw.polygon(surface, (255, 255, 255), points)
+            pygame.draw.polygon(surface, (255, 255, flash_intensity), points, width=3)
         else:
             # Normal appearance
             # Triangle points (pointing down for aggressive look)
@@ -448,7 +543,7 @@ class TriangleEnemy(pygame.sprite.Sprite):
             ]
             
             # Main body - solid purple/magenta triangle
-            pygame.draw.polygon(self.image, (200, 0, 200), points)
+            pygame.draw.polygon(surface, (200, 0, 200), points)
             
             # Inner triangle (darker purple for depth)
             inner_points = [
@@ -456,7 +551,7 @@ class TriangleEnemy(pygame.sprite.Sprite):
                 (12, 24),
                 (24, 24)
             ]
-            pygame.draw.polygon(self.image, (140, 0, 140), inner_points)
+            pygame.draw.polygon(surface, (140, 0, 140), inner_points)
             
             # Core triangle (very dark)
             core_points = [
@@ -464,31 +559,26 @@ class TriangleEnemy(pygame.sprite.Sprite):
                 (15, 22),
                 (21, 22)
             ]
-            pygame.draw.polygon(self.image, (100, 0, 100), core_points)
+            pygame.draw.polygon(surface, (100, 0, 100), core_points)
             
             # Energy core (yellow center)
-            pygame.draw.circle(self.image, (255, 255, 0), (18, 20), 3)
-            pygame.draw.circle(self.image, (255, 255, 200), (18, 20), 1)
+            pygame.draw.circle(surface, (255, 255, 0), (18, 20), 3)
+            pygame.draw.circle(surface, (255, 255, 200), (18, 20), 1)
             
             # Three corner lights (cyan accents)
-            pygame.draw.circle(self.image, (0, 255, 255), (18, 8), 2)   # Top
-            pygame.draw.circle(self.image, (0, 255, 255), (8, 27), 2)   # Bottom left
-            pygame.draw.circle(self.image, (0, 255, 255), (28, 27), 2)  # Bottom right
+            pygame.draw.circle(surface, (0, 255, 255), (18, 8), 2)   # Top
+            pygame.draw.circle(surface, (0, 255, 255), (8, 27), 2)   # Bottom left
+            pygame.draw.circle(surface, (0, 255, 255), (28, 27), 2)  # Bottom right
             
             # Outline for definition
-            pygame.draw.polygon(self.image, (255, 100, 255), points, width=2)
+            pygame.draw.polygon(surface, (255, 100, 255), points, width=2)
             
             # Edge highlights (aggressive look)
-            pygame.draw.line(self.image, (255, 150, 255), (18, 6), (6, 28), 1)
-            pygame.draw.line(self.image, (255, 150, 255), (18, 6), (30, 28), 1)
+            pygame.draw.line(surface, (255, 150, 255), (18, 6), (6, 28), 1)
+            pygame.draw.line(surface, (255, 150, 255), (18, 6), (30, 28), 1)
     
     def update(self, player_pos):
         """Move triangle enemy toward player (same as circle enemy)"""
-        # Update hit flash effect
-        if self.hit_flash > 0:
-            self.hit_flash -= 1
-            self.draw_triangle_enemy()  # Redraw with flash effect
-        
         # Calculate direction to player
         dx = player_pos[0] - self.rect.centerx
         dy = player_pos[1] - self.rect.centery
@@ -501,6 +591,15 @@ class TriangleEnemy(pygame.sprite.Sprite):
             self.rect.x += dx * self.speed
             self.rect.y += dy * self.speed
         
+        self.update_timers()
+    
+    def update_timers(self):
+        """Advance hit flash and shoot cooldown (movement may be batched separately)"""
+        # Update hit flash effect
+        if self.hit_flash > 0:
+            self.hit_flash -= 1
+            self.image = self.frames[self.hit_flash]  # Swap to the matching shared frame
+        
         # Update shoot cooldown
         if self.shoot_cooldown > 0:
             self.shoot_cooldown -= 1
@@ -526,12 +625,13 @@ class TriangleEnemy(pygame.sprite.Sprite):
             dy = dy / distance * bullet_speed
             
             # Reset cooldown from config
-            self.shoot_cooldown = random.randint(
+            self.shoot_cooldown = self.rules.randint(
                 config.get('enemy_triangle', 'shoot_cooldown_min'),
                 config.get('enemy_triangle', 'shoot_cooldown_max')
             )
-            return Bullet(self.rect.centerx, self.rect.centery, dx, dy, 
-                         (255, 100, 255), is_enemy=True, damage=self.bullet_damage)
+            return bullet_pool.acquire(self.rect.centerx, self.rect.centery, dx, dy, 
+                         (255, 100, 255), is_enemy=True, damage=self.bullet_damage,
+                         headless=self.headless)
         
         return None
     
@@ -541,7 +641,7 @@ class TriangleEnemy(pygame.sprite.Sprite):
         
         # Trigger hit flash effect
         self.hit_flash = self.hit_flash_duration
-        self.draw_triangle_enemy()  # Redraw immediately with flash
+        self.image = self.frames[self.hit_flash]  # Show the flash frame immediately
         
         if self.health <= 0:
             self.kill()
@@ -549,21 +649,29 @@ class TriangleEnemy(pygame.sprite.Sprite):
         return False
 
 
-class SquareEnemy(pygame.sprite.Sprite):
+class SquareEnemy(StoredSprite, pygame.sprite.Sprite):
     """Square Enemy - Large, slow tank with high health and heavy damage"""
     
-    def __init__(self, x, y, screen_width, screen_height):
+    SIZE = (80, 80)  # Double the size of other enemies
+    HIT_FLASH_DURATION = 8  # Frames to flash white (slightly longer for big enemy)
+    
+    # Frames shared by all square enemies, indexed by hit_flash (0 = normal look), per headless mode
+    _frames = {}
+    
+    def __init__(self, x, y, screen_width, screen_height, headless=False, rules=None):
         super().__init__()
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.headless = headless
+        self.rules = random if rules is None else rules  # Random stream for shoot cooldowns, unseeded if None
         
-        # Hit effect (initialize before drawing)
+        # Hit effect
         self.hit_flash = 0  # Flash duration when hit
-        self.hit_flash_duration = 8  # Frames to flash white (slightly longer for big enemy)
+        self.hit_flash_duration = self.HIT_FLASH_DURATION
         
-        # Create large square enemy surface (80x80 - double the size of others)
-        self.image = pygame.Surface((80, 80), pygame.SRCALPHA)
-        self.draw_square_enemy()
+        # Use the shared pre-rendered frames instead of a private surface
+        self.frames = self.get_frames(headless)
+        self.image = self.frames[0]
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
         
@@ -571,7 +679,7 @@ class SquareEnemy(pygame.sprite.Sprite):
         self.speed = config.get('enemy_square', 'speed')
         self.health = config.get('enemy_square', 'health')
         self.max_health = self.health  # Store max health for health bar
-        self.shoot_cooldown = random.randint(
+        self.shoot_cooldown = self.rules.randint(
             config.get('enemy_square', 'shoot_cooldown_min'),
             config.get('enemy_square', 'shoot_cooldown_max')
         )
@@ -582,17 +690,27 @@ class SquareEnemy(pygame.sprite.Sprite):
         self.bullet_damage = config.get('enemy_square', 'bullet_damage')
         self.collision_damage = config.get('enemy_square', 'collision_damage')
     
-    def draw_square_enemy(self):
+    @classmethod
+    def get_frames(cls, headless=False):
+        """Return the shared normal and hit-flash frames, rendering them on first use"""
+        frames = cls._frames.get(headless)
+        if frames is None:
+            frames = render_flash_frames(cls.SIZE, cls.HIT_FLASH_DURATION, cls.draw_square_enemy, headless)
+            cls._frames[headless] = frames
+        return frames
+    
+    @classmethod
+    def draw_square_enemy(cls, surface, hit_flash):
         """Draw large square enemy in retro space game style - imposing boss-like appearance"""
         # Clear surface
-        self.image.fill((0, 0, 0, 0))
+        surface.fill((0, 0, 0, 0))
         
         # Hit flash effect - flash white when hit
-        if self.hit_flash > 0:
+        if hit_flash > 0:
             # White flash overlay (more intense for big enemy)
-            flash_intensity = int(255 * (self.hit_flash / self.hit_flash_duration))
-            pygame.draw.rect(self.image, (255, 255, 255), (0, 0, 80, 80), border_radius=4)
-            pygame.draw.rect(self.image, (255, 255, flash_intensity), (6, 6, 68, 68), border_radius=3)
+            flash_intensity = int(255 * (hit_flash / cls.HIT_FLASH_DURATION))
+            pygame.draw.rect(surface, (255, 255, 255), (0, 0, 80, 80), border_radius=4)
+            pygame.draw.rect(surface, (255, 255, flash_intensity), (6, 6, 68, 68), border_radius=3)
         else:
             # Normal appearance
             # Main body - large orange/yellow square with dark borders
@@ -601,57 +719,52 @@ class SquareEnemy(pygame.sprite.Sprite):
             accent_color = (255, 200, 50)  # Light yellow
             
             # Outer frame (thick border)
-            pygame.draw.rect(self.image, dark_color, (0, 0, 80, 80), border_radius=4)
+            pygame.draw.rect(surface, dark_color, (0, 0, 80, 80), border_radius=4)
             
             # Main body
-            pygame.draw.rect(self.image, main_color, (6, 6, 68, 68), border_radius=3)
+            pygame.draw.rect(surface, main_color, (6, 6, 68, 68), border_radius=3)
             
             # Inner darker square (depth)
-            pygame.draw.rect(self.image, (180, 100, 0), (12, 12, 56, 56), border_radius=2)
+            pygame.draw.rect(surface, (180, 100, 0), (12, 12, 56, 56), border_radius=2)
             
             # Central core panel
-            pygame.draw.rect(self.image, dark_color, (20, 20, 40, 40))
+            pygame.draw.rect(surface, dark_color, (20, 20, 40, 40))
             
             # Energy core (large glowing center)
-            pygame.draw.rect(self.image, (255, 255, 0), (32, 32, 16, 16))
-            pygame.draw.rect(self.image, (255, 255, 200), (36, 36, 8, 8))
+            pygame.draw.rect(surface, (255, 255, 0), (32, 32, 16, 16))
+            pygame.draw.rect(surface, (255, 255, 200), (36, 36, 8, 8))
             
             # Four corner armor panels
             panel_size = 12
-            pygame.draw.rect(self.image, (200, 120, 0), (8, 8, panel_size, panel_size))     # Top-left
-            pygame.draw.rect(self.image, (200, 120, 0), (60, 8, panel_size, panel_size))    # Top-right
-            pygame.draw.rect(self.image, (200, 120, 0), (8, 60, panel_size, panel_size))    # Bottom-left
-            pygame.draw.rect(self.image, (200, 120, 0), (60, 60, panel_size, panel_size))   # Bottom-right
+            pygame.draw.rect(surface, (200, 120, 0), (8, 8, panel_size, panel_size))     # Top-left
+            pygame.draw.rect(surface, (200, 120, 0), (60, 8, panel_size, panel_size))    # Top-right
+            pygame.draw.rect(surface, (200, 120, 0), (8, 60, panel_size, panel_size))    # Bottom-left
+            pygame.draw.rect(surface, (200, 120, 0), (60, 60, panel_size, panel_size))   # Bottom-right
             
             # Corner lights (red warning lights)
-            pygame.draw.circle(self.image, (255, 0, 0), (14, 14), 3)
-            pygame.draw.circle(self.image, (255, 0, 0), (66, 14), 3)
-            pygame.draw.circle(self.image, (255, 0, 0), (14, 66), 3)
-            pygame.draw.circle(self.image, (255, 0, 0), (66, 66), 3)
+            pygame.draw.circle(surface, (255, 0, 0), (14, 14), 3)
+            pygame.draw.circle(surface, (255, 0, 0), (66, 14), 3)
+            pygame.draw.circle(surface, (255, 0, 0), (14, 66), 3)
+            pygame.draw.circle(surface, (255, 0, 0), (66, 66), 3)
             
             # Side panels (armor plates)
-            pygame.draw.rect(self.image, (220, 130, 10), (8, 34, 8, 12))   # Left
-            pygame.draw.rect(self.image, (220, 130, 10), (64, 34, 8, 12))  # Right
-            pygame.draw.rect(self.image, (220, 130, 10), (34, 8, 12, 8))   # Top
-            pygame.draw.rect(self.image, (220, 130, 10), (34, 64, 12, 8))  # Bottom
+            pygame.draw.rect(surface, (220, 130, 10), (8, 34, 8, 12))   # Left
+            pygame.draw.rect(surface, (220, 130, 10), (64, 34, 8, 12))  # Right
+            pygame.draw.rect(surface, (220, 130, 10), (34, 8, 12, 8))   # Top
+            pygame.draw.rect(surface, (220, 130, 10), (34, 64, 12, 8))  # Bottom
             
             # Highlights and edges
-            pygame.draw.rect(self.image, accent_color, (6, 6, 68, 68), width=2, border_radius=3)
-            pygame.draw.rect(self.image, (255, 180, 50), (12, 12, 56, 56), width=1, border_radius=2)
+            pygame.draw.rect(surface, accent_color, (6, 6, 68, 68), width=2, border_radius=3)
+            pygame.draw.rect(surface, (255, 180, 50), (12, 12, 56, 56), width=1, border_radius=2)
             
             # Crosshair pattern (menacing look)
-            pygame.draw.line(self.image, (255, 100, 0), (40, 20), (40, 32), 2)  # Top vertical
-            pygame.draw.line(self.image, (255, 100, 0), (40, 48), (40, 60), 2)  # Bottom vertical
-            pygame.draw.line(self.image, (255, 100, 0), (20, 40), (32, 40), 2)  # Left horizontal
-            pygame.draw.line(self.image, (255, 100, 0), (48, 40), (60, 40), 2)  # Right horizontal
+            pygame.draw.line(surface, (255, 100, 0), (40, 20), (40, 32), 2)  # Top vertical
+            pygame.draw.line(surface, (255, 100, 0), (40, 48), (40, 60), 2)  # Bottom vertical
+            pygame.draw.line(surface, (255, 100, 0), (20, 40), (32, 40), 2)  # Left horizontal
+            pygame.draw.line(surface, (255, 100, 0), (48, 40), (60, 40), 2)  # Right horizontal
     
     def update(self, player_pos):
         """Move square enemy toward player slowly"""
-        # Update hit flash effect
-        if self.hit_flash > 0:
-            self.hit_flash -= 1
-            self.draw_square_enemy()  # Redraw with flash effect
-        
         # Calculate direction to player
         dx = player_pos[0] - self.rect.centerx
         dy = player_pos[1] - self.rect.centery
@@ -664,6 +777,15 @@ class SquareEnemy(pygame.sprite.Sprite):
             self.rect.x += dx * self.speed
             self.rect.y += dy * self.speed
         
+        self.update_timers()
+    
+    def update_timers(self):
+        """Advance hit flash and shoot cooldown (movement may be batched separately)"""
+        # Update hit flash effect
+        if self.hit_flash > 0:
+            self.hit_flash -= 1
+            self.image = self.frames[self.hit_flash]  # Swap to the matching shared frame
+        
         # Update shoot cooldown
         if self.shoot_cooldown > 0:
             self.shoot_cooldown -= 1
@@ -689,14 +811,15 @@ class SquareEnemy(pygame.sprite.Sprite):
             dy = dy / distance * bullet_speed
             
             # Reset cooldown from config
-            self.shoot_cooldown = random.randint(
+            self.shoot_cooldown = self.rules.randint(
                 config.get('enemy_square', 'shoot_cooldown_min'),
                 config.get('enemy_square', 'shoot_cooldown_max')
             )
             
             # Create heavy bullet with damage parameter
-            bullet = Bullet(self.rect.centerx, self.rect.centery, dx, dy, 
-                          (255, 150, 0), is_enemy=True, damage=self.bullet_damage)
+            bullet = bullet_pool.acquire(self.rect.centerx, self.rect.centery, dx, dy, 
+                          (255, 150, 0), is_enemy=True, damage=self.bullet_damage,
+                         headless=self.headless)
             return bullet
         
         return None
@@ -707,7 +830,7 @@ class SquareEnemy(pygame.sprite.Sprite):
         
         # Trigger hit flash effect
         self.hit_flash = self.hit_flash_duration
-        self.draw_square_enemy()  # Redraw immediately with flash
+        self.image = self.frames[self.hit_flash]  # Show the flash frame immediately
         
         if self.health <= 0:
             self.kill()
@@ -715,85 +838,114 @@ class SquareEnemy(pygame.sprite.Sprite):
         return False
 
 
-class Bullet(pygame.sprite.Sprite):
+class Bullet(PooledSprite, StoredSprite, MovingSprite, pygame.sprite.Sprite):
     """Bullet class"""
     
-    def __init__(self, x, y, speed_x, speed_y, color=(255, 255, 0), is_enemy=False, damage=1):
+    # Pre-rendered bullet images keyed by (is_enemy, damage, headless) - the only inputs to their look
+    _image_cache = {}
+    
+    def __init__(self, x, y, speed_x, speed_y, color=(255, 255, 0), is_enemy=False, damage=1, headless=False):
         super().__init__()
-        
+        self.reset(x, y, speed_x, speed_y, color, is_enemy, damage, headless)
+    
+    def reset(self, x, y, speed_x, speed_y, color=(255, 255, 0), is_enemy=False, damage=1, headless=False):
+        """Initialize bullet state - also used to recycle pooled bullets"""
         self.damage = damage  # Damage amount
         self.is_enemy = is_enemy
         
-        # Heavy bullets are larger and more visible
-        size = 18 if damage > 1 else 12
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        self.draw_bullet(color, is_enemy, damage)
+        # Bullets with the same look share one pre-rendered image
+        self.image = Bullet.get_image(is_enemy, damage, headless)
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
         
         self.speed_x = speed_x
         self.speed_y = speed_y
+        self.last_move = (speed_x, speed_y)  # Bullets fly at a constant velocity
     
-    def draw_bullet(self, color, is_enemy, damage=1):
+    @classmethod
+    def get_image(cls, is_enemy, damage=1, headless=False):
+        """Return the shared image for a bullet look, rendering it on first use
+        
+        Bullet colors are fixed per kind (player, enemy, heavy), so the color
+        passed to the constructor does not change the image.
+        """
+        key = (is_enemy, damage, headless)
+        image = cls._image_cache.get(key)
+        if image is None:
+            # Heavy bullets are larger and more visible
+            size = 18 if damage > 1 else 12
+            if headless:
+                image = placeholder_image((size, size))
+            else:
+                image = pygame.Surface((size, size), pygame.SRCALPHA)
+                cls.draw_bullet(image, None, is_enemy, damage)
+                image = convert_for_display(image)
+            cls._image_cache[key] = image
+        return image
+    
+    @staticmethod
+    def draw_bullet(surface, color, is_enemy, damage=1):
         """Draw bullet in retro space game style - simple with clean glow
         Heavy bullets (damage > 1) are larger and more menacing
+        
+        color is ignored: each kind of bullet has its own fixed palette.
         """
         # Clear surface
-        self.image.fill((0, 0, 0, 0))
+        surface.fill((0, 0, 0, 0))
         
         if damage > 1:
             # Heavy bullet - larger and more menacing
             center = (9, 9)
             
             # Pulsing outer glow (larger radius)
-            pygame.draw.circle(self.image, (255, 80, 0, 60), center, 9)
-            pygame.draw.circle(self.image, (255, 60, 0, 100), center, 8)
-            pygame.draw.circle(self.image, (255, 40, 0, 140), center, 7)
+            pygame.draw.circle(surface, (255, 80, 0, 60), center, 9)
+            pygame.draw.circle(surface, (255, 60, 0, 100), center, 8)
+            pygame.draw.circle(surface, (255, 40, 0, 140), center, 7)
             
             # Main body - menacing orange-red
-            pygame.draw.circle(self.image, (255, 60, 0), center, 6)
+            pygame.draw.circle(surface, (255, 60, 0), center, 6)
             
             # Middle layer - bright warning color
-            pygame.draw.circle(self.image, (255, 120, 0), center, 4)
+            pygame.draw.circle(surface, (255, 120, 0), center, 4)
             
             # Inner core - intense yellow
-            pygame.draw.circle(self.image, (255, 200, 50), center, 3)
+            pygame.draw.circle(surface, (255, 200, 50), center, 3)
             
             # Center highlight - white hot
-            pygame.draw.circle(self.image, (255, 255, 200), center, 2)
-            pygame.draw.circle(self.image, (255, 255, 255), center, 1)
+            pygame.draw.circle(surface, (255, 255, 200), center, 2)
+            pygame.draw.circle(surface, (255, 255, 255), center, 1)
             
         elif is_enemy:
             # Normal enemy bullet - red/orange retro style
             center = (6, 6)
             # Outer glow ring
-            pygame.draw.circle(self.image, (255, 100, 0, 80), center, 6)
-            pygame.draw.circle(self.image, (255, 50, 0, 120), center, 5)
+            pygame.draw.circle(surface, (255, 100, 0, 80), center, 6)
+            pygame.draw.circle(surface, (255, 50, 0, 120), center, 5)
             
             # Main body - solid red
-            pygame.draw.circle(self.image, (255, 30, 30), center, 4)
+            pygame.draw.circle(surface, (255, 30, 30), center, 4)
             
             # Inner bright core
-            pygame.draw.circle(self.image, (255, 150, 100), center, 2)
+            pygame.draw.circle(surface, (255, 150, 100), center, 2)
             
             # Center pixel highlight
-            pygame.draw.circle(self.image, (255, 255, 200), center, 1)
+            pygame.draw.circle(surface, (255, 255, 200), center, 1)
             
         else:
             # Player bullet - cyan/white retro style
             center = (6, 6)
             # Outer glow ring
-            pygame.draw.circle(self.image, (0, 255, 255, 100), center, 6)
-            pygame.draw.circle(self.image, (100, 255, 255, 150), center, 5)
+            pygame.draw.circle(surface, (0, 255, 255, 100), center, 6)
+            pygame.draw.circle(surface, (100, 255, 255, 150), center, 5)
             
             # Main body - bright cyan
-            pygame.draw.circle(self.image, (100, 255, 255), center, 4)
+            pygame.draw.circle(surface, (100, 255, 255), center, 4)
             
             # Inner bright core
-            pygame.draw.circle(self.image, (200, 255, 255), center, 2)
+            pygame.draw.circle(surface, (200, 255, 255), center, 2)
             
             # Center pixel highlight (pure white)
-            pygame.draw.circle(self.image, (255, 255, 255), center, 1)
+            pygame.draw.circle(surface, (255, 255, 255), center, 1)
         
     def update(self, screen_width, screen_height):
         """Move bullet"""
@@ -809,12 +961,17 @@ class Bullet(pygame.sprite.Sprite):
 class HealthPack(pygame.sprite.Sprite):
     """Health pack pickup - restores 1 health"""
     
-    def __init__(self, x, y):
+    SIZE = (24, 24)
+    
+    # Pulse frames shared by all health packs: [normal, pulse], per headless mode
+    _frames = {}
+    
+    def __init__(self, x, y, headless=False):
         super().__init__()
         
-        # Create health pack surface
-        self.image = pygame.Surface((24, 24), pygame.SRCALPHA)
-        self.draw_health_pack()
+        # Use the shared pre-rendered frames instead of a private surface
+        self.frames = self.get_frames(headless)
+        self.image = self.frames[0]
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
         
@@ -833,33 +990,46 @@ class HealthPack(pygame.sprite.Sprite):
         self.pulse_timer = 0
         self.pulse_interval = config.get('health_pack', 'pulse_interval')
     
-    def draw_health_pack(self):
+    @classmethod
+    def get_frames(cls, headless=False):
+        """Return the shared normal and pulse frames, rendering them on first use"""
+        frames = cls._frames.get(headless)
+        if frames is None:
+            frames = [
+                render_frame(cls.SIZE, cls.draw_health_pack, headless=headless),
+                render_frame(cls.SIZE, cls.draw_health_pack_pulse, headless=headless)
+            ]
+            cls._frames[headless] = frames
+        return frames
+    
+    @staticmethod
+    def draw_health_pack(surface):
         """Draw health pack in retro style - medical cross"""
         # Clear surface
-        self.image.fill((0, 0, 0, 0))
+        surface.fill((0, 0, 0, 0))
         
         center = (12, 12)
         
         # Outer glow (green)
         for i in range(3, 0, -1):
             alpha = 60 * (i / 3.0)
-            pygame.draw.circle(self.image, (0, 255, 0, int(alpha)), center, 12 + i*2)
+            pygame.draw.circle(surface, (0, 255, 0, int(alpha)), center, 12 + i*2)
         
         # Main circle background (white)
-        pygame.draw.circle(self.image, (255, 255, 255), center, 10)
+        pygame.draw.circle(surface, (255, 255, 255), center, 10)
         
         # Red cross (medical symbol)
         # Horizontal bar
-        pygame.draw.rect(self.image, (255, 0, 0), (6, 10, 12, 4))
+        pygame.draw.rect(surface, (255, 0, 0), (6, 10, 12, 4))
         # Vertical bar
-        pygame.draw.rect(self.image, (255, 0, 0), (10, 6, 4, 12))
+        pygame.draw.rect(surface, (255, 0, 0), (10, 6, 4, 12))
         
         # White highlights on cross
-        pygame.draw.rect(self.image, (255, 200, 200), (7, 11, 10, 1))
-        pygame.draw.rect(self.image, (255, 200, 200), (11, 7, 1, 10))
+        pygame.draw.rect(surface, (255, 200, 200), (7, 11, 10, 1))
+        pygame.draw.rect(surface, (255, 200, 200), (11, 7, 1, 10))
         
         # Outer circle border
-        pygame.draw.circle(self.image, (0, 200, 0), center, 10, width=2)
+        pygame.draw.circle(surface, (0, 200, 0), center, 10, width=2)
     
     def update(self, player_pos=None, player_powered_up=False):
         """Move health pack slowly downward and handle lifetime
@@ -891,51 +1061,57 @@ class HealthPack(pygame.sprite.Sprite):
         # Pulse animation using config interval
         half_interval = self.pulse_interval // 2
         if self.pulse_timer % self.pulse_interval < half_interval:
-            # Redraw with brighter glow during pulse
-            self.draw_health_pack_pulse()
+            # Brighter glow during pulse
+            self.image = self.frames[1]
         else:
-            self.draw_health_pack()
+            self.image = self.frames[0]
         
         # Remove if expired
         if self.lifetime <= 0:
             self.kill()
     
-    def draw_health_pack_pulse(self):
+    @staticmethod
+    def draw_health_pack_pulse(surface):
         """Draw health pack with enhanced glow during pulse"""
         # Clear surface
-        self.image.fill((0, 0, 0, 0))
+        surface.fill((0, 0, 0, 0))
         
         center = (12, 12)
         
         # Brighter outer glow during pulse
         for i in range(4, 0, -1):
             alpha = 80 * (i / 4.0)
-            pygame.draw.circle(self.image, (0, 255, 100, int(alpha)), center, 12 + i*3)
+            pygame.draw.circle(surface, (0, 255, 100, int(alpha)), center, 12 + i*3)
         
         # Main circle background (white)
-        pygame.draw.circle(self.image, (255, 255, 255), center, 10)
+        pygame.draw.circle(surface, (255, 255, 255), center, 10)
         
         # Red cross (medical symbol)
-        pygame.draw.rect(self.image, (255, 0, 0), (6, 10, 12, 4))
-        pygame.draw.rect(self.image, (255, 0, 0), (10, 6, 4, 12))
+        pygame.draw.rect(surface, (255, 0, 0), (6, 10, 12, 4))
+        pygame.draw.rect(surface, (255, 0, 0), (10, 6, 4, 12))
         
         # White highlights on cross
-        pygame.draw.rect(self.image, (255, 200, 200), (7, 11, 10, 1))
-        pygame.draw.rect(self.image, (255, 200, 200), (11, 7, 1, 10))
+        pygame.draw.rect(surface, (255, 200, 200), (7, 11, 10, 1))
+        pygame.draw.rect(surface, (255, 200, 200), (11, 7, 1, 10))
         
         # Brighter outer circle border
-        pygame.draw.circle(self.image, (100, 255, 100), center, 10, width=2)
+        pygame.draw.circle(surface, (100, 255, 100), center, 10, width=2)
 
 
 class PowerUp(pygame.sprite.Sprite):
     """Power-up item that gives player triple shot and increased fire rate"""
     
-    def __init__(self, x, y):
+    SIZE = (28, 28)
+    
+    # Pulse frames shared by all power-ups: [normal, pulse], per headless mode
+    _frames = {}
+    
+    def __init__(self, x, y, headless=False):
         super().__init__()
         
-        # Create powerup surface with transparency
-        self.image = pygame.Surface((28, 28), pygame.SRCALPHA)
-        self.draw_powerup()
+        # Use the shared pre-rendered frames instead of a private surface
+        self.frames = self.get_frames(headless)
+        self.image = self.frames[0]
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
         
@@ -954,17 +1130,30 @@ class PowerUp(pygame.sprite.Sprite):
         self.pulse_timer = 0
         self.pulse_interval = config.get('powerup', 'pulse_interval')
     
-    def draw_powerup(self):
+    @classmethod
+    def get_frames(cls, headless=False):
+        """Return the shared normal and pulse frames, rendering them on first use"""
+        frames = cls._frames.get(headless)
+        if frames is None:
+            frames = [
+                render_frame(cls.SIZE, cls.draw_powerup, headless=headless),
+                render_frame(cls.SIZE, cls.draw_powerup_pulse, headless=headless)
+            ]
+            cls._frames[headless] = frames
+        return frames
+    
+    @staticmethod
+    def draw_powerup(surface):
         """Draw power-up in retro style - lightning bolt / star"""
         # Clear surface
-        self.image.fill((0, 0, 0, 0))
+        surface.fill((0, 0, 0, 0))
         
         center = (14, 14)
         
         # Outer glow (golden/yellow)
         for i in range(3, 0, -1):
             alpha = 70 * (i / 3.0)
-            pygame.draw.circle(self.image, (255, 200, 0, int(alpha)), center, 14 + i*2)
+            pygame.draw.circle(surface, (255, 200, 0, int(alpha)), center, 14 + i*2)
         
         # Main star shape (8-pointed star for power-up)
         star_color = (255, 215, 0)  # Gold color
@@ -976,7 +1165,7 @@ class PowerUp(pygame.sprite.Sprite):
             (14, 24),  # Bottom
             (4, 14)    # Left
         ]
-        pygame.draw.polygon(self.image, star_color, diamond_points)
+        pygame.draw.polygon(surface, star_color, diamond_points)
         
         # Draw smaller diamond on top (rotated)
         small_diamond = [
@@ -985,20 +1174,20 @@ class PowerUp(pygame.sprite.Sprite):
             (14, 20),  # Bottom
             (8, 14)    # Left
         ]
-        pygame.draw.polygon(self.image, (255, 255, 100), small_diamond)
+        pygame.draw.polygon(surface, (255, 255, 100), small_diamond)
         
         # Center energy core (bright white)
-        pygame.draw.circle(self.image, (255, 255, 255), center, 4)
+        pygame.draw.circle(surface, (255, 255, 255), center, 4)
         
         # Add small accent points (4 corners)
         accent_color = (255, 150, 0)
-        pygame.draw.circle(self.image, accent_color, (14, 4), 2)
-        pygame.draw.circle(self.image, accent_color, (24, 14), 2)
-        pygame.draw.circle(self.image, accent_color, (14, 24), 2)
-        pygame.draw.circle(self.image, accent_color, (4, 14), 2)
+        pygame.draw.circle(surface, accent_color, (14, 4), 2)
+        pygame.draw.circle(surface, accent_color, (24, 14), 2)
+        pygame.draw.circle(surface, accent_color, (14, 24), 2)
+        pygame.draw.circle(surface, accent_color, (4, 14), 2)
         
         # Outer glow ring
-        pygame.draw.circle(self.image, (255, 200, 0), center, 12, width=2)
+        pygame.draw.circle(surface, (255, 200, 0), center, 12, width=2)
     
     def update(self):
         """Move power-up slowly downward and handle lifetime"""
@@ -1009,26 +1198,27 @@ class PowerUp(pygame.sprite.Sprite):
         # Pulse animation using config interval
         half_interval = self.pulse_interval // 2
         if self.pulse_timer % self.pulse_interval < half_interval:
-            # Redraw with brighter glow during pulse
-            self.draw_powerup_pulse()
+            # Brighter glow during pulse
+            self.image = self.frames[1]
         else:
-            self.draw_powerup()
+            self.image = self.frames[0]
         
         # Remove if expired
         if self.lifetime <= 0:
             self.kill()
     
-    def draw_powerup_pulse(self):
+    @staticmethod
+    def draw_powerup_pulse(surface):
         """Draw power-up with enhanced glow during pulse"""
         # Clear surface
-        self.image.fill((0, 0, 0, 0))
+        surface.fill((0, 0, 0, 0))
         
         center = (14, 14)
         
         # Brighter outer glow during pulse
         for i in range(4, 0, -1):
             alpha = 90 * (i / 4.0)
-            pygame.draw.circle(self.image, (255, 220, 0, int(alpha)), center, 14 + i*3)
+            pygame.draw.circle(surface, (255, 220, 0, int(alpha)), center, 14 + i*3)
         
         # Main star shape (8-pointed star)
         star_color = (255, 230, 0)  # Brighter gold
@@ -1040,7 +1230,7 @@ class PowerUp(pygame.sprite.Sprite):
             (14, 24),
             (4, 14)
         ]
-        pygame.draw.polygon(self.image, star_color, diamond_points)
+        pygame.draw.polygon(surface, star_color, diamond_points)
         
         # Draw smaller diamond
         small_diamond = [
@@ -1049,39 +1239,69 @@ class PowerUp(pygame.sprite.Sprite):
             (14, 20),
             (8, 14)
         ]
-        pygame.draw.polygon(self.image, (255, 255, 150), small_diamond)
+        pygame.draw.polygon(surface, (255, 255, 150), small_diamond)
         
         # Brighter center
-        pygame.draw.circle(self.image, (255, 255, 255), center, 5)
+        pygame.draw.circle(surface, (255, 255, 255), center, 5)
         
         # Brighter accent points
         accent_color = (255, 180, 0)
-        pygame.draw.circle(self.image, accent_color, (14, 4), 3)
-        pygame.draw.circle(self.image, accent_color, (24, 14), 3)
-        pygame.draw.circle(self.image, accent_color, (14, 24), 3)
-        pygame.draw.circle(self.image, accent_color, (4, 14), 3)
+        pygame.draw.circle(surface, accent_color, (14, 4), 3)
+        pygame.draw.circle(surface, accent_color, (24, 14), 3)
+        pygame.draw.circle(surface, accent_color, (14, 24), 3)
+        pygame.draw.circle(surface, accent_color, (4, 14), 3)
         
         # Brighter outer ring
-        pygame.draw.circle(self.image, (255, 230, 0), center, 12, width=2)
+        pygame.draw.circle(surface, (255, 230, 0), center, 12, width=2)
 
 
-class Particle(pygame.sprite.Sprite):
+class Particle(PooledSprite, MovingSprite, pygame.sprite.Sprite):
     """Particle for explosion effects"""
     
+    FADE_STEPS = 16  # Number of pre-baked alpha levels in a fade ramp
+    COLOR_BUCKET = 8  # Colors are rounded to multiples of this so similar particles share ramps
+    
+    # Pre-baked fade ramps keyed by (color bucket, size), ordered from transparent to opaque
+    _ramps = {}
+    
     def __init__(self, x, y, color, speed_x, speed_y, size, lifetime):
         super().__init__()
+        self.reset(x, y, color, speed_x, speed_y, size, lifetime)
+    
+    def reset(self, x, y, color, speed_x, speed_y, size, lifetime):
+        """Initialize particle state - also used to recycle pooled particles"""
         self.lifetime = lifetime
         self.age = 0
         self.speed_x = speed_x
         self.speed_y = speed_y
+        self.last_move = (0, 0)
         self.base_color = color
         self.size = size
         
-        # Create particle surface
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, color, (size // 2, size // 2), size // 2)
+        # Fading only swaps between shared frames of this ramp
+        self.ramp = Particle.get_ramp(color, size)
+        self.image = self.ramp[-1]
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
+    
+    @classmethod
+    def get_ramp(cls, color, size):
+        """Return the shared fade ramp for a particle look, rendering it on first use"""
+        bucket = tuple(min(255, round(c / cls.COLOR_BUCKET) * cls.COLOR_BUCKET) for c in color[:3])
+        key = (bucket, size)
+        ramp = cls._ramps.get(key)
+        if ramp is None:
+            ramp = [
+                render_frame((size, size), cls.draw_particle, (*bucket, 255 * step // cls.FADE_STEPS), size)
+                for step in range(cls.FADE_STEPS + 1)
+            ]
+            cls._ramps[key] = ramp
+        return ramp
+    
+    @staticmethod
+    def draw_particle(surface, color, size):
+        """Draw a round particle of the given RGBA color"""
+        pygame.draw.circle(surface, color, (size // 2, size // 2), size // 2)
         
     def update(self):
         """Update particle position and fade out"""
@@ -1090,6 +1310,7 @@ class Particle(pygame.sprite.Sprite):
         # Move particle
         self.rect.x += self.speed_x
         self.rect.y += self.speed_y
+        self.last_move = (self.speed_x, self.speed_y)
         
         # Apply gravity
         self.speed_y += 0.15
@@ -1097,12 +1318,14 @@ class Particle(pygame.sprite.Sprite):
         # Fade out
         if self.age > self.lifetime * 0.5:
             fade = 1.0 - (self.age - self.lifetime * 0.5) / (self.lifetime * 0.5)
-            alpha = int(255 * fade)
-            # Redraw with alpha
-            self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            color_with_alpha = (*self.base_color[:3], alpha)
-            pygame.draw.circle(self.image, color_with_alpha, (self.size // 2, self.size // 2), self.size // 2)
+            # Pick the nearest pre-baked alpha level instead of redrawing
+            self.image = self.ramp[max(0, int(fade * self.FADE_STEPS))]
         
         # Remove when lifetime expires
         if self.age >= self.lifetime:
             self.kill()
+
+
+# Pools recycling short-lived sprites, capped per type from config
+bullet_pool = ObjectPool(Bullet, config.get('pools', 'bullet'))
+particle_pool = ObjectPool(Particle, config.get('pools', 'particle'))
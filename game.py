@@ -5,8 +5,13 @@ A 2D shooting game built with Pygame
 
 import pygame
 import sys
+import time
+import argparse
+from config_loader import config
 from entities import Player, Enemy, Bullet
 from game_manager import GameManager
+from replay import InputRecorder, InputPlayer
+from profiler import profiler
 
 # Initialize Pygame
 pygame.init()
@@ -17,10 +22,30 @@ pygame.key.stop_text_input()
 # Constants
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
-FPS = 60
+FPS = config.get('game', 'fps')  # Simulation rate; every frame-based timer assumes it
+MAX_FPS = config.get('render', 'max_fps')  # Render rate cap, 0 to draw as fast as the display allows
+INTERPOLATE = config.get('render', 'interpolate')
+MAX_UPDATES_PER_FRAME = config.get('render', 'max_updates_per_frame')
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="ShootingGame")
+    parser.add_argument('--seed', type=int, help="Seed for every random roll, for reproducible sessions")
+    parser.add_argument('--record', metavar='FILE', help="Record the session's input to FILE")
+    parser.add_argument('--replay', metavar='FILE', help="Play back a session recorded with --record")
+    parser.add_argument('--profile-log', metavar='FILE',
+                        help="Log per-frame phase timings to FILE (.csv, otherwise JSON lines)")
+    args = parser.parse_args()
+    if args.record and args.replay:
+        parser.error("--record and --replay cannot be used together")
+    if args.seed is not None and not 0 <= args.seed < 2 ** 64:
+        parser.error("--seed must be between 0 and 2**64 - 1")  # Recordings store it as 64 bits
+    return args
 
 def main():
     """Main game function"""
+    args = parse_args()
+    
     # Set up display
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("ShootingGame")
@@ -29,27 +54,95 @@ def main():
     # Ensure text input is stopped (important for IME compatibility)
     pygame.key.stop_text_input()
     
+    # Replays run with the recorded seed and take their input from the recording
+    seed = args.seed
+    player_input = None
+    if args.replay:
+        player = InputPlayer(args.replay)
+        if player.fps != FPS:
+            print(f"Warning: {args.replay} was recorded at {player.fps} FPS, game.fps is {FPS}")
+        seed = player.seed
+        player_input = iter(player)
+    
     # Create game manager
-    game_manager = GameManager(screen, SCREEN_WIDTH, SCREEN_HEIGHT)
+    game_manager = GameManager(screen, SCREEN_WIDTH, SCREEN_HEIGHT, seed=seed)
+    
+    recorder = None
+    if args.record:
+        recorder = InputRecorder(args.record, game_manager.seed, FPS)
     
-    # Main game loop
+    if args.profile_log:
+        profiler.open_log(args.profile_log)
+        profiler.set_enabled(True)
+    
+    # Main game loop - the simulation advances in fixed steps of 1/FPS seconds,
+    # however long each rendered frame takes
+    step = 1.0 / FPS
+    accumulator = 0.0
+    previous_time = time.perf_counter()
     running = True
     while running:
         # Handle events
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                game_manager.handle_event(event)  # Profiler overlay, also during replays
+                continue
+            if player_input is not None:
+                continue  # Replayed input only
+            if recorder is not None:
+                recorder.record_event(event)
             game_manager.handle_event(event)
         
-        # Update game state
-        game_manager.update()
+        current_time = time.perf_counter()
+        accumulator += current_time - previous_time
+        previous_time = current_time
+        
+        # Update game state once per elapsed step; several steps run back to back
+        # after a slow frame, so rendering is skipped rather than the game slowing down
+        updates = 0
+        while accumulator >= step and updates < MAX_UPDATES_PER_FRAME:
+            if player_input is not None:
+                frame = next(player_input, None)
+                if frame is None:
+                    print("Replay finished")
+                    running = False
+                    break
+                keys, events = frame
+                for event in events:
+                    game_manager.handle_event(event)
+            else:
+                keys = pygame.key.get_pressed()
+                if recorder is not None:
+                    recorder.record_frame(keys)
+            with profiler.scope('update'):
+                game_manager.update(keys)
+            accumulator -= step
+            updates += 1
+        if accumulator >= step:
+            # Too far behind to catch up (window dragged, debugger paused) - drop the backlog
+            accumulator = 0.0
         
-        # Draw everything
-        game_manager.draw()
+        # Draw everything, blended between the last two steps when rendering faster than the simulation
+        with profiler.scope('draw'):
+            dirty_rects = game_manager.draw(accumulator / step if INTERPOLATE else 1.0)
         
-        # Update display
-        pygame.display.flip()
-        clock.tick(FPS)
+        # Update display - only the changed rects in dirty-rect mode
+        with profiler.scope('present'):
+            if dirty_rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty_rects)
+        
+        if profiler.enabled:
+            profiler.end_frame(game_manager.get_entity_counts())
+        clock.tick(MAX_FPS)
+    
+    if recorder is not None:
+        recorder.close()
+        print(f"Recorded {recorder.frames} frames to {args.record}")
+    profiler.close_log()
     
     pygame.quit()
     sys.exit()
@@ -3,55 +3,77 @@ Game Manager - Handles game states, scoring, and game logic
 """
 
 import pygame
-import random
-import time
 import math
-from entities import Player, Enemy, TriangleEnemy, SquareEnemy, Bullet, HealthPack, PowerUp, Particle
-from audio_manager import AudioManager
+import functools
+from entities import MovingSprite, Player, Enemy, TriangleEnemy, SquareEnemy, Bullet, HealthPack, PowerUp, Particle, particle_pool, convert_for_display
+from particle_system import ParticleSystem
+from sprite_store import BulletStore, EnemySwarm
+from spatial_hash import SpatialHash
+from starfield import Starfield
+from object_pool import ObjectPool, PooledSprite
+from text_cache import get_font, preload_fonts, TextLabel
+from audio_manager import AudioManager, SilentAudioManager
 from config_loader import config
+from rng import GameRandom
+from profiler import profiler
 
-class ScorePopup(pygame.sprite.Sprite):
+@functools.lru_cache(maxsize=64)
+def render_score_popup(points, is_powered):
+    """Render the finished image for a score popup
+
+    Cached by (points, is_powered), so repeated popups share one surface.
+    """
+    # Create text with outline for better visibility
+    font_size = 40 if is_powered else 30
+    font = get_font(font_size)
+    text = f"+{points}"
+    
+    if is_powered:
+        # Create a surface with glow effect for powered-up scores
+        text_color = (255, 215, 0)  # Gold
+        outline_color = (255, 165, 0)  # Orange outline
+        
+        # Render text with outline
+        text_surface = font.render(text, True, text_color)
+        outline_surface = font.render(text, True, outline_color)
+        
+        # Create image with padding for outline
+        padding = 4
+        image = pygame.Surface((text_surface.get_width() + padding * 2, 
+                                text_surface.get_height() + padding * 2), pygame.SRCALPHA)
+        
+        # Draw outline (4 directions)
+        image.blit(outline_surface, (padding - 2, padding))
+        image.blit(outline_surface, (padding + 2, padding))
+        image.blit(outline_surface, (padding, padding - 2))
+        image.blit(outline_surface, (padding, padding + 2))
+        
+        # Draw main text
+        image.blit(text_surface, (padding, padding))
+        return image
+    
+    # Normal score - simple white text
+    text_color = (255, 255, 255)
+    return font.render(text, True, text_color)
+
+
+class ScorePopup(PooledSprite, pygame.sprite.Sprite):
     """Floating score text that appears when enemy is destroyed"""
     
     def __init__(self, x, y, points, is_powered=False):
         super().__init__()
+        self.reset(x, y, points, is_powered)
+    
+    def reset(self, x, y, points, is_powered=False):
+        """Initialize popup state - also used to recycle pooled popups"""
         self.points = points
         self.lifetime = 60  # Show for 1 second at 60 FPS
         self.age = 0
         self.is_powered = is_powered
         
-        # Create text with outline for better visibility
-        font_size = 40 if is_powered else 30
-        font = pygame.font.Font(None, font_size)
-        text = f"+{points}"
-        
-        if is_powered:
-            # Create a surface with glow effect for powered-up scores
-            text_color = (255, 215, 0)  # Gold
-            outline_color = (255, 165, 0)  # Orange outline
-            
-            # Render text with outline
-            text_surface = font.render(text, True, text_color)
-            outline_surface = font.render(text, True, outline_color)
-            
-            # Create image with padding for outline
-            padding = 4
-            self.image = pygame.Surface((text_surface.get_width() + padding * 2, 
-                                        text_surface.get_height() + padding * 2), pygame.SRCALPHA)
-            
-            # Draw outline (4 directions)
-            self.image.blit(outline_surface, (padding - 2, padding))
-            self.image.blit(outline_surface, (padding + 2, padding))
-            self.image.blit(outline_surface, (padding, padding - 2))
-            self.image.blit(outline_surface, (padding, padding + 2))
-            
-            # Draw main text
-            self.image.blit(text_surface, (padding, padding))
-        else:
-            # Normal score - simple white text
-            text_color = (255, 255, 255)
-            self.image = font.render(text, True, text_color)
-        
+        # The image is shared, so fading is applied as alpha at blit time
+        self.image = render_score_popup(points, is_powered)
+        self.alpha = 255
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
         
@@ -69,12 +91,31 @@ class ScorePopup(pygame.sprite.Sprite):
         # Fade out effect by adjusting alpha
         if self.age > self.lifetime * 0.5:
             fade = 1.0 - (self.age - self.lifetime * 0.5) / (self.lifetime * 0.5)
-            self.image.set_alpha(int(255 * fade))
+            self.alpha = int(255 * fade)
         
         # Remove when lifetime expires
         if self.age >= self.lifetime:
             self.kill()
 
+
+# Pool recycling score popups, capped from config
+score_popup_pool = ObjectPool(ScorePopup, config.get('pools', 'score_popup'))
+
+
+class KeyState:
+    """Injected keyboard state, indexed by key code like pygame.key.get_pressed()"""
+    
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+    
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+# Keyboard state with nothing held, the default input of headless runs
+NO_KEYS = KeyState()
+
+
 class GameManager:
     """Manages game state and logic"""
     
@@ -83,10 +124,43 @@ class GameManager:
     PLAYING = 1
     GAME_OVER = 2
     
-    def __init__(self, screen, screen_width, screen_height):
+    # Energy bar composite cache
+    ENERGY_BAR_PAD = 20  # Room around the bar for the full-energy glow
+    ENERGY_PULSE_PHASES = 20  # Pulse steps of the full bar; most saturate to the same gold
+    ENERGY_BAR_CACHE_SIZE = 16
+    
+    # Power-up badge backgrounds kept, keyed by size and pulse alpha
+    POWERUP_BADGE_CACHE_SIZE = 64
+    
+    # Height of the top HUD band redrawn every frame in dirty-rect mode,
+    # including the power-up timer and energy prompt below the panel
+    HUD_HEIGHT = 140
+    
+    # Pulse brightness levels of the pre-rendered enemy warning arrows
+    WARNING_PULSE_LEVELS = 16
+    
+    # Frames between re-renders of the profiler overlay text
+    PROFILER_REFRESH_FRAMES = 15
+    
+    def __init__(self, screen, screen_width, screen_height, headless=False, seed=None):
+        """Create the game
+        
+        Args:
+            screen: Display surface to draw on, None when headless
+            screen_width, screen_height: Size of the play field
+            headless: Run the game rules only - no drawing, no audio and no sprite images
+            seed: Session seed; game n is played with seed + n, so a session
+                with the same seed and input plays out identically. Random if None
+        """
         self.screen = screen
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.headless = headless
+        
+        # This game's own random streams, seeded before anything draws from them
+        self.rng = GameRandom(seed)
+        self.seed = self.rng.current_seed
+        self.games_started = 0
         
         self.state = self.MENU
         self.score = 0
@@ -99,7 +173,27 @@ class GameManager:
         self.enemy_bullets = pygame.sprite.Group()
         self.health_packs = pygame.sprite.Group()
         self.score_popups = pygame.sprite.Group()  # Floating score text
-        self.particles = pygame.sprite.Group()  # Particle effects
+        self.particles = pygame.sprite.Group()  # Particle effects (sprite fallback)
+        
+        # Vectorized particle engine - replaces per-particle sprites when enabled
+        self.particle_system = None
+        if config.get('particles', 'vectorized'):
+            self.particle_system = ParticleSystem(config.get('particles', 'max_particles'), seed=self.rng.effects_np)
+        
+        # Array-backed bullet movement - replaces per-bullet updates when enabled
+        self.bullet_store = None
+        if config.get('bullets', 'array_store'):
+            self.bullet_store = BulletStore(config.get('bullets', 'initial_capacity'))
+        
+        # Batched enemy homing with sub-pixel positions - replaces per-enemy movement when enabled
+        self.enemy_swarm = None
+        if config.get('enemies', 'batched_movement'):
+            self.enemy_swarm = EnemySwarm(config.get('enemies', 'initial_capacity'))
+        
+        # Spatial hash broadphase for enemy collisions - replaces linear scans when enabled
+        self.enemy_grid = None
+        if config.get('collision', 'spatial_hash'):
+            self.enemy_grid = SpatialHash(screen_width, config.get('collision', 'grid_columns'))
         
         # Player
         self.player = None
@@ -127,35 +221,108 @@ class GameManager:
         self.difficulty_flash = 0  # Flash effect counter
         self.max_difficulty_level = config.get('difficulty', 'max_level')
         
-        # Game time
-        self.game_start_time = 0
+        # Game time, counted in simulated frames so it always agrees with frame-based timers
         self.game_time = 0
-        
-        # Fonts
-        self.font = pygame.font.Font(None, 36)
-        self.large_font = pygame.font.Font(None, 72)
+        self.frames_played = 0
+        
+        # Fraction of a simulation step elapsed since the last update, for interpolated drawing
+        self.render_alpha = 1.0
+        
+        # Fonts and text labels - only drawing uses them, so headless games leave
+        # them unset and run without pygame.font initialized
+        self.font = None
+        self.large_font = None
+        self.stage_warning_label = None
+        self.score_label = None
+        self.time_label = None
+        self.stage_label = None
+        self.powerup_label = None
+        if not headless:
+            self.create_text_labels()
+            
+            # Load popup fonts and render the common popups now to avoid a first-kill hitch
+            preload_fonts(30, 40)
+            self.prerender_score_popups()
         
         # Audio manager
-        self.audio = AudioManager()
+        self.audio = SilentAudioManager() if headless else AudioManager()
         # Don't play music in __init__, wait until game starts
         
         # Create starfield background from config
-        self.stars = self.create_starfield()
+        self.starfield = Starfield(config.get('game', 'star_count'), screen_width, screen_height, seed=self.rng.effects_np)
         
         # Create nebula layers for background
         self.nebula_layers = self.create_nebula_layers()
         
+        # Pre-rendered nebula textures for the current palette, rebuilt when the palette changes
+        self.nebula_palette = None
+        self.nebula_textures = []
+        
+        # Pre-rendered HUD panels, rebuilt when the screen size changes
+        self.ui_panel_size = None
+        self.ui_panels = None
+        
+        # Pre-rendered low health vignette, rebuilt when the screen size changes
+        self.low_health_vignette_size = None
+        self.low_health_vignette = None
+        self.low_health_blits = []
+        
+        # Warning arrow settings, and arrow sprites keyed by (direction, pulse level)
+        self.warning_arrow_size = config.get('warning', 'arrow_size')
+        self.warning_arrow_distance = config.get('warning', 'arrow_distance')
+        self.warning_pulse_speed = config.get('warning', 'pulse_speed')
+        self.warning_color = config.get('warning', 'warning_color')
+        self.warning_arrows = {}
+        
+        # Pre-rendered health hearts, rebuilt when health changes
+        self.health_row_key = None
+        self.health_row = None
+        
+        # Border overlay pieces, built on first use
+        self.danger_pieces = None
+        self.danger_border_color = None
+        self.flash_pieces = None
+        
+        # Energy bar composites keyed by fill width, color and pulse phase
+        self.energy_bar_cache = {}
+        self.energy_ready_text = None
+        
+        self.powerup_badges = {}
+        
+        # Dirty-rect rendering - only changed rects are presented over a cached background
+        self.dirty_rects_enabled = config.get('render', 'dirty_rects')
+        self.background_refresh_frames = config.get('render', 'background_refresh_frames')
+        self.background = None
+        self.background_key = None
+        self.background_age = 0
+        self.dirty_rects = None  # Rects drawn last frame, None after a full-screen frame
+        
+        # Profiler overlay (F3) - rolling ms per timing scope and entity counts
+        self.show_profiler = False
+        self.profiler_overlay = None
+        self.profiler_overlay_age = 0
+        
     def reset_game(self):
         """Reset game for new playthrough"""
+        # Every game rolls from its own seed, derived from the session seed
+        self.rng.seed(self.seed + self.games_started)
+        self.games_started += 1
+        
         self.all_sprites.empty()
         self.enemies.empty()
         self.player_bullets.empty()
         self.enemy_bullets.empty()
         self.health_packs.empty()
         self.score_popups.empty()
+        if self.particle_system is not None:
+            self.particle_system.clear()
+        if self.bullet_store is not None:
+            self.bullet_store.clear()
+        if self.enemy_swarm is not None:
+            self.enemy_swarm.clear()
         
         self.player = Player(self.screen_width // 2, self.screen_height // 2, 
-                            self.screen_width, self.screen_height)
+                            self.screen_width, self.screen_height, headless=self.headless)
         self.all_sprites.add(self.player)
         
         self.score = 0
@@ -166,36 +333,33 @@ class GameManager:
         self.difficulty_level = 0
         self.difficulty_flash = 0
         self.enemy_spawn_delay = self.base_spawn_delay
-        self.game_start_time = time.time()
         self.game_time = 0
+        self.frames_played = 0
         self.state = self.PLAYING
         
         # Restart background music from the beginning
         self.audio.restart_music()
     
-    def create_starfield(self):
-        """Create a starfield background with multiple star types"""
-        stars = []
-        star_count = config.get('game', 'star_count')
-        for _ in range(star_count):
-            x = random.randint(0, self.screen_width)
-            y = random.randint(0, self.screen_height)
-            size = random.choice([1, 1, 1, 2, 2, 3])  # More small stars
-            brightness = random.randint(150, 255)
-            speed = random.uniform(0.1, 0.8) * (size * 0.5)  # Bigger stars move slightly faster
-            # Add twinkling effect
-            twinkle_speed = random.uniform(0.02, 0.05)
-            twinkle_offset = random.uniform(0, 6.28)  # Random phase
-            stars.append({
-                'x': x, 
-                'y': y, 
-                'size': size, 
-                'brightness': brightness, 
-                'speed': speed,
-                'twinkle_speed': twinkle_speed,
-                'twinkle_offset': twinkle_offset
-            })
-        return stars
+    def create_text_labels(self):
+        """Load the menu fonts and create the labels drawn over the game"""
+        self.font = get_font(36)
+        self.large_font = get_font(72)
+        self.stage_warning_label = TextLabel(48, (255, 200, 0), shadow_color=None)
+        
+        # HUD labels, re-rendered only when the text they show changes
+        self.score_label = TextLabel(36, (255, 255, 255))
+        self.time_label = TextLabel(36, (200, 200, 255))
+        self.stage_label = TextLabel(28, (255, 200, 100))  # Smaller font (was 36)
+        self.powerup_label = TextLabel(36, (255, 215, 0), shadow_color=None)
+    
+    def prerender_score_popups(self):
+        """Render the score popups every kill and bonus can produce"""
+        score_multiplier = config.get('powerup', 'score_multiplier')
+        for enemy_key in ('enemy_circle', 'enemy_triangle', 'enemy_square'):
+            points = config.get(enemy_key, 'points')
+            render_score_popup(points, False)
+            render_score_popup(points * score_multiplier, True)
+        render_score_popup(config.get('health_pack', 'full_health_bonus_score'), False)
     
     def create_nebula_layers(self):
         """Create nebula background layers for depth"""
@@ -204,8 +368,8 @@ class GameManager:
         
         for i in range(num_layers):
             layer = {
-                'offset_x': random.uniform(0, 100),
-                'offset_y': random.uniform(0, 100),
+                'offset_x': self.rng.effects.uniform(0, 100),
+                'offset_y': self.rng.effects.uniform(0, 100),
                 'speed': 0.05 * (i + 1),  # Each layer moves at different speed
                 'scale': 150 + i * 50,
                 'alpha': 20 + i * 10
@@ -215,98 +379,98 @@ class GameManager:
     
     def update_starfield(self):
         """Update starfield animation with parallax scrolling"""
-        for star in self.stars:
-            star['y'] += star['speed']
-            if star['y'] > self.screen_height:
-                star['y'] = 0
-                star['x'] = random.randint(0, self.screen_width)
+        self.starfield.update()
         
-        # Update nebula layers
+        # Update nebula layers (textures tile vertically, so wrap at screen height)
         for layer in self.nebula_layers:
             layer['offset_y'] += layer['speed']
-            if layer['offset_y'] > 200:
-                layer['offset_y'] = 0
+            if layer['offset_y'] >= self.screen_height:
+                layer['offset_y'] -= self.screen_height
     
     def draw_starfield(self):
         """Draw animated starfield with twinkling stars"""
-        for star in self.stars:
-            # Twinkling effect using sine wave
-            twinkle = math.sin(self.game_time * star['twinkle_speed'] + star['twinkle_offset'])
-            brightness = int(star['brightness'] + twinkle * 30)
-            brightness = max(100, min(255, brightness))
-            
-            color = (brightness, brightness, brightness)
-            pygame.draw.circle(self.screen, color, (int(star['x']), int(star['y'])), star['size'])
+        self.starfield.draw(self.screen, self.game_time)
     
-    def draw_nebula(self):
-        """Draw nebula background layers"""
-        for i, layer in enumerate(self.nebula_layers):
-            nebula_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-            
-            # Color shifts based on difficulty
-            if self.difficulty_level <= 2:
-                # Blue-purple nebula for early stages
-                base_color = (20, 10, 60)
-            elif self.difficulty_level <= 4:
-                # Purple-red nebula for mid stages
-                base_color = (40, 10, 40)
-            else:
-                # Red nebula for hell stages
-                base_color = (50, 10, 20)
+    def get_nebula_palette(self):
+        """Return the nebula base color for the current difficulty"""
+        if self.difficulty_level <= 2:
+            # Blue-purple nebula for early stages
+            return (20, 10, 60)
+        elif self.difficulty_level <= 4:
+            # Purple-red nebula for mid stages
+            return (40, 10, 40)
+        else:
+            # Red nebula for hell stages
+            return (50, 10, 20)
+    
+    def render_nebula_textures(self, base_color):
+        """Render one vertically tileable texture per nebula layer"""
+        textures = []
+        for layer in self.nebula_layers:
+            texture = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
             
             # Draw multiple nebula clouds
             for j in range(3):
                 x = (self.screen_width // 3 * j + layer['offset_x']) % self.screen_width
-                y = (layer['offset_y'] + j * 150) % self.screen_height
+                y = (j * 150) % self.screen_height
                 
-                for radius in range(layer['scale'], 0, -20):
-                    alpha = int(layer['alpha'] * (radius / layer['scale']))
-                    color = (*base_color, alpha)
-                    pygame.draw.circle(nebula_surface, color, (int(x), int(y)), radius)
+                # Repeat clouds across the top and bottom edges so the texture wraps seamlessly
+                for wrap_y in (y - self.screen_height, y, y + self.screen_height):
+                    if wrap_y + layer['scale'] < 0 or wrap_y - layer['scale'] > self.screen_height:
+                        continue
+                    for radius in range(layer['scale'], 0, -20):
+                        alpha = int(layer['alpha'] * (radius / layer['scale']))
+                        color = (*base_color, alpha)
+                        pygame.draw.circle(texture, color, (int(x), int(wrap_y)), radius)
             
-            self.screen.blit(nebula_surface, (0, 0))
+            textures.append(convert_for_display(texture))
+        return textures
+    
+    def draw_nebula(self):
+        """Draw nebula background layers by scrolling their cached textures"""
+        # Color shifts based on difficulty - only re-render when the palette changes
+        palette = self.get_nebula_palette()
+        if palette != self.nebula_palette:
+            self.nebula_textures = self.render_nebula_textures(palette)
+            self.nebula_palette = palette
+        
+        for layer, texture in zip(self.nebula_layers, self.nebula_textures):
+            scroll = int(layer['offset_y']) % self.screen_height
+            self.screen.blit(texture, (0, scroll))
+            self.screen.blit(texture, (0, scroll - self.screen_height))
     
     def draw_difficulty_warning(self):
         """Draw flashing warning effect when difficulty increases"""
         # Pulsing effect
         alpha = int(255 * (self.difficulty_flash / 60.0))
         
-        # Create a surface for the warning effect
-        warning_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        
-        # Draw flashing border (thick red outline)
+        # Flashing border (thick red outline) and corner highlights, built once
         border_width = 8
-        flash_intensity = int(255 * (self.difficulty_flash / 60.0))
-        border_color = (255, flash_intensity // 2, 0, alpha)
-        
-        # Top border
-        pygame.draw.rect(warning_surface, border_color, (0, 0, self.screen_width, border_width))
-        # Bottom border
-        pygame.draw.rect(warning_surface, border_color, (0, self.screen_height - border_width, self.screen_width, border_width))
-        # Left border
-        pygame.draw.rect(warning_surface, border_color, (0, 0, border_width, self.screen_height))
-        # Right border
-        pygame.draw.rect(warning_surface, border_color, (self.screen_width - border_width, 0, border_width, self.screen_height))
-        
-        # Corner highlights (extra bright)
         corner_size = 30
-        corner_color = (255, 200, 0, min(255, alpha + 50))
-        pygame.draw.rect(warning_surface, corner_color, (0, 0, corner_size, corner_size))
-        pygame.draw.rect(warning_surface, corner_color, (self.screen_width - corner_size, 0, corner_size, corner_size))
-        pygame.draw.rect(warning_surface, corner_color, (0, self.screen_height - corner_size, corner_size, corner_size))
-        pygame.draw.rect(warning_surface, corner_color, (self.screen_width - corner_size, self.screen_height - corner_size, corner_size, corner_size))
+        if self.flash_pieces is None:
+            self.flash_pieces = self.build_edge_pieces(border_width, corner_size)
+            for surface, _ in self.flash_pieces[1]:
+                surface.fill((255, 200, 0))  # Corner highlights (extra bright)
+        edges, corners = self.flash_pieces
         
-        self.screen.blit(warning_surface, (0, 0))
+        flash_intensity = int(255 * (self.difficulty_flash / 60.0))
+        border_color = (255, flash_intensity // 2, 0)
+        for surface, _ in edges:
+            surface.fill(border_color)
+            surface.set_alpha(alpha)
+        for surface, _ in corners:
+            surface.set_alpha(min(255, alpha + 50))
+        self.screen.blits(edges, doreturn=False)
+        self.screen.blits(corners, doreturn=False)
         
         # Display stage name text
         if self.difficulty_flash > 30:  # Show text for first half of flash
-            warning_font = pygame.font.Font(None, 48)
-            
             # Get current stage name
             stages = config.get('difficulty', 'stages')
             stage_name = stages[self.difficulty_level]['name']
             
-            text = warning_font.render(stage_name, True, (255, 200, 0))
+            self.stage_warning_label.set_text(stage_name)
+            text = self.stage_warning_label.surface
             text_rect = text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
             
             # Background for text
@@ -329,18 +493,61 @@ class GameManager:
         # Color shifts from orange to red as difficulty increases
         red = 255
         green = max(0, 100 - self.difficulty_level * 10)
-        border_color = (red, green, 0, border_alpha)
+        border_color = (red, green, 0)
+        
+        # Border pieces are built once and only refilled when the level changes the color
+        if self.danger_pieces is None:
+            edges, corners = self.build_edge_pieces(border_width, border_width)
+            self.danger_pieces = edges + corners
+        if border_color != self.danger_border_color:
+            for surface, _ in self.danger_pieces:
+                surface.fill(border_color)
+            self.danger_border_color = border_color
+        
+        for surface, _ in self.danger_pieces:
+            surface.set_alpha(border_alpha)
+        
+        # Only the edge strips changed
+        return self.screen.blits(self.danger_pieces)
+    
+    def build_edge_pieces(self, border_width, corner_size):
+        """Create opaque surfaces that tile a screen border without overlapping
         
-        # Create border surface
-        border_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+        Border overlays fill these with a color and fade them with surface
+        alpha, instead of compositing a full-screen transparent surface.
         
-        # Draw borders
-        pygame.draw.rect(border_surface, border_color, (0, 0, self.screen_width, border_width))
-        pygame.draw.rect(border_surface, border_color, (0, self.screen_height - border_width, self.screen_width, border_width))
-        pygame.draw.rect(border_surface, border_color, (0, 0, border_width, self.screen_height))
-        pygame.draw.rect(border_surface, border_color, (self.screen_width - border_width, 0, border_width, self.screen_height))
+        Args:
+            border_width: Thickness of the border in pixels
+            corner_size: Size of the square corner pieces, at least border_width
         
-        self.screen.blit(border_surface, (0, 0))
+        Returns:
+            (edge pieces, corner pieces), each a list of (surface, position) pairs
+        """
+        width = self.screen_width
+        height = self.screen_height
+        edge_rects = [
+            (corner_size, 0, width - 2 * corner_size, border_width),  # Top
+            (corner_size, height - border_width, width - 2 * corner_size, border_width),  # Bottom
+            (0, corner_size, border_width, height - 2 * corner_size),  # Left
+            (width - border_width, corner_size, border_width, height - 2 * corner_size)  # Right
+        ]
+        corner_rects = [
+            (0, 0, corner_size, corner_size),
+            (width - corner_size, 0, corner_size, corner_size),
+            (0, height - corner_size, corner_size, corner_size),
+            (width - corner_size, height - corner_size, corner_size, corner_size)
+        ]
+        
+        def make_pieces(rects):
+            pieces = []
+            for x, y, piece_width, piece_height in rects:
+                surface = pygame.Surface((piece_width, piece_height))
+                if pygame.display.get_surface() is not None:
+                    surface = surface.convert()
+                pieces.append((surface, (x, y)))
+            return pieces
+        
+        return make_pieces(edge_rects), make_pieces(corner_rects)
     
     def add_screen_shake(self, intensity, duration):
         """Add screen shake effect
@@ -357,8 +564,8 @@ class GameManager:
         if self.shake_duration > 0:
             self.shake_duration -= 1
             # Random offset within intensity
-            self.shake_offset_x = random.randint(-self.shake_intensity, self.shake_intensity)
-            self.shake_offset_y = random.randint(-self.shake_intensity, self.shake_intensity)
+            self.shake_offset_x = self.rng.effects.randint(-self.shake_intensity, self.shake_intensity)
+            self.shake_offset_y = self.rng.effects.randint(-self.shake_intensity, self.shake_intensity)
             
             # Decay intensity
             if self.shake_duration <= 0:
@@ -388,6 +595,10 @@ class GameManager:
             color: Base color for particles (will add variation)
             count: Number of particles (uses config default if None)
         """
+        # Particles are purely visual
+        if self.headless:
+            return
+        
         if count is None:
             count = config.get('particles', 'explosion_count')
         
@@ -397,29 +608,45 @@ class GameManager:
         size_min = config.get('particles', 'explosion_size_min')
         size_max = config.get('particles', 'explosion_size_max')
         
+        if self.particle_system is not None:
+            # Spawn the whole burst in one batched call
+            self.particle_system.emit(x, y, color, count, speed_min, speed_max, size_min, size_max, lifetime)
+            return
+        
         for _ in range(count):
             # Random direction
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(speed_min, speed_max)
+            angle = self.rng.effects.uniform(0, 2 * math.pi)
+            speed = self.rng.effects.uniform(speed_min, speed_max)
             speed_x = math.cos(angle) * speed
             speed_y = math.sin(angle) * speed
             
             # Color variation
-            color_variation = random.randint(-30, 30)
+            color_variation = self.rng.effects.randint(-30, 30)
             particle_color = tuple(max(0, min(255, c + color_variation)) for c in color[:3])
             
             # Size variation
-            size = random.randint(size_min, size_max)
+            size = self.rng.effects.randint(size_min, size_max)
             
             # Create particle
-            particle = Particle(x, y, particle_color, speed_x, speed_y, size, lifetime)
+            particle = particle_pool.acquire(x, y, particle_color, speed_x, speed_y, size, lifetime)
             self.particles.add(particle)
             self.all_sprites.add(particle)
         
+    def add_score_popup(self, x, y, points, is_powered):
+        """Show a floating score popup - skipped when headless, as it is purely visual"""
+        if self.headless:
+            return
+        self.score_popups.add(score_popup_pool.acquire(x, y, points, is_powered))
+    
     def handle_event(self, event):
         """Handle pygame events"""
         if event.type == pygame.KEYDOWN:
-            if self.state == self.MENU:
+            if event.key == pygame.K_F3:
+                # Toggle the profiler overlay; timing stays on while a frame log is open
+                self.show_profiler = not self.show_profiler
+                self.profiler_overlay = None
+                profiler.set_enabled(self.show_profiler or profiler.logging)
+            elif self.state == self.MENU:
                 if event.key == pygame.K_SPACE:
                     self.audio.play_sound('menu_select')
                     self.reset_game()
@@ -452,7 +679,7 @@ class GameManager:
         triangle_weight = current_stage['triangle_weight']
         square_weight = current_stage['square_weight']
         
-        enemy_roll = random.random()
+        enemy_roll = self.rng.rules.random()
         enemy_type = None
         
         if enemy_roll < circle_weight:
@@ -465,28 +692,31 @@ class GameManager:
             enemy_type = 'square'
             offset = 50  # Adjusted offset for large enemy (closer to screen edge)
         
-        edge = random.randint(0, 3)  # 0=top, 1=right, 2=bottom, 3=left
+        edge = self.rng.rules.randint(0, 3)  # 0=top, 1=right, 2=bottom, 3=left
         
         if edge == 0:  # Top
-            x = random.randint(0, self.screen_width)
+            x = self.rng.rules.randint(0, self.screen_width)
             y = -offset
         elif edge == 1:  # Right
             x = self.screen_width + offset
-            y = random.randint(0, self.screen_height)
+            y = self.rng.rules.randint(0, self.screen_height)
         elif edge == 2:  # Bottom
-            x = random.randint(0, self.screen_width)
+            x = self.rng.rules.randint(0, self.screen_width)
             y = self.screen_height + offset
         else:  # Left
             x = -offset
-            y = random.randint(0, self.screen_height)
+            y = self.rng.rules.randint(0, self.screen_height)
         
         # Create enemy based on determined type
         if enemy_type == 'circle':
-            enemy = Enemy(x, y, self.screen_width, self.screen_height)
+            enemy = Enemy(x, y, self.screen_width, self.screen_height, headless=self.headless,
+                          rules=self.rng.rules)
         elif enemy_type == 'triangle':
-            enemy = TriangleEnemy(x, y, self.screen_width, self.screen_height)
+            enemy = TriangleEnemy(x, y, self.screen_width, self.screen_height, headless=self.headless,
+                                  rules=self.rng.rules)
         else:
-            enemy = SquareEnemy(x, y, self.screen_width, self.screen_height)
+            enemy = SquareEnemy(x, y, self.screen_width, self.screen_height, headless=self.headless,
+                                rules=self.rng.rules)
         
         # Apply Stage 7 damage boost if applicable
         if 'all_enemies_damage' in current_stage:
@@ -496,264 +726,376 @@ class GameManager:
         
         self.enemies.add(enemy)
         self.all_sprites.add(enemy)
+        if self.enemy_swarm is not None:
+            self.enemy_swarm.add(enemy)
     
-    def update(self):
-        """Update game logic based on current state"""
-        # Update starfield in all states
-        self.update_starfield()
+    def update(self, keys=None):
+        """Update game logic based on current state
+        
+        Args:
+            keys: Keyboard state indexed by key code, read from pygame when None
+                (headless runs default to no keys held)
+        """
+        # Update starfield in all states - it is only scenery, so headless runs skip it
+        if not self.headless:
+            with profiler.scope('starfield'):
+                self.update_starfield()
         
         # Update screen shake
         self.update_screen_shake()
         
         if self.state == self.PLAYING:
-            # Update game time
-            self.game_time = time.time() - self.game_start_time
+            if keys is None:
+                keys = NO_KEYS if self.headless else pygame.key.get_pressed()
             
-            # Update low health warning effect
-            self.update_low_health_warning()
-            
-            # Update difficulty flash effect
-            if self.difficulty_flash > 0:
-                self.difficulty_flash -= 1
-            
-            # Difficulty increase based on config stages
-            fps = config.get('game', 'fps')
-            level_interval = config.get('difficulty', 'level_up_interval_seconds')
-            frames_per_level = level_interval * fps
+            # One profiler scope per phase, in simulation order
+            with profiler.scope('difficulty'):
+                self.update_difficulty()
+            with profiler.scope('player'):
+                self.update_player(keys)
+            with profiler.scope('spawning'):
+                self.update_spawning()
+            with profiler.scope('enemies'):
+                self.update_enemies()
+            with profiler.scope('bullets'):
+                self.update_bullets()
+            with profiler.scope('pickups'):
+                self.update_pickups()
+            with profiler.scope('particles'):
+                self.update_particles()
+            with profiler.scope('collide_player_bullets'):
+                self.collide_player_bullets()
+            with profiler.scope('collide_enemy_bullets'):
+                self.collide_enemy_bullets()
+            with profiler.scope('collide_enemies'):
+                self.collide_enemies()
+            with profiler.scope('collide_health_packs'):
+                self.collide_health_packs()
+    
+    def update_difficulty(self):
+        """Advance game time, the warning effects and the difficulty stage"""
+        # Update game time
+        self.frames_played += 1
+        self.game_time = self.frames_played / config.get('game', 'fps')
+        
+        # Update low health warning effect
+        self.update_low_health_warning()
+        
+        # Update difficulty flash effect
+        if self.difficulty_flash > 0:
+            self.difficulty_flash -= 1
+        
+        # Difficulty increase based on config stages
+        fps = config.get('game', 'fps')
+        level_interval = config.get('difficulty', 'level_up_interval_seconds')
+        frames_per_level = level_interval * fps
+        
+        self.difficulty_timer += 1
+        if self.difficulty_timer >= frames_per_level:
+            self.difficulty_timer = 0
             
-            self.difficulty_timer += 1
-            if self.difficulty_timer >= frames_per_level:
-                self.difficulty_timer = 0
+            # Check if we can increase difficulty level
+            if self.difficulty_level < self.max_difficulty_level:
+                self.difficulty_level += 1
                 
-                # Check if we can increase difficulty level
-                if self.difficulty_level < self.max_difficulty_level:
-                    self.difficulty_level += 1
-                    
-                    # Get new stage configuration
-                    stages = config.get('difficulty', 'stages')
-                    new_stage = stages[self.difficulty_level]
-                    self.enemy_spawn_delay = new_stage['spawn_delay']
-                    
-                    self.difficulty_flash = 60  # Flash for 1 second
-                    self.audio.play_sound('warning')  # Play warning sound on difficulty increase
-                    print(f"[难度提升] {new_stage['name']} - 刷新间隔={new_stage['spawn_delay']}帧")
-            
-            # Update player
-            keys = pygame.key.get_pressed()
-            self.player.update(keys)
-            
-            # Player shooting (continuous with arrow keys)
-            bullets, should_play_sound, sound_name = self.player.shoot(keys)
-            for bullet in bullets:
-                self.player_bullets.add(bullet)
-                self.all_sprites.add(bullet)
-            
-            # Play appropriate shoot sound
-            if should_play_sound and sound_name:
-                self.audio.play_sound(sound_name)
-            
-            # Spawn enemies
-            self.enemy_spawn_timer += 1
-            if self.enemy_spawn_timer >= self.enemy_spawn_delay:
-                self.spawn_enemy()
-                self.enemy_spawn_timer = 0
-            
-            # Update enemies and handle enemy shooting
-            for enemy in self.enemies:
-                enemy.update(self.player.rect.center)
+                # Get new stage configuration
+                stages = config.get('difficulty', 'stages')
+                new_stage = stages[self.difficulty_level]
+                self.enemy_spawn_delay = new_stage['spawn_delay']
                 
-                # Enemy shoots toward player
-                if enemy.should_shoot():
-                    bullet = enemy.shoot(self.player.rect.center)
-                    if bullet:
-                        self.enemy_bullets.add(bullet)
-                        self.all_sprites.add(bullet)
-                        self.audio.play_sound('enemy_shoot')  # Play enemy shoot sound
+                self.difficulty_flash = 60  # Flash for 1 second
+                self.audio.play_sound('warning')  # Play warning sound on difficulty increase
+                print(f"[难度提升] {new_stage['name']} - 刷新间隔={new_stage['spawn_delay']}帧")
+    
+    def update_player(self, keys):
+        """Move the player and fire its shots"""
+        # Update player
+        self.player.update(keys)
+        
+        # Player shooting (continuous with arrow keys)
+        bullets, should_play_sound, sound_name = self.player.shoot(keys)
+        for bullet in bullets:
+            self.player_bullets.add(bullet)
+            self.all_sprites.add(bullet)
+            if self.bullet_store is not None:
+                self.bullet_store.add(bullet)
+        
+        # Play appropriate shoot sound
+        if should_play_sound and sound_name:
+            self.audio.play_sound(sound_name)
+    
+    def update_spawning(self):
+        """Spawn an enemy when the spawn timer runs out"""
+        # Spawn enemies
+        self.enemy_spawn_timer += 1
+        if self.enemy_spawn_timer >= self.enemy_spawn_delay:
+            self.spawn_enemy()
+            self.enemy_spawn_timer = 0
+    
+    def update_enemies(self):
+        """Move the enemies and fire their shots"""
+        # Move every enemy in one batch when enabled
+        if self.enemy_swarm is not None:
+            self.enemy_swarm.update(self.player.rect.center)
+        
+        # Update enemies and handle enemy shooting
+        for enemy in self.enemies:
+            if self.enemy_swarm is None:
+                enemy.update(self.player.rect.center)
+            else:
+                enemy.update_timers()
             
-            # Update bullets
+            # Enemy shoots toward player
+            if enemy.should_shoot():
+                bullet = enemy.shoot(self.player.rect.center)
+                if bullet:
+                    self.enemy_bullets.add(bullet)
+                    self.all_sprites.add(bullet)
+                    if self.bullet_store is not None:
+                        self.bullet_store.add(bullet)
+                    self.audio.play_sound('enemy_shoot')  # Play enemy shoot sound
+    
+    def update_bullets(self):
+        """Move every bullet"""
+        # Update bullets
+        if self.bullet_store is not None:
+            self.bullet_store.update(self.screen_width, self.screen_height)
+        else:
             for bullet in self.player_bullets:
                 bullet.update(self.screen_width, self.screen_height)
             for bullet in self.enemy_bullets:
                 bullet.update(self.screen_width, self.screen_height)
-            
-            # Update health packs
-            for health_pack in self.health_packs:
-                health_pack.update(self.player.rect.center, self.player.powered_up)
-            
-            # Update score popups
-            self.score_popups.update()
-            
-            # Update particles
-            self.particles.update()
-            
-            # Check player bullet-enemy collisions
-            for bullet in self.player_bullets:
+    
+    def update_pickups(self):
+        """Update health packs and score popups"""
+        # Update health packs
+        for health_pack in self.health_packs:
+            health_pack.update(self.player.rect.center, self.player.powered_up)
+        
+        # Update score popups
+        self.score_popups.update()
+    
+    def update_particles(self):
+        """Update explosion particles"""
+        # Update particles
+        self.particles.update()
+        if self.particle_system is not None:
+            self.particle_system.update()
+    
+    def collide_player_bullets(self):
+        """Damage enemies hit by player bullets and reward the kills"""
+        # Bucket enemies into grid cells once so each check only tests nearby enemies
+        if self.enemy_grid is not None:
+            self.enemy_grid.build(self.enemies)
+        
+        # Check player bullet-enemy collisions
+        for bullet in self.player_bullets:
+            if self.enemy_grid is not None:
+                hit_enemies = self.enemy_grid.collide(bullet.rect)
+            else:
                 hit_enemies = pygame.sprite.spritecollide(bullet, self.enemies, False)
-                if hit_enemies:
-                    bullet.kill()
-                    for enemy in hit_enemies:
-                        if enemy.take_damage(10):
-                            # Enemy destroyed - add energy and check for health pack drop
-                            health_drop_chance = 0.0
-                            energy_charge = 0.0
-                            points = 10
-                            enemy_color = (220, 50, 50)  # Default red (circle)
-                            
-                            if hasattr(enemy, 'enemy_type'):
-                                if enemy.enemy_type == "triangle":
-                                    health_drop_chance = config.get('enemy_triangle', 'health_pack_drop_chance')
-                                    energy_charge = config.get('enemy_triangle', 'energy_charge')
-                                    points = config.get('enemy_triangle', 'points')
-                                    enemy_color = (200, 50, 200)  # Purple/Magenta for triangle
-                                elif enemy.enemy_type == "square":
-                                    health_drop_chance = config.get('enemy_square', 'health_pack_drop_chance')
-                                    energy_charge = config.get('enemy_square', 'energy_charge')
-                                    points = config.get('enemy_square', 'points')
-                                    enemy_color = (255, 180, 50)  # Orange for square
-                                    # Bigger explosion for square
-                                    self.create_explosion_particles(enemy.rect.centerx, enemy.rect.centery, enemy_color, count=25)
-                                    # Stronger shake for square
-                                    shake_intensity = config.get('screen_shake', 'square_kill_intensity')
-                                    shake_duration = config.get('screen_shake', 'square_kill_duration')
-                                    self.add_screen_shake(shake_intensity, shake_duration)
-                                else:
-                                    health_drop_chance = config.get('enemy_circle', 'health_pack_drop_chance')
-                                    energy_charge = config.get('enemy_circle', 'energy_charge')
-                                    points = config.get('enemy_circle', 'points')
-                                    enemy_color = (220, 50, 50)  # Red for circle
-                            
-                            # Create explosion particles if not square (square handled above)
-                            if not hasattr(enemy, 'enemy_type') or enemy.enemy_type != "square":
-                                self.create_explosion_particles(enemy.rect.centerx, enemy.rect.centery, enemy_color)
-                                # Normal shake for other enemies
-                                shake_intensity = config.get('screen_shake', 'enemy_kill_intensity')
-                                shake_duration = config.get('screen_shake', 'enemy_kill_duration')
+            if hit_enemies:
+                bullet.kill()
+                for enemy in hit_enemies:
+                    if enemy.take_damage(10):
+                        # Enemy destroyed - add energy and check for health pack drop
+                        health_drop_chance = 0.0
+                        energy_charge = 0.0
+                        points = 10
+                        enemy_color = (220, 50, 50)  # Default red (circle)
+                        
+                        if hasattr(enemy, 'enemy_type'):
+                            if enemy.enemy_type == "triangle":
+                                health_drop_chance = config.get('enemy_triangle', 'health_pack_drop_chance')
+                                energy_charge = config.get('enemy_triangle', 'energy_charge')
+                                points = config.get('enemy_triangle', 'points')
+                                enemy_color = (200, 50, 200)  # Purple/Magenta for triangle
+                            elif enemy.enemy_type == "square":
+                                health_drop_chance = config.get('enemy_square', 'health_pack_drop_chance')
+                                energy_charge = config.get('enemy_square', 'energy_charge')
+                                points = config.get('enemy_square', 'points')
+                                enemy_color = (255, 180, 50)  # Orange for square
+                                # Bigger explosion for square
+                                self.create_explosion_particles(enemy.rect.centerx, enemy.rect.centery, enemy_color, count=25)
+                                # Stronger shake for square
+                                shake_intensity = config.get('screen_shake', 'square_kill_intensity')
+                                shake_duration = config.get('screen_shake', 'square_kill_duration')
                                 self.add_screen_shake(shake_intensity, shake_duration)
-                            
-                            # Apply score multiplier when powered up
-                            if self.player.powered_up:
-                                score_multiplier = config.get('powerup', 'score_multiplier')
-                                points *= score_multiplier
-                            
-                            self.score += points
-                            
-                            # Create floating score popup
-                            score_popup = ScorePopup(enemy.rect.centerx, enemy.rect.centery, points, self.player.powered_up)
-                            self.score_popups.add(score_popup)
-                            
-                            # Add energy (cap at 1.0)
-                            self.energy = min(1.0, self.energy + energy_charge)
-                            
-                            # Drop health pack with calculated chance
-                            # Use multiplier from config when player is powered up
-                            health_multiplier = config.get('powerup', 'health_drop_rate_multiplier')
-                            actual_drop_chance = health_drop_chance * health_multiplier if self.player.powered_up else health_drop_chance
-                            if random.random() < actual_drop_chance:
-                                health_pack = HealthPack(enemy.rect.centerx, enemy.rect.centery)
-                                self.health_packs.add(health_pack)
-                                self.all_sprites.add(health_pack)
-                            
-                            self.audio.play_sound('hit')  # Play hit sound
-            
-            # Check enemy bullet-player collisions
-            hit_bullets = pygame.sprite.spritecollide(self.player, self.enemy_bullets, False)
-            if hit_bullets:
-                # Only remove bullets and play sound if player actually takes damage (not invincible)
-                if not self.player.invincible:
-                    # Calculate total damage from all bullets
-                    total_damage = sum(bullet.damage if hasattr(bullet, 'damage') else 1 for bullet in hit_bullets)
-                    for bullet in hit_bullets:
-                        bullet.kill()
-                    
-                    # Screen shake when player is hit
-                    shake_intensity = config.get('screen_shake', 'player_hit_intensity')
-                    shake_duration = config.get('screen_shake', 'player_hit_duration')
-                    self.add_screen_shake(shake_intensity, shake_duration)
-                    
-                    self.audio.play_sound('explosion')  # Play explosion sound when player is hit
-                    if self.player.take_damage(total_damage):
-                        self.state = self.GAME_OVER
-                        self.audio.stop_music()  # Stop music when game over
-                        self.audio.play_sound('game_over')  # Play game over sound
-                        if self.score > self.high_score:
-                            self.high_score = self.score
-                else:
-                    # Remove bullets even during invincibility but don't play sound
-                    for bullet in hit_bullets:
-                        bullet.kill()
-            
-            # Check player-enemy collisions
+                            else:
+                                health_drop_chance = config.get('enemy_circle', 'health_pack_drop_chance')
+                                energy_charge = config.get('enemy_circle', 'energy_charge')
+                                points = config.get('enemy_circle', 'points')
+                                enemy_color = (220, 50, 50)  # Red for circle
+                        
+                        # Create explosion particles if not square (square handled above)
+                        if not hasattr(enemy, 'enemy_type') or enemy.enemy_type != "square":
+                            self.create_explosion_particles(enemy.rect.centerx, enemy.rect.centery, enemy_color)
+                            # Normal shake for other enemies
+                            shake_intensity = config.get('screen_shake', 'enemy_kill_intensity')
+                            shake_duration = config.get('screen_shake', 'enemy_kill_duration')
+                            self.add_screen_shake(shake_intensity, shake_duration)
+                        
+                        # Apply score multiplier when powered up
+                        if self.player.powered_up:
+                            score_multiplier = config.get('powerup', 'score_multiplier')
+                            points *= score_multiplier
+                        
+                        self.score += points
+                        
+                        # Create floating score popup
+                        self.add_score_popup(enemy.rect.centerx, enemy.rect.centery, points, self.player.powered_up)
+                        
+                        # Add energy (cap at 1.0)
+                        self.energy = min(1.0, self.energy + energy_charge)
+                        
+                        # Drop health pack with calculated chance
+                        # Use multiplier from config when player is powered up
+                        health_multiplier = config.get('powerup', 'health_drop_rate_multiplier')
+                        actual_drop_chance = health_drop_chance * health_multiplier if self.player.powered_up else health_drop_chance
+                        if self.rng.rules.random() < actual_drop_chance:
+                            health_pack = HealthPack(enemy.rect.centerx, enemy.rect.centery, headless=self.headless)
+                            self.health_packs.add(health_pack)
+                            self.all_sprites.add(health_pack)
+                        
+                        self.audio.play_sound('hit')  # Play hit sound
+    
+    def collide_enemy_bullets(self):
+        """Damage the player with enemy bullets that hit"""
+        # Check enemy bullet-player collisions
+        hit_bullets = pygame.sprite.spritecollide(self.player, self.enemy_bullets, False)
+        if hit_bullets:
+            # Only remove bullets and play sound if player actually takes damage (not invincible)
+            if not self.player.invincible:
+                # Calculate total damage from all bullets
+                total_damage = sum(bullet.damage if hasattr(bullet, 'damage') else 1 for bullet in hit_bullets)
+                for bullet in hit_bullets:
+                    bullet.kill()
+                
+                # Screen shake when player is hit
+                shake_intensity = config.get('screen_shake', 'player_hit_intensity')
+                shake_duration = config.get('screen_shake', 'player_hit_duration')
+                self.add_screen_shake(shake_intensity, shake_duration)
+                
+                self.audio.play_sound('explosion')  # Play explosion sound when player is hit
+                if self.player.take_damage(total_damage):
+                    self.state = self.GAME_OVER
+                    self.audio.stop_music()  # Stop music when game over
+                    self.audio.play_sound('game_over')  # Play game over sound
+                    if self.score > self.high_score:
+                        self.high_score = self.score
+            else:
+                # Remove bullets even during invincibility but don't play sound
+                for bullet in hit_bullets:
+                    bullet.kill()
+    
+    def collide_enemies(self):
+        """Damage the player with enemies that ram it"""
+        # Check player-enemy collisions
+        if self.enemy_grid is not None:
+            hit_enemies = self.enemy_grid.collide(self.player.rect)
+        else:
             hit_enemies = pygame.sprite.spritecollide(self.player, self.enemies, False)
-            if hit_enemies:
-                # Only kill enemies and play sound if player actually takes damage (not invincible)
-                if not self.player.invincible:
-                    # Calculate total collision damage from all hit enemies
-                    total_damage = sum(enemy.collision_damage for enemy in hit_enemies)
-                    for enemy in hit_enemies:
-                        enemy.kill()
+        if hit_enemies:
+            # Only kill enemies and play sound if player actually takes damage (not invincible)
+            if not self.player.invincible:
+                # Calculate total collision damage from all hit enemies
+                total_damage = sum(enemy.collision_damage for enemy in hit_enemies)
+                for enemy in hit_enemies:
+                    enemy.kill()
+                
+                # Screen shake when player collides with enemy
+                shake_intensity = config.get('screen_shake', 'player_hit_intensity')
+                shake_duration = config.get('screen_shake', 'player_hit_duration')
+                self.add_screen_shake(shake_intensity, shake_duration)
+                
+                self.audio.play_sound('explosion')  # Play explosion sound when player is hit
+                if self.player.take_damage(total_damage):
+                    self.state = self.GAME_OVER
+                    self.audio.stop_music()  # Stop music when game over
+                    self.audio.play_sound('game_over')  # Play game over sound
+                    if self.score > self.high_score:
+                        self.high_score = self.score
+            else:
+                # Kill enemies even during invincibility but don't play sound
+                for enemy in hit_enemies:
+                    enemy.kill()
+    
+    def collide_health_packs(self):
+        """Collect the health packs the player touches"""
+        # Check player-health pack collisions
+        collected_packs = pygame.sprite.spritecollide(self.player, self.health_packs, True)
+        if collected_packs:
+            max_health_limit = config.get('player', 'max_health_limit')
+            
+            for pack in collected_packs:
+                # Check if player is at full health for bonus score
+                if self.player.health >= max_health_limit:
+                    # Award bonus score instead of healing
+                    bonus_score = config.get('health_pack', 'full_health_bonus_score')
+                    self.score += bonus_score
                     
-                    # Screen shake when player collides with enemy
-                    shake_intensity = config.get('screen_shake', 'player_hit_intensity')
-                    shake_duration = config.get('screen_shake', 'player_hit_duration')
-                    self.add_screen_shake(shake_intensity, shake_duration)
+                    # Create floating score popup at health pack position
+                    self.add_score_popup(pack.rect.centerx, pack.rect.centery, bonus_score, False)
                     
-                    self.audio.play_sound('explosion')  # Play explosion sound when player is hit
-                    if self.player.take_damage(total_damage):
-                        self.state = self.GAME_OVER
-                        self.audio.stop_music()  # Stop music when game over
-                        self.audio.play_sound('game_over')  # Play game over sound
-                        if self.score > self.high_score:
-                            self.high_score = self.score
+                    self.audio.play_sound('heal')  # Play heal sound for bonus
                 else:
-                    # Kill enemies even during invincibility but don't play sound
-                    for enemy in hit_enemies:
-                        enemy.kill()
-            
-            # Check player-health pack collisions
-            collected_packs = pygame.sprite.spritecollide(self.player, self.health_packs, True)
-            if collected_packs:
-                max_health_limit = config.get('player', 'max_health_limit')
-                
-                for pack in collected_packs:
-                    # Check if player is at full health for bonus score
-                    if self.player.health >= max_health_limit:
-                        # Award bonus score instead of healing
-                        bonus_score = config.get('health_pack', 'full_health_bonus_score')
-                        self.score += bonus_score
-                        
-                        # Create floating score popup at health pack position
-                        score_popup = ScorePopup(pack.rect.centerx, pack.rect.centery, bonus_score, False)
-                        self.score_popups.add(score_popup)
-                        
-                        self.audio.play_sound('heal')  # Play heal sound for bonus
-                    else:
-                        # Heal player using config heal amount
-                        heal_amount = config.get('health_pack', 'heal_amount')
-                        self.player.health = min(self.player.health + heal_amount, max_health_limit)
-                        self.audio.play_sound('heal')  # Play heal sound when collecting health pack
-    
-    def draw(self):
-        """Draw game based on current state"""
-        # Draw dark space background with difficulty-based color shift
+                    # Heal player using config heal amount
+                    heal_amount = config.get('health_pack', 'heal_amount')
+                    self.player.health = min(self.player.health + heal_amount, max_health_limit)
+                    self.audio.play_sound('heal')  # Play heal sound when collecting health pack
+    
+    def get_background_color(self):
+        """Return the dark space background color for the current difficulty"""
         base_color = 5
         # Background gets slightly redder as difficulty increases
         red_shift = min(30, self.difficulty_level * 3)
-        bg_color = (base_color + red_shift, base_color, base_color + 15)
-        self.screen.fill(bg_color)
+        return (base_color + red_shift, base_color, base_color + 15)
+    
+    def draw_background(self):
+        """Draw the space background, nebula and starfield"""
+        # Draw dark space background with difficulty-based color shift
+        self.screen.fill(self.get_background_color())
         
         # Draw nebula layers for depth
-        self.draw_nebula()
+        with profiler.scope('nebula'):
+            self.draw_nebula()
         
         # Draw animated starfield
-        self.draw_starfield()
+        with profiler.scope('stars'):
+            self.draw_starfield()
+    
+    def draw(self, alpha=1.0):
+        """Draw game based on current state
         
-        # Draw difficulty warning border flash
-        if self.difficulty_flash > 0:
-            self.draw_difficulty_warning()
+        Args:
+            alpha: Fraction of a simulation step elapsed since the last update;
+                moving bullets and particles are drawn interpolated between
+                their previous and current positions
         
-        # Draw persistent danger border based on difficulty level
-        if self.difficulty_level > 0:
-            self.draw_danger_border()
+        Returns:
+            List of screen rects that changed, or None if the whole screen must be presented
+        """
+        if self.headless:
+            return []
+        
+        self.render_alpha = alpha
+        
+        if self.dirty_rects_enabled and self.can_draw_dirty():
+            return self.draw_dirty()
+        
+        # Full-screen frame - the next dirty frame has to restore everything
+        self.dirty_rects = None
+        
+        self.draw_background()
+        
+        with profiler.scope('draw_borders'):
+            # Draw difficulty warning border flash
+            if self.difficulty_flash > 0:
+                self.draw_difficulty_warning()
+            
+            # Draw persistent danger border based on difficulty level
+            if self.difficulty_level > 0:
+                self.draw_danger_border()
         
         if self.state == self.MENU:
             self.draw_menu()
@@ -761,6 +1103,109 @@ class GameManager:
             self.draw_playing()
         elif self.state == self.GAME_OVER:
             self.draw_game_over()
+        
+        if self.show_profiler:
+            self.draw_profiler_overlay()
+        return None
+    
+    def can_draw_dirty(self):
+        """Check whether this frame can be drawn as dirty rects
+        
+        Menus, screen shake and full-screen overlays repaint the whole screen.
+        """
+        return (self.state == self.PLAYING and
+                self.shake_offset_x == 0 and self.shake_offset_y == 0 and
+                self.difficulty_flash == 0 and
+                self.player.health > 1)  # Low health warning covers the screen
+    
+    def draw_dirty(self):
+        """Draw the playing screen over the cached background, returning the changed rects
+        
+        The background (fill, nebula and stars) is cached and only rebuilt every
+        background_refresh_frames frames (never if 0) or when its colors change.
+        Each frame the rects drawn the frame before are restored from it.
+        """
+        self.background_age += 1
+        key = (self.get_background_color(), self.get_nebula_palette())
+        refresh = (self.background is None or key != self.background_key or
+                   (self.background_refresh_frames > 0 and
+                    self.background_age >= self.background_refresh_frames))
+        
+        if refresh:
+            # Draw the background live and keep a copy of it
+            self.draw_background()
+            if self.background is None:
+                self.background = pygame.Surface(self.screen.get_size()).convert(self.screen)
+            self.background.blit(self.screen, (0, 0))
+            self.background_key = key
+            self.background_age = 0
+        elif self.dirty_rects is None:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            # Erase last frame's drawing
+            for rect in self.dirty_rects:
+                self.screen.blit(self.background, rect, rect)
+        
+        rects = []
+        if self.difficulty_level > 0:
+            rects.extend(self.draw_danger_border())
+        rects.extend(self.draw_playing())
+        if self.show_profiler:
+            rects.append(self.draw_profiler_overlay())
+        
+        previous = self.dirty_rects
+        self.dirty_rects = rects
+        if refresh or previous is None:
+            return None
+        return previous + rects
+    
+    def get_entity_counts(self):
+        """Return the number of sprites in each group, for the profiler"""
+        counts = {
+            'enemies': len(self.enemies),
+            'player_bullets': len(self.player_bullets),
+            'enemy_bullets': len(self.enemy_bullets),
+            'health_packs': len(self.health_packs),
+            'score_popups': len(self.score_popups),
+            'particles': len(self.particles),
+        }
+        if self.particle_system is not None:
+            counts['particles'] += len(self.particle_system)
+        return counts
+    
+    def build_profiler_overlay(self):
+        """Render the profiler overlay: rolling ms per timing scope, then entity counts"""
+        font = get_font(20)
+        rows = [(name, f"{ms:.2f} ms", (200, 255, 200)) for name, ms in profiler.averages().items()]
+        rows += [(name, str(count), (200, 200, 255)) for name, count in profiler.counts.items()]
+        if not rows:
+            rows = [("Profiling...", "", (200, 255, 200))]
+        
+        # Names left-aligned, values right-aligned in a second column
+        rendered = [(font.render(name, True, color), font.render(value, True, color)) for name, value, color in rows]
+        name_width = max(name.get_width() for name, _ in rendered)
+        value_width = max(value.get_width() for _, value in rendered)
+        line_height = font.get_linesize()
+        width = name_width + value_width + 36
+        overlay = pygame.Surface((width, line_height * len(rendered) + 12), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 170))
+        for i, (name, value) in enumerate(rendered):
+            y = 6 + i * line_height
+            overlay.blit(name, (10, y))
+            overlay.blit(value, (width - 10 - value.get_width(), y))
+        return overlay
+    
+    def draw_profiler_overlay(self):
+        """Draw the profiler overlay below the HUD, re-rendered every few frames
+        
+        Returns:
+            Screen rect drawn to
+        """
+        self.profiler_overlay_age += 1
+        if self.profiler_overlay is None or self.profiler_overlay_age >= self.PROFILER_REFRESH_FRAMES:
+            self.profiler_overlay = self.build_profiler_overlay()
+            self.profiler_overlay_age = 0
+        return self.screen.blit(self.profiler_overlay, (10, self.HUD_HEIGHT + 10))
     
     def draw_menu(self):
         """Draw menu screen"""
@@ -784,99 +1229,131 @@ class GameManager:
         self.screen.blit(controls3, (self.screen_width // 2 - controls3.get_width() // 2, 480))
     
     def draw_playing(self):
-        """Draw playing screen"""
+        """Draw playing screen
+        
+        Returns:
+            List of screen rects drawn to, for dirty-rect rendering
+        """
         # Apply screen shake offset to all sprite drawing
         offset_x = self.shake_offset_x
         offset_y = self.shake_offset_y
+        rects = []
+        
+        with profiler.scope('draw_sprites'):
+            rects.extend(self.draw_sprites(offset_x, offset_y))
+        
+        # Draw vectorized particles in one batch
+        if self.particle_system is not None:
+            with profiler.scope('draw_particles'):
+                lag = 1.0 - self.render_alpha
+                rects.extend(self.particle_system.draw(self.screen, offset_x, offset_y, return_rects=True, lag=lag))
+        
+        with profiler.scope('draw_markers'):
+            rects.extend(self.draw_score_popups(offset_x, offset_y))
+            
+            # Draw enemy warning indicators
+            rects.extend(self.draw_enemy_warnings())
+        
+        # Drop off-screen sprites - blit clips, leaving empty rects
+        rects = [rect for rect in rects if rect.width and rect.height]
+        
+        with profiler.scope('draw_hud'):
+            rects.extend(self.draw_hud())
+        
+        return rects
+    
+    def draw_sprites(self, offset_x, offset_y):
+        """Draw every sprite, stepping moving ones back when drawn between updates
+        
+        Returns:
+            List of screen rects drawn to
+        """
+        rects = []
+        
+        # Steps behind the latest update to draw moving sprites at
+        lag = 1.0 - self.render_alpha
         
         # Draw all sprites with shake offset
         for sprite in self.all_sprites:
-            self.screen.blit(sprite.image, (sprite.rect.x + offset_x, sprite.rect.y + offset_y))
+            x = sprite.rect.x + offset_x
+            y = sprite.rect.y + offset_y
+            if lag > 0 and isinstance(sprite, MovingSprite):
+                # Bullets and particles move in straight lines, so step them back along their last move
+                move_x, move_y = sprite.last_move
+                x -= int(move_x * lag)
+                y -= int(move_y * lag)
+            rects.append(self.screen.blit(sprite.image, (x, y)))
+        
+        return rects
+    
+    def draw_score_popups(self, offset_x, offset_y):
+        """Draw the floating score popups
+        
+        Returns:
+            List of screen rects drawn to
+        """
+        rects = []
         
         # Draw score popups with shake offset (on top of game sprites but below UI)
         for popup in self.score_popups:
-            self.screen.blit(popup.image, (popup.rect.x + offset_x, popup.rect.y + offset_y))
+            popup.image.set_alpha(popup.alpha)  # Popups share images, so apply each one's fade here
+            rects.append(self.screen.blit(popup.image, (popup.rect.x + offset_x, popup.rect.y + offset_y)))
         
-        # Draw enemy warning indicators
-        self.draw_enemy_warnings()
+        return rects
+    
+    def draw_hud(self):
+        """Draw the HUD - score, health, time, stage, power-up and energy - and the low health overlay
         
-        # Draw UI panel background (semi-transparent)
+        Returns:
+            Screen rects of the HUD bands, which are redrawn every frame
+        """
+        # Draw UI panel background (semi-transparent) - the HUD is redrawn every frame
         self.draw_ui_panel()
         
         # Draw UI - Score with shadow
-        score_text = self.font.render(f"SCORE: {self.score}", True, (255, 255, 255))
-        shadow_text = self.font.render(f"SCORE: {self.score}", True, (0, 0, 0))
-        self.screen.blit(shadow_text, (22, 17))
-        self.screen.blit(score_text, (20, 15))
+        self.score_label.draw(self.screen, f"SCORE: {self.score}", (20, 15))
         
-        # Draw UI - Health (Hearts as shapes with glow)
+        # Draw UI - Health (Hearts as shapes with glow), re-rendered only when health changes
         heart_x = 20
         heart_y = 55
         max_health_limit = config.get('player', 'max_health_limit')
-        
-        for i in range(max_health_limit):
-            x = heart_x + i * 40
-            y = heart_y
-            
-            if i < self.player.health:
-                # Filled heart with glow
-                # Glow effect
-                glow_surface = pygame.Surface((40, 40), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surface, (255, 100, 100, 80), (20, 20), 18)
-                self.screen.blit(glow_surface, (x - 6, y - 2))
-                
-                # Main heart
-                pygame.draw.circle(self.screen, (255, 50, 50), (x + 8, y + 8), 8)
-                pygame.draw.circle(self.screen, (255, 50, 50), (x + 20, y + 8), 8)
-                pygame.draw.polygon(self.screen, (255, 50, 50), [
-                    (x + 2, y + 10),
-                    (x + 26, y + 10),
-                    (x + 14, y + 28)
-                ])
-                # Highlight
-                pygame.draw.circle(self.screen, (255, 150, 150), (x + 6, y + 6), 3)
-                pygame.draw.circle(self.screen, (255, 150, 150), (x + 18, y + 6), 3)
-            else:
-                # Empty heart outline
-                pygame.draw.circle(self.screen, (100, 30, 30), (x + 8, y + 8), 8, width=2)
-                pygame.draw.circle(self.screen, (100, 30, 30), (x + 20, y + 8), 8, width=2)
-                pygame.draw.polygon(self.screen, (100, 30, 30), [
-                    (x + 2, y + 10),
-                    (x + 26, y + 10),
-                    (x + 14, y + 28)
-                ], width=2)
+        health_key = (self.player.health, max_health_limit)
+        if health_key != self.health_row_key:
+            self.health_row = self.build_health_row(*health_key)
+            self.health_row_key = health_key
+        self.screen.blit(self.health_row, (heart_x - 6, heart_y - 2))
         
         # Draw UI - Game Time with icon (moved further right)
         minutes = int(self.game_time // 60)
         seconds = int(self.game_time % 60)
-        time_text = self.font.render(f"{minutes:02d}:{seconds:02d}", True, (200, 200, 255))
-        shadow_text = self.font.render(f"{minutes:02d}:{seconds:02d}", True, (0, 0, 0))
         # Clock icon (moved right)
         pygame.draw.circle(self.screen, (200, 200, 255), (self.screen_width - 180, 28), 12, width=2)
         pygame.draw.line(self.screen, (200, 200, 255), (self.screen_width - 180, 28), (self.screen_width - 180, 20), 2)
         pygame.draw.line(self.screen, (200, 200, 255), (self.screen_width - 180, 28), (self.screen_width - 174, 28), 2)
-        self.screen.blit(shadow_text, (self.screen_width - 145, 17))
-        self.screen.blit(time_text, (self.screen_width - 147, 15))
+        self.time_label.draw(self.screen, f"{minutes:02d}:{seconds:02d}", (self.screen_width - 147, 15))
         
         # Draw difficulty level indicator with style (smaller font)
         if self.difficulty_level > 0:
             stages = config.get('difficulty', 'stages')
             stage_name = stages[self.difficulty_level]['name']
-            small_font = pygame.font.Font(None, 28)  # Smaller font (was 36)
-            level_text = small_font.render(stage_name, True, (255, 200, 100))
-            shadow_text = small_font.render(stage_name, True, (0, 0, 0))
-            self.screen.blit(shadow_text, (self.screen_width - level_text.get_width() - 18, 52))
-            self.screen.blit(level_text, (self.screen_width - level_text.get_width() - 20, 50))
+            self.stage_label.set_text(stage_name)
+            self.stage_label.draw(self.screen, stage_name, (self.screen_width - self.stage_label.get_width() - 20, 50))
         
         # Draw UI - Power-up status (moved below energy bar to avoid overlap)
         if self.player.powered_up:
             fps = config.get('game', 'fps')
             time_left = self.player.powerup_timer / fps
-            powerup_text = self.font.render(f"POWER-UP: {time_left:.1f}s", True, (255, 215, 0))
+            self.powerup_label.set_text(f"POWER-UP: {time_left:.1f}s")
+            powerup_text = self.powerup_label.surface
             # Draw with pulsing effect
             pulse = abs(math.sin(self.player.powerup_timer * 0.1)) * 20
-            powerup_bg = pygame.Surface((powerup_text.get_width() + 20, powerup_text.get_height() + 10), pygame.SRCALPHA)
-            pygame.draw.rect(powerup_bg, (255, 215, 0, int(50 + pulse)), powerup_bg.get_rect(), border_radius=5)
+            badge_key = (powerup_text.get_width() + 20, powerup_text.get_height() + 10, int(50 + pulse))
+            powerup_bg = self.powerup_badges.get(badge_key)
+            if powerup_bg is None:
+                if len(self.powerup_badges) >= self.POWERUP_BADGE_CACHE_SIZE:
+                    self.powerup_badges.clear()
+                powerup_bg = self.build_powerup_badge(*badge_key)
+                self.powerup_badges[badge_key] = powerup_bg
             # Position below energy bar: energy bar is at y=30 with height=50, so safe position is 30+50+15=95
             powerup_y = 95
             self.screen.blit(powerup_bg, (self.screen_width // 2 - powerup_text.get_width() // 2 - 10, powerup_y))
@@ -888,21 +1365,27 @@ class GameManager:
         # Draw low health warning visual effects if health is critical
         if self.player.health <= 1:
             self.draw_low_health_warning()
-    
-    def draw_low_health_warning(self):
-        """Draw visual warning effects when health is critically low - optimized version"""
-        # Slower pulsing with reduced frequency
-        pulse = abs(math.sin(self.low_health_flash * 0.05))
-        alpha = int(60 * pulse)
         
-        if alpha == 0:
-            return
+        return [pygame.Rect(0, 0, self.screen_width, self.HUD_HEIGHT),
+                pygame.Rect(0, self.screen_height - 100, self.screen_width, 100)]
+    
+    @staticmethod
+    def build_powerup_badge(width, height, alpha):
+        """Render the rounded gold background of the power-up timer at one pulse alpha"""
+        badge = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.rect(badge, (255, 215, 0, alpha), badge.get_rect(), border_radius=5)
+        return badge
+    
+    def build_low_health_vignette(self, screen_width, screen_height):
+        """Render the red low health vignette at full pulse strength for a screen size
         
-        # Create warning overlay with red tint
-        warning_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+        Returns:
+            (vignette surface, list of (position, area) pairs covering its edge bands)
+        """
+        warning_surface = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
         
         # Draw smooth gradient from edges using rectangles for performance
-        border_size = int(min(self.screen_width, self.screen_height) * 0.1)  # 10% from each edge
+        border_size = int(min(screen_width, screen_height) * 0.1)  # 10% from each edge
         
         # Draw gradient layers - much faster than per-pixel
         steps = 20  # Number of gradient steps (reduced for performance)
@@ -910,7 +1393,9 @@ class GameManager:
             # Calculate distance and alpha for this layer
             layer_dist = int((i / steps) * border_size)
             fade = i / steps
-            layer_alpha = int(alpha * (1 - fade))
+            layer_alpha = int(60 * (1 - fade))
+            # The gradient used to be blended twice, so bake in its doubled strength
+            layer_alpha = int(255 * (1 - (1 - layer_alpha / 255) ** 2))
             
             if layer_alpha > 0:
                 color = (255, 0, 0, layer_alpha)
@@ -919,51 +1404,69 @@ class GameManager:
                 # Top border
                 pygame.draw.rect(warning_surface, color, 
                                (layer_dist, layer_dist, 
-                                self.screen_width - 2 * layer_dist, thickness))
+                                screen_width - 2 * layer_dist, thickness))
                 # Bottom border
                 pygame.draw.rect(warning_surface, color,
-                               (layer_dist, self.screen_height - layer_dist - thickness,
-                                self.screen_width - 2 * layer_dist, thickness))
+                               (layer_dist, screen_height - layer_dist - thickness,
+                                screen_width - 2 * layer_dist, thickness))
                 # Left border
                 pygame.draw.rect(warning_surface, color,
                                (layer_dist, layer_dist,
-                                thickness, self.screen_height - 2 * layer_dist))
+                                thickness, screen_height - 2 * layer_dist))
                 # Right border
                 pygame.draw.rect(warning_surface, color,
-                               (self.screen_width - layer_dist - thickness, layer_dist,
-                                thickness, self.screen_height - 2 * layer_dist))
-        
-        self.screen.blit(warning_surface, (0, 0))
+                               (screen_width - layer_dist - thickness, layer_dist,
+                                thickness, screen_height - 2 * layer_dist))
         
         # Subtle screen edge accent lines
-        edge_alpha = int(80 * pulse)
-        if edge_alpha > 0:
-            edge_thickness = 2
-            
-            # Top edge
-            pygame.draw.rect(warning_surface, (255, 50, 50, edge_alpha), 
-                            (0, 0, self.screen_width, edge_thickness))
-            # Bottom edge
-            pygame.draw.rect(warning_surface, (255, 50, 50, edge_alpha), 
-                            (0, self.screen_height - edge_thickness, self.screen_width, edge_thickness))
-            # Left edge
-            pygame.draw.rect(warning_surface, (255, 50, 50, edge_alpha), 
-                            (0, 0, edge_thickness, self.screen_height))
-            # Right edge
-            pygame.draw.rect(warning_surface, (255, 50, 50, edge_alpha), 
-                            (self.screen_width - edge_thickness, 0, edge_thickness, self.screen_height))
-            
-            self.screen.blit(warning_surface, (0, 0))
+        edge_color = (255, 50, 50, 80)
+        edge_thickness = 2
+        pygame.draw.rect(warning_surface, edge_color, (0, 0, screen_width, edge_thickness))
+        pygame.draw.rect(warning_surface, edge_color, (0, screen_height - edge_thickness, screen_width, edge_thickness))
+        pygame.draw.rect(warning_surface, edge_color, (0, 0, edge_thickness, screen_height))
+        pygame.draw.rect(warning_surface, edge_color, (screen_width - edge_thickness, 0, edge_thickness, screen_height))
+        
+        # Everything inside the edge bands is transparent, so only the bands are blitted
+        bands = [
+            pygame.Rect(0, 0, screen_width, border_size),
+            pygame.Rect(0, screen_height - border_size, screen_width, border_size),
+            pygame.Rect(0, border_size, border_size, screen_height - 2 * border_size),
+            pygame.Rect(screen_width - border_size, border_size, border_size, screen_height - 2 * border_size)
+        ]
+        return convert_for_display(warning_surface), [(band.topleft, band) for band in bands]
+    
+    def draw_low_health_warning(self):
+        """Draw visual warning effects when health is critically low - optimized version"""
+        # Slower pulsing with reduced frequency
+        pulse = abs(math.sin(self.low_health_flash * 0.05))
+        alpha = int(255 * pulse)
+        
+        if alpha == 0:
+            return
+        
+        # The vignette is rendered once per screen size and faded with surface alpha
+        screen_size = self.screen.get_size()
+        if screen_size != self.low_health_vignette_size:
+            vignette, bands = self.build_low_health_vignette(*screen_size)
+            self.low_health_vignette = vignette
+            self.low_health_blits = [(vignette, position, area) for position, area in bands]
+            self.low_health_vignette_size = screen_size
+        
+        self.low_health_vignette.set_alpha(alpha)
+        self.screen.blits(self.low_health_blits, doreturn=False)
     
     def draw_enemy_warnings(self):
-        """Draw warning indicators for off-screen or near-edge enemies"""
-        arrow_size = config.get('warning', 'arrow_size')
-        arrow_distance = config.get('warning', 'arrow_distance')
-        pulse_speed = config.get('warning', 'pulse_speed')
-        warning_color = config.get('warning', 'warning_color')
+        """Draw warning indicators for off-screen or near-edge enemies
         
-        # Pulse effect for animation
-        pulse = abs(math.sin(self.game_time * pulse_speed * 10))
+        Returns:
+            List of screen rects covered by the indicators
+        """
+        arrow_distance = self.warning_arrow_distance
+        
+        # Pulse effect for animation, snapped to the pre-rendered levels
+        pulse = abs(math.sin(self.game_time * self.warning_pulse_speed * 10))
+        level = int(pulse * (self.WARNING_PULSE_LEVELS - 1) + 0.5)
+        rects = []
         
         for enemy in self.enemies:
             # Only show warning if enemy is OUTSIDE the screen (not visible yet)
@@ -996,36 +1499,36 @@ class GameManager:
                 arrow_y = max(arrow_distance, min(self.screen_height - arrow_distance, enemy.rect.centery))
             
             if is_off_screen and direction:
-                # Adjust color brightness with pulse
-                pulse_brightness = int(155 + pulse * 100)
-                color = tuple(int(c * pulse_brightness / 255) for c in warning_color)
-                
                 # Draw warning indicator
-                self.draw_warning_arrow(arrow_x, arrow_y, direction, color, arrow_size, pulse)
+                rects.append(self.draw_warning_arrow(arrow_x, arrow_y, direction, level))
+        return rects
     
-    def draw_warning_arrow(self, x, y, direction, color, size, pulse):
-        """Draw a warning arrow at the edge of the screen
+    def build_warning_arrow(self, direction, level):
+        """Render a warning arrow with its glow for a direction and pulse level
         
         Args:
-            x, y: Position to draw arrow
             direction: 'top', 'bottom', 'left', 'right'
-            color: RGB color tuple
-            size: Size of arrow
-            pulse: Pulse value (0-1) for animation
+            level: Pulse level, 0 to WARNING_PULSE_LEVELS - 1
         """
+        size = self.warning_arrow_size
+        pulse = level / (self.WARNING_PULSE_LEVELS - 1)
+        
+        # Adjust color brightness with pulse
+        pulse_brightness = int(155 + pulse * 100)
+        color = tuple(int(c * pulse_brightness / 255) for c in self.warning_color)
+        
         # Create semi-transparent surface for glow
         glow_size = int(size * 2.5)
-        glow_surface = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
+        arrow_surface = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
         
         # Glow effect
         for i in range(3, 0, -1):
             alpha = int(80 * (i / 3) * pulse)
             glow_color = (*color, alpha)
-            pygame.draw.circle(glow_surface, glow_color, (glow_size, glow_size), size + i * 5)
+            pygame.draw.circle(arrow_surface, glow_color, (glow_size, glow_size), size + i * 5)
         
-        self.screen.blit(glow_surface, (int(x - glow_size), int(y - glow_size)))
-        
-        # Draw arrow pointing toward enemy
+        # Draw arrow pointing toward enemy, centered on the glow
+        x = y = glow_size
         if direction == 'top':
             # Arrow pointing up
             points = [
@@ -1056,54 +1559,137 @@ class GameManager:
             ]
         
         # Draw arrow with outline
-        pygame.draw.polygon(self.screen, (0, 0, 0), points, width=0)  # Black fill for outline
-        pygame.draw.polygon(self.screen, color, [(p[0], p[1]) for p in points])
-        pygame.draw.polygon(self.screen, (255, 255, 255), points, width=2)  # White outline
+        pygame.draw.polygon(arrow_surface, (0, 0, 0), points, width=0)  # Black fill for outline
+        pygame.draw.polygon(arrow_surface, color, points)
+        pygame.draw.polygon(arrow_surface, (255, 255, 255), points, width=2)  # White outline
+        
+        return convert_for_display(arrow_surface)
     
-    def draw_ui_panel(self):
-        """Draw semi-transparent UI panel background"""
+    def draw_warning_arrow(self, x, y, direction, level):
+        """Draw a warning arrow at the edge of the screen
+        
+        Args:
+            x, y: Position to draw arrow
+            direction: 'top', 'bottom', 'left', 'right'
+            level: Pulse level, 0 to WARNING_PULSE_LEVELS - 1
+        
+        Returns:
+            Screen rect covered by the glow, which contains the arrow
+        """
+        key = (direction, level)
+        arrow = self.warning_arrows.get(key)
+        if arrow is None:
+            arrow = self.build_warning_arrow(direction, level)
+            self.warning_arrows[key] = arrow
+        
+        glow_size = arrow.get_width() // 2
+        return self.screen.blit(arrow, (int(x - glow_size), int(y - glow_size)))
+    
+    @staticmethod
+    def draw_heart(surface, x, y, filled):
+        """Draw one health heart with its top-left corner at (x, y)"""
+        if filled:
+            # Filled heart with glow
+            # Glow effect - drawn straight into the surface, it is not blended
+            pygame.draw.circle(surface, (255, 100, 100, 80), (x + 14, y + 18), 18)
+            
+            # Main heart
+            pygame.draw.circle(surface, (255, 50, 50), (x + 8, y + 8), 8)
+            pygame.draw.circle(surface, (255, 50, 50), (x + 20, y + 8), 8)
+            pygame.draw.polygon(surface, (255, 50, 50), [
+                (x + 2, y + 10),
+                (x + 26, y + 10),
+                (x + 14, y + 28)
+            ])
+            # Highlight
+            pygame.draw.circle(surface, (255, 150, 150), (x + 6, y + 6), 3)
+            pygame.draw.circle(surface, (255, 150, 150), (x + 18, y + 6), 3)
+        else:
+            # Empty heart outline
+            pygame.draw.circle(surface, (100, 30, 30), (x + 8, y + 8), 8, width=2)
+            pygame.draw.circle(surface, (100, 30, 30), (x + 20, y + 8), 8, width=2)
+            pygame.draw.polygon(surface, (100, 30, 30), [
+                (x + 2, y + 10),
+                (x + 26, y + 10),
+                (x + 14, y + 28)
+            ], width=2)
+    
+    def build_health_row(self, health, slots):
+        """Render the row of health hearts, including glows, for a health value
+        
+        Hearts are 40 pixels apart and each glow reaches 6 pixels left and 2
+        pixels above its heart, so the row starts 6 pixels left and 2 pixels
+        above the first heart.
+        """
+        row = pygame.Surface((slots * 40, 40), pygame.SRCALPHA)
+        for i in range(slots):
+            self.draw_heart(row, i * 40 + 6, 2, i < health)
+        return convert_for_display(row)
+    
+    def build_ui_panels(self, screen_width):
+        """Render the semi-transparent top and bottom UI panels for a screen width"""
         # Top panel for score and stats
-        top_panel = pygame.Surface((self.screen_width, 100), pygame.SRCALPHA)
-        pygame.draw.rect(top_panel, (0, 0, 0, 120), (0, 0, self.screen_width, 100))
+        top_panel = pygame.Surface((screen_width, 100), pygame.SRCALPHA)
+        pygame.draw.rect(top_panel, (0, 0, 0, 120), (0, 0, screen_width, 100))
         # Bottom gradient
         for i in range(20):
             alpha = int(120 * (1 - i / 20))
-            pygame.draw.line(top_panel, (0, 0, 0, alpha), (0, 100 + i), (self.screen_width, 100 + i))
-        self.screen.blit(top_panel, (0, 0))
+            pygame.draw.line(top_panel, (0, 0, 0, alpha), (0, 100 + i), (screen_width, 100 + i))
         
         # Bottom panel for energy bar
-        bottom_panel = pygame.Surface((self.screen_width, 100), pygame.SRCALPHA)
+        bottom_panel = pygame.Surface((screen_width, 100), pygame.SRCALPHA)
         # Top gradient
         for i in range(20):
             alpha = int(100 * (i / 20))
-            pygame.draw.line(bottom_panel, (0, 0, 0, alpha), (0, i), (self.screen_width, i))
-        pygame.draw.rect(bottom_panel, (0, 0, 0, 100), (0, 20, self.screen_width, 80))
-        self.screen.blit(bottom_panel, (0, self.screen_height - 100))
+            pygame.draw.line(bottom_panel, (0, 0, 0, alpha), (0, i), (screen_width, i))
+        pygame.draw.rect(bottom_panel, (0, 0, 0, 100), (0, 20, screen_width, 80))
+        
+        return convert_for_display(top_panel), convert_for_display(bottom_panel)
     
-    def draw_energy_bar(self):
-        """Draw enhanced energy bar with glow effects"""
-        bar_width = 300  # Adjusted to 300
-        bar_height = 50  # Adjusted to 50
-        bar_x = (self.screen_width - bar_width) // 2
-        bar_y = 30  # Adjusted to 30 pixels from top
+    def draw_ui_panel(self):
+        """Draw semi-transparent UI panel background"""
+        # Panels never change, so they are only rebuilt when the screen size does
+        screen_size = self.screen.get_size()
+        if screen_size != self.ui_panel_size:
+            self.ui_panels = self.build_ui_panels(screen_size[0])
+            self.ui_panel_size = screen_size
         
-        # Clamp energy to 0.0-1.0 range for display
-        display_energy = max(0.0, min(1.0, self.energy))
+        top_panel, bottom_panel = self.ui_panels
+        self.screen.blit(top_panel, (0, 0))
+        self.screen.blit(bottom_panel, (0, screen_size[1] - 100))
+    
+    def build_energy_bar(self, fill_width, color, full, energy_percent):
+        """Render the energy bar composite (glow, fill, shine, border and percentage)
+        
+        Layers are stacked with premultiplied alpha, so blitting the composite
+        with BLEND_PREMULTIPLIED gives the same pixels as drawing each layer
+        straight onto the screen.
+        
+        Args:
+            fill_width: Width of the energy fill in pixels
+            color: Fill color
+            full: Whether to draw the full-energy glow and border
+            energy_percent: Percentage shown inside the bar, ignored when full
+        """
+        bar_width = 300
+        bar_height = 50
+        pad = self.ENERGY_BAR_PAD
+        composite = pygame.Surface((bar_width + pad * 2, bar_height + pad * 2), pygame.SRCALPHA)
+        
+        def blit_layer(layer, pos):
+            # premul_alpha() ignores row padding, so padded surfaces (rendered text) are copied tight first
+            if layer.get_pitch() != layer.get_width() * 4:
+                tight = pygame.Surface(layer.get_size(), pygame.SRCALPHA)
+                tight.blit(layer, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+                layer = tight
+            composite.blit(layer.premul_alpha(), pos, special_flags=pygame.BLEND_PREMULTIPLIED)
         
         # Background (dark with slight border) - DRAW FIRST
-        pygame.draw.rect(self.screen, (20, 20, 30), (bar_x, bar_y, bar_width, bar_height), border_radius=8)
+        pygame.draw.rect(composite, (20, 20, 30), (pad, pad, bar_width, bar_height), border_radius=8)
         
         # Energy fill - DRAW ON TOP OF BACKGROUND
-        fill_width = int(bar_width * display_energy)
         if fill_width > 0:
-            # Color gradient from blue to gold as it fills
-            if display_energy < 1.0:
-                # Blue to cyan gradient
-                color = (
-                    int(max(0, min(255, 0 + display_energy * 255))),
-                    int(max(0, min(255, 150 + display_energy * 105))),
-                    int(max(0, min(255, 255 - display_energy * 40)))
-                )
+            if not full:
                 # Inner glow
                 glow_surface = pygame.Surface((fill_width + 20, bar_height + 20), pygame.SRCALPHA)
                 for i in range(10, 0, -1):
@@ -1112,12 +1698,8 @@ class GameManager:
                     pygame.draw.rect(glow_surface, glow_color, 
                                    (10 - i, 10 - i, fill_width + i * 2, bar_height + i * 2), 
                                    border_radius=8)
-                self.screen.blit(glow_surface, (bar_x - 10, bar_y - 10))
+                blit_layer(glow_surface, (pad - 10, pad - 10))
             else:
-                # Full - gold color with strong pulsing effect
-                pulse = abs(math.sin(self.game_time * 5)) * 100
-                color = (255, int(max(0, min(255, 215 + pulse))), 0)
-                
                 # Strong glow when full
                 glow_surface = pygame.Surface((bar_width + 40, bar_height + 40), pygame.SRCALPHA)
                 for i in range(20, 0, -1):
@@ -1126,48 +1708,92 @@ class GameManager:
                     pygame.draw.rect(glow_surface, glow_color, 
                                    (20 - i, 20 - i, bar_width + i * 2, bar_height + i * 2), 
                                    border_radius=10)
-                self.screen.blit(glow_surface, (bar_x - 20, bar_y - 20))
+                blit_layer(glow_surface, (pad - 20, pad - 20))
             
             # Draw energy fill
-            pygame.draw.rect(self.screen, color, (bar_x, bar_y, fill_width, bar_height), border_radius=8)
+            pygame.draw.rect(composite, color, (pad, pad, fill_width, bar_height), border_radius=8)
             
             # Shine effect on energy bar
             shine_surface = pygame.Surface((fill_width, bar_height // 2), pygame.SRCALPHA)
             for i in range(bar_height // 2):
                 alpha = int(50 * (1 - i / (bar_height // 2)))
                 pygame.draw.line(shine_surface, (255, 255, 255, alpha), (0, i), (fill_width, i))
-            self.screen.blit(shine_surface, (bar_x, bar_y + 2))
+            blit_layer(shine_surface, (pad, pad + 2))
         
         # Border - DRAW LAST
-        border_color = (255, 215, 0) if self.energy >= 1.0 else (80, 80, 100)
-        border_width_px = 4 if self.energy >= 1.0 else 3
-        pygame.draw.rect(self.screen, border_color, (bar_x, bar_y, bar_width, bar_height), 
+        border_color = (255, 215, 0) if full else (80, 80, 100)
+        border_width_px = 4 if full else 3
+        pygame.draw.rect(composite, border_color, (pad, pad, bar_width, bar_height), 
                         width=border_width_px, border_radius=8)
         
+        if not full:
+            # Energy percentage
+            percent_text = self.font.render(f"ENERGY: {energy_percent}%", True, (150, 200, 255))
+            text_x = pad + bar_width // 2 - percent_text.get_width() // 2
+            text_y = pad + (bar_height - percent_text.get_height()) // 2
+            
+            # Text shadow
+            shadow = self.font.render(f"ENERGY: {energy_percent}%", True, (0, 0, 0))
+            blit_layer(shadow, (text_x + 2, text_y + 2))
+            blit_layer(percent_text, (text_x, text_y))
+        
+        return composite
+    
+    def draw_energy_bar(self):
+        """Draw enhanced energy bar with glow effects"""
+        bar_width = 300  # Adjusted to 300
+        bar_height = 50  # Adjusted to 50
+        bar_x = (self.screen_width - bar_width) // 2
+        bar_y = 30  # Adjusted to 30 pixels from top
+        
+        # Clamp energy to 0.0-1.0 range for display
+        display_energy = max(0.0, min(1.0, self.energy))
+        fill_width = int(bar_width * display_energy)
+        full = self.energy >= 1.0
+        
+        if not full:
+            # Blue to cyan gradient as it fills
+            color = (
+                int(max(0, min(255, 0 + display_energy * 255))),
+                int(max(0, min(255, 150 + display_energy * 105))),
+                int(max(0, min(255, 255 - display_energy * 40)))
+            )
+            energy_percent = int(display_energy * 100)
+        else:
+            # Full - gold color with strong pulsing effect, snapped to a few phases
+            phase = int(abs(math.sin(self.game_time * 5)) * self.ENERGY_PULSE_PHASES)
+            pulse = phase * 100 / self.ENERGY_PULSE_PHASES
+            color = (255, int(max(0, min(255, 215 + pulse))), 0)
+            energy_percent = 100
+        
+        # The composite only changes with the fill width, color and pulse phase
+        key = (fill_width, color, full, energy_percent)
+        composite = self.energy_bar_cache.get(key)
+        if composite is None:
+            if len(self.energy_bar_cache) >= self.ENERGY_BAR_CACHE_SIZE:
+                self.energy_bar_cache.clear()
+            composite = self.build_energy_bar(fill_width, color, full, energy_percent)
+            self.energy_bar_cache[key] = composite
+        self.screen.blit(composite, (bar_x - self.ENERGY_BAR_PAD, bar_y - self.ENERGY_BAR_PAD),
+                         special_flags=pygame.BLEND_PREMULTIPLIED)
+        
         # Text
-        if self.energy >= 1.0:
+        if full:
             # Pulsing text when ready - display below bar
+            if self.energy_ready_text is None:
+                self.energy_ready_text = (
+                    self.font.render(">>> PRESS SPACE TO ACTIVATE <<<", True, (255, 255, 0)),
+                    self.font.render(">>> PRESS SPACE TO ACTIVATE <<<", True, (100, 100, 0))
+                )
+            energy_text, shadow = self.energy_ready_text
             pulse_alpha = int(200 + abs(math.sin(self.game_time * 6)) * 55)
-            energy_text = self.font.render(">>> PRESS SPACE TO ACTIVATE <<<", True, (255, 255, 0))
             energy_text.set_alpha(pulse_alpha)
             text_x = self.screen_width // 2 - energy_text.get_width() // 2
             text_y = bar_y + bar_height + 10  # Display below the bar (was bar_y - 40)
             
             # Text shadow
-            shadow = self.font.render(">>> PRESS SPACE TO ACTIVATE <<<", True, (100, 100, 0))
             self.screen.blit(shadow, (text_x + 2, text_y + 2))
             self.screen.blit(energy_text, (text_x, text_y))
-        else:
-            # Energy percentage
-            energy_percent = int(display_energy * 100)
-            percent_text = self.font.render(f"ENERGY: {energy_percent}%", True, (150, 200, 255))
-            text_x = self.screen_width // 2 - percent_text.get_width() // 2
-            text_y = bar_y + (bar_height - percent_text.get_height()) // 2
-            
-            # Text shadow
-            shadow = self.font.render(f"ENERGY: {energy_percent}%", True, (0, 0, 0))
-            self.screen.blit(shadow, (text_x + 2, text_y + 2))
-            self.screen.blit(percent_text, (text_x, text_y))
     
     def draw_game_over(self):
         """Draw game over screen"""
@@ -0,0 +1,81 @@
+"""
+Object Pool - Recycles short-lived sprites instead of allocating new ones
+"""
+
+
+class PooledSprite:
+    """Sprite mixin that returns itself to its pool when killed"""
+
+    pool = None
+
+    def kill(self):
+        pool = self.pool
+        super().kill()
+        if pool is not None:
+            pool.release(self)
+
+
+class ObjectPool:
+    """Capped free list of reusable objects of one class
+
+    acquire() re-initializes a free object in place by calling its reset()
+    with the constructor arguments, and only constructs a new object when the
+    free list is empty. Hits and misses are counted so steady-state
+    allocation can be checked.
+    """
+
+    # Every pool created, for reporting
+    _pools = []
+
+    def __init__(self, cls, max_size, name=None):
+        self.cls = cls
+        self.max_size = max_size
+        self.name = name or cls.__name__
+        self.free = []
+
+        # Counters
+        self.hits = 0  # Acquired from the free list
+        self.misses = 0  # Had to construct a new object
+        self.dropped = 0  # Released while the free list was full
+
+        ObjectPool._pools.append(self)
+
+    def acquire(self, *args, **kwargs):
+        """Return an object initialized with the given constructor arguments"""
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            self.hits += 1
+        else:
+            obj = self.cls(*args, **kwargs)
+            self.misses += 1
+        obj.pool = self
+        return obj
+
+    def release(self, obj):
+        """Put an object back on the free list unless the pool is full"""
+        obj.pool = None
+        if len(self.free) < self.max_size:
+            self.free.append(obj)
+        else:
+            self.dropped += 1
+
+    def stats(self):
+        """Return the pool counters as a dict"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'dropped': self.dropped,
+            'free': len(self.free)
+        }
+
+    def reset_stats(self):
+        """Zero the counters"""
+        self.hits = 0
+        self.misses = 0
+        self.dropped = 0
+
+    @classmethod
+    def all_stats(cls):
+        """Return the counters of every pool keyed by pool name"""
+        return {pool.name: pool.stats() for pool in cls._pools}
@@ -0,0 +1,149 @@
+"""
+Particle System - Explosion particles stored as NumPy arrays and updated in batches
+"""
+
+import math
+import numpy as np
+from entities import Particle
+
+
+class ParticleSystem:
+    """Fixed-capacity particle engine with one batched update and one batched draw per frame
+
+    Particles live in struct-of-arrays storage. New particles are written at a
+    ring cursor, so once the system is full the oldest particles are recycled.
+    """
+
+    GRAVITY = 0.15
+
+    def __init__(self, capacity, seed=None):
+        self.capacity = capacity
+
+        # Per-particle state
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)  # Center position
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.age = np.zeros(capacity, dtype=np.int32)
+        self.lifetime = np.ones(capacity, dtype=np.int32)
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.ramp_id = np.zeros(capacity, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+        # Ring cursor - the next slot to write, always the oldest particle
+        self.next_slot = 0
+
+        # Fade frames shared with sprite particles, flattened as ramp_id * ramp_length + step
+        self.ramp_length = Particle.FADE_STEPS + 1
+        self._ramp_ids = {}
+        self._frames = []
+
+        self.rng = np.random.default_rng(seed)  # A Generator seed is shared as is
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive))
+
+    def clear(self):
+        """Remove every particle"""
+        self.alive[:] = False
+        self.next_slot = 0
+
+    def _get_ramp_id(self, color, size):
+        """Return the id of the shared fade ramp for a color bucket and size"""
+        key = (color, size)
+        ramp_id = self._ramp_ids.get(key)
+        if ramp_id is None:
+            ramp_id = len(self._ramp_ids)
+            self._ramp_ids[key] = ramp_id
+            self._frames.extend(Particle.get_ramp(color, size))
+        return ramp_id
+
+    def emit(self, x, y, color, count, speed_min, speed_max, size_min, size_max, lifetime):
+        """Spawn an explosion of count particles at (x, y)
+
+        Args:
+            x, y: Position of explosion
+            color: Base color for particles (each particle gets a random brightness shift)
+            count: Number of particles
+            speed_min, speed_max: Range of initial speed
+            size_min, size_max: Range of particle size (inclusive)
+            lifetime: Frames each particle lives
+        """
+        count = min(count, self.capacity)
+        if count <= 0:
+            return
+
+        slots = (self.next_slot + np.arange(count)) % self.capacity
+        self.next_slot = int(slots[-1] + 1) % self.capacity
+
+        # Random direction and speed
+        angle = self.rng.uniform(0, 2 * math.pi, count)
+        speed = self.rng.uniform(speed_min, speed_max, count)
+        self.pos[slots] = (x, y)
+        self.vel[slots, 0] = np.cos(angle) * speed
+        self.vel[slots, 1] = np.sin(angle) * speed
+
+        # Color and size variation
+        variation = self.rng.integers(-30, 31, count)
+        colors = np.clip(np.asarray(color[:3], dtype=np.int32) + variation[:, None], 0, 255)
+        sizes = self.rng.integers(size_min, size_max + 1, count)
+        self.color[slots] = colors
+        self.size[slots] = sizes
+
+        self.age[slots] = 0
+        self.lifetime[slots] = lifetime
+        self.alive[slots] = True
+
+        # Look up a shared fade ramp once per distinct (color bucket, size) in the burst
+        bucket = np.minimum(255, np.round(colors / Particle.COLOR_BUCKET).astype(np.int64) * Particle.COLOR_BUCKET)
+        keys = (bucket[:, 0] << 24) | (bucket[:, 1] << 16) | (bucket[:, 2] << 8) | sizes
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        ramp_ids = np.array([
+            self._get_ramp_id(((key >> 24) & 255, (key >> 16) & 255, (key >> 8) & 255), key & 255)
+            for key in unique_keys.tolist()
+        ], dtype=np.int32)
+        self.ramp_id[slots] = ramp_ids[inverse.ravel()]
+
+    def update(self):
+        """Move, apply gravity to and expire every particle in one step"""
+        alive = self.alive
+        if not alive.any():
+            return
+
+        # Dead slots are advanced too - it is cheaper than masking and they are never drawn
+        self.age += 1
+        self.pos += self.vel
+        self.vel[:, 1] += self.GRAVITY
+        alive &= self.age < self.lifetime
+
+    def draw(self, surface, offset_x=0, offset_y=0, return_rects=False, lag=0.0):
+        """Draw every live particle with a single Surface.blits call
+
+        lag is the fraction of a step to draw particles behind their current
+        position, for interpolated rendering. Returns the list of rects drawn
+        to if return_rects is set, otherwise None.
+        """
+        idx = np.flatnonzero(self.alive)
+        if idx.size == 0:
+            return [] if return_rects else None
+
+        # Fade out over the second half of each particle's life
+        lifetime = self.lifetime[idx]
+        half_life = lifetime * 0.5
+        fade = np.minimum(1.0, 1.0 - (self.age[idx] - half_life) / half_life)
+        step = np.clip((fade * Particle.FADE_STEPS).astype(np.int32), 0, Particle.FADE_STEPS)
+        frame_idx = self.ramp_id[idx] * self.ramp_length + step
+
+        pos = self.pos[idx]
+        if lag > 0:
+            # The last step moved each particle by its velocity before gravity was applied
+            last_move = self.vel[idx]
+            last_move[:, 1] -= self.GRAVITY
+            pos -= last_move * lag
+
+        half_size = self.size[idx] // 2
+        xs = (pos[:, 0] - half_size).astype(np.int32) + offset_x
+        ys = (pos[:, 1] - half_size).astype(np.int32) + offset_y
+
+        frames = self._frames
+        return surface.blits([(frames[f], (x, y)) for f, x, y in zip(frame_idx.tolist(), xs.tolist(), ys.tolist())],
+                             doreturn=return_rects)
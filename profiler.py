@@ -0,0 +1,167 @@
+"""
+Profiler - Named timing scopes per frame, rolling averages and an optional CSV/JSONL log
+"""
+
+import csv
+import json
+import time
+from collections import deque
+
+
+class NullScope:
+    """Timing scope that does nothing, shared by every scope while profiling is off"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+NULL_SCOPE = NullScope()
+
+
+class TimingScope:
+    """Adds the time spent inside a with block to its profiler's current frame
+
+    One scope is shared by every use of a name. It counts how deeply it is
+    entered, so a name nested inside itself (a recursive or re-entrant call)
+    is timed once, from the outermost entry to the outermost exit.
+    """
+
+    __slots__ = ('profiler', 'name', 'start', 'depth')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+        self.depth = 0
+
+    def __enter__(self):
+        if self.depth == 0:
+            self.start = time.perf_counter()
+        self.depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.depth -= 1
+        if self.depth == 0:
+            current = self.profiler.current
+            current[self.name] = current.get(self.name, 0.0) + time.perf_counter() - self.start
+        return False
+
+
+class Profiler:
+    """Per-frame timings of named scopes
+
+    Wrap each phase in `with profiler.scope('name'):`. Time spent in a scope is
+    summed over the frame - a scope entered several times, like update during
+    a catch-up frame, counts every run - and end_frame() closes the frame.
+    While disabled, scope() returns the shared NULL_SCOPE and end_frame()
+    returns at once, so instrumented code costs one call per scope.
+
+    Args:
+        window: Number of frames the rolling averages cover
+    """
+
+    def __init__(self, window=120):
+        self.enabled = False
+        self.window = window
+        self.current = {}  # Seconds per scope in the frame being timed
+        self.history = {}  # Rolling seconds per scope, one entry per frame
+        self.counts = {}  # Latest entity counts passed to end_frame
+        self.frame = 0
+        self._scopes = {}
+        self._sink = None
+        self._sink_file = None
+        self._csv_writer = None
+
+    def set_enabled(self, enabled):
+        """Start or stop timing, dropping the rolling history when stopped"""
+        self.enabled = enabled
+        if not enabled:
+            self.current.clear()
+            self.history.clear()
+
+    @property
+    def logging(self):
+        """Whether frames are being written to a log"""
+        return self._sink is not None
+
+    def scope(self, name):
+        """Return the timing scope for a name, the shared no-op scope while disabled"""
+        if not self.enabled:
+            return NULL_SCOPE
+        scope = self._scopes.get(name)
+        if scope is None:
+            scope = TimingScope(self, name)
+            self._scopes[name] = scope
+        return scope
+
+    def end_frame(self, counts=None):
+        """Close the frame: add its timings to the rolling history and the log
+
+        Args:
+            counts: Optional dict of entity counts to show and log with the frame
+        """
+        if not self.enabled:
+            return
+        self.frame += 1
+        if counts is not None:
+            self.counts = counts
+
+        # Scopes that did not run this frame count as zero
+        for name in self.current:
+            if name not in self.history:
+                self.history[name] = deque(maxlen=self.window)
+        for name, samples in self.history.items():
+            samples.append(self.current.get(name, 0.0))
+
+        if self._sink is not None:
+            self._write_row()
+        self.current.clear()
+
+    def averages(self):
+        """Return the rolling mean of each scope in milliseconds, in the order scopes first finished"""
+        return {name: sum(samples) * 1000 / len(samples) for name, samples in self.history.items()}
+
+    def open_log(self, path):
+        """Log every frame to path - CSV if it ends in .csv, JSON lines otherwise
+
+        JSON lines logs hold one object per frame. Scopes come and go with the
+        game state, so CSV logs hold one (frame, name, value) row per scope and
+        count instead of a fixed set of columns.
+        """
+        self.close_log()
+        self._sink_file = open(path, 'w', newline='')
+        self._sink = 'csv' if path.endswith('.csv') else 'jsonl'
+        self._csv_writer = None
+
+    def close_log(self):
+        """Flush and close the frame log, if one is open"""
+        if self._sink_file is not None:
+            self._sink_file.close()
+        self._sink = None
+        self._sink_file = None
+
+    def _write_row(self):
+        row = {'frame': self.frame}
+        for name, seconds in self.current.items():
+            row[f'{name}_ms'] = round(seconds * 1000, 4)
+        row.update(self.counts)
+
+        if self._sink == 'jsonl':
+            self._sink_file.write(json.dumps(row) + '\n')
+            return
+
+        if self._csv_writer is None:
+            self._csv_writer = csv.writer(self._sink_file)
+            self._csv_writer.writerow(('frame', 'name', 'value'))
+        frame = row.pop('frame')
+        self._csv_writer.writerows((frame, name, value) for name, value in row.items())
+
+
+# Shared instance
+profiler = Profiler()
@@ -0,0 +1,119 @@
+"""
+Replay - Compact recording of player input and bit-for-bit playback of a session
+"""
+
+import struct
+import pygame
+from game_manager import KeyState
+
+
+# Keys the game reads each frame, in bitmask order
+RECORDED_KEYS = (
+    pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d,  # Movement
+    pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT,  # Shooting
+)
+
+# Set when SPACE was pressed since the previous frame (start game, power-up)
+SPACE_PRESSED = 1 << len(RECORDED_KEYS)
+
+# File layout: header, then runs of identical frames as (mask, frame count)
+MAGIC = b'SGRP'
+VERSION = 1
+HEADER = struct.Struct('<4sBQH')  # magic, version, seed, fps
+RUN = struct.Struct('<HH')
+MAX_RUN = 0xFFFF
+
+
+def key_mask(keys):
+    """Pack the recorded keys of a get_pressed()-style state into a bitmask"""
+    mask = 0
+    for bit, key in enumerate(RECORDED_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+class InputRecorder:
+    """Streams the input of every simulated frame to a file
+
+    Each frame is one bitmask of held keys plus the SPACE_PRESSED bit. Runs of
+    identical frames are written as a single 4-byte record, so a held key or an
+    idle menu costs almost nothing.
+    """
+
+    def __init__(self, path, seed, fps):
+        self.file = open(path, 'wb')
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed, fps))
+        self.space_pressed = False
+        self.run_mask = None
+        self.run_length = 0
+        self.frames = 0
+
+    def record_event(self, event):
+        """Note an event handled before the next simulated frame"""
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+            self.space_pressed = True
+
+    def record_frame(self, keys):
+        """Record the key state one simulated frame is updated with"""
+        mask = key_mask(keys)
+        if self.space_pressed:
+            mask |= SPACE_PRESSED
+            self.space_pressed = False
+
+        # A SPACE press is one event, so its frame always starts a run of its own
+        if mask == self.run_mask and not mask & SPACE_PRESSED and self.run_length < MAX_RUN:
+            self.run_length += 1
+        else:
+            self._flush_run()
+            self.run_mask = mask
+            self.run_length = 1
+        self.frames += 1
+
+    def _flush_run(self):
+        if self.run_length:
+            self.file.write(RUN.pack(self.run_mask, self.run_length))
+
+    def close(self):
+        """Write the last run and close the file"""
+        self._flush_run()
+        self.run_length = 0
+        self.file.close()
+
+
+class InputPlayer:
+    """Plays back a recording frame by frame
+
+    Iterating yields (keys, events) per simulated frame: events are handled
+    with GameManager.handle_event, then keys are passed to GameManager.update.
+    The game must be created with the recorded seed and the same config.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        magic, version, self.seed, self.fps = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} input recording")
+
+        self.runs = list(RUN.iter_unpack(data[HEADER.size:]))
+        self.frames = sum(length for _, length in self.runs)
+        self._states = {}
+
+    def __iter__(self):
+        for mask, length in self.runs:
+            keys = self._get_keys(mask & ~SPACE_PRESSED)
+            events = []
+            if mask & SPACE_PRESSED:
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+            for _ in range(length):
+                yield keys, events
+
+    def _get_keys(self, mask):
+        """Return the shared KeyState for a held-key bitmask"""
+        keys = self._states.get(mask)
+        if keys is None:
+            keys = KeyState(key for bit, key in enumerate(RECORDED_KEYS) if mask & (1 << bit))
+            self._states[mask] = keys
+        return keys
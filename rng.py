@@ -0,0 +1,42 @@
+"""
+RNG - Seeded random sources owned by each game so sessions can be reproduced
+"""
+
+import random
+import numpy as np
+
+
+class GameRandom:
+    """Per-game random streams, reseeded in place at the start of every game
+
+    Game rules (spawning, enemy cooldowns, drops) and visual effects (particles,
+    screen shake, starfield, nebula) draw from separate streams, so a headless
+    run that skips the effects still rolls the same rules as a rendered one.
+    The streams are reseeded in place, so objects may keep references to them.
+    Each GameManager owns one, so games running side by side never share a stream.
+    """
+
+    def __init__(self, seed=None):
+        self.rules = random.Random()
+        self.effects = random.Random()
+        self.effects_np = np.random.default_rng()
+        self.current_seed = None
+        self.seed(seed)
+
+    def seed(self, seed=None):
+        """Reseed every stream from one integer seed, a fresh random one if None
+
+        Returns:
+            The seed used
+        """
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.current_seed = seed
+
+        # Derive independent seeds for each stream from the one seed
+        rules_seed, effects_seed, effects_np_seed = np.random.SeedSequence(seed).generate_state(3)
+        self.rules.seed(int(rules_seed))
+        self.effects.seed(int(effects_seed))
+        self.effects_np.bit_generator.state = np.random.PCG64(int(effects_np_seed)).state
+        return seed
+
@@ -0,0 +1,51 @@
+"""
+Spatial Hash - Uniform grid broadphase for sprite collision detection
+"""
+
+
+class SpatialHash:
+    """Buckets sprites into uniform grid cells so rect queries only test nearby sprites
+
+    The grid is sized from the screen: the screen width is split into a fixed
+    number of columns and cells are square. Sprites outside the screen still
+    hash into cells beyond its edges.
+    """
+
+    def __init__(self, screen_width, columns):
+        self.cell_size = max(1, -(-screen_width // columns))  # Ceiling division
+        self.columns = columns
+        self.cells = {}
+
+    def build(self, sprites):
+        """Rebuild the grid from an iterable of sprites, remembering their order"""
+        cells = {}
+        cell_size = self.cell_size
+        for order, sprite in enumerate(sprites):
+            rect = sprite.rect
+            entry = (order, sprite)
+            for cx in range(rect.left // cell_size, (rect.right - 1) // cell_size + 1):
+                for cy in range(rect.top // cell_size, (rect.bottom - 1) // cell_size + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket is None:
+                        cells[(cx, cy)] = [entry]
+                    else:
+                        bucket.append(entry)
+        self.cells = cells
+
+    def collide(self, rect):
+        """Return live sprites whose rects overlap rect, in the order they were added
+
+        Matches pygame.sprite.spritecollide against the group the grid was
+        built from, including skipping sprites killed since the build.
+        """
+        cell_size = self.cell_size
+        cells = self.cells
+        found = {}
+        for cx in range(rect.left // cell_size, (rect.right - 1) // cell_size + 1):
+            for cy in range(rect.top // cell_size, (rect.bottom - 1) // cell_size + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    for order, sprite in bucket:
+                        if order not in found and rect.colliderect(sprite.rect) and sprite.alive():
+                            found[order] = sprite
+        return [found[order] for order in sorted(found)]
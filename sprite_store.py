@@ -0,0 +1,157 @@
+"""
+Sprite Store - Contiguous NumPy arrays mirroring the positions of many sprites
+"""
+
+import numpy as np
+
+
+class StoredSprite:
+    """Sprite mixin that leaves its SpriteStore when killed"""
+
+    store = None
+    store_index = -1
+
+    def kill(self):
+        if self.store is not None:
+            self.store.remove(self)
+        super().kill()
+
+
+class SpriteStore:
+    """Keeps float positions, velocities and sizes of sprites in contiguous arrays
+
+    Sprites are packed densely in slots [0, len(store)). Removing a sprite moves
+    the last sprite into its slot (swap-remove), so removal is O(1) and the live
+    range never has holes. Positions are sprite rect top-left corners.
+    """
+
+    # Per-sprite arrays, kept in step by _grow and remove
+    ARRAYS = ('pos', 'vel', 'size')
+
+    def __init__(self, capacity=256):
+        self.sprites = []
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)
+        self.vel = np.zeros((capacity, 2), dtype=np.float64)
+        self.size = np.zeros((capacity, 2), dtype=np.int32)
+
+    def __len__(self):
+        return len(self.sprites)
+
+    def _grow(self):
+        """Double the capacity of every array"""
+        capacity = len(self.pos) * 2
+        for name in self.ARRAYS:
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def add(self, sprite, vel_x=0.0, vel_y=0.0):
+        """Start tracking a sprite at its current rect position"""
+        index = len(self.sprites)
+        if index >= len(self.pos):
+            self._grow()
+
+        self.sprites.append(sprite)
+        self.pos[index] = sprite.rect.topleft
+        self.vel[index] = (vel_x, vel_y)
+        self.size[index] = sprite.rect.size
+        sprite.store = self
+        sprite.store_index = index
+
+    def remove(self, sprite):
+        """Stop tracking a sprite, moving the last sprite into its slot"""
+        index = sprite.store_index
+        last = len(self.sprites) - 1
+        if index != last:
+            moved = self.sprites[last]
+            self.sprites[index] = moved
+            moved.store_index = index
+            for name in self.ARRAYS:
+                array = getattr(self, name)
+                array[index] = array[last]
+        self.sprites.pop()
+        sprite.store = None
+        sprite.store_index = -1
+
+    def clear(self):
+        """Stop tracking every sprite"""
+        for sprite in self.sprites:
+            sprite.store = None
+            sprite.store_index = -1
+        self.sprites = []
+
+    def sync_rects(self):
+        """Copy array positions back into the sprite rects used for drawing and collision"""
+        count = len(self.sprites)
+        xs = np.floor(self.pos[:count, 0]).astype(np.int32).tolist()
+        ys = np.floor(self.pos[:count, 1]).astype(np.int32).tolist()
+        for sprite, x, y in zip(self.sprites, xs, ys):
+            sprite.rect.topleft = (x, y)
+
+
+class BulletStore(SpriteStore):
+    """Moves and culls every bullet in one vectorized pass"""
+
+    def add(self, bullet):
+        """Start tracking a bullet with its own velocity"""
+        super().add(bullet, bullet.speed_x, bullet.speed_y)
+
+    def update(self, screen_width, screen_height):
+        """Advance every bullet and kill the ones that left the screen"""
+        count = len(self.sprites)
+        if count == 0:
+            return
+
+        pos = self.pos[:count]
+        pos += self.vel[:count]
+
+        # Same bounds test as Bullet.update, on whole-pixel rect positions
+        left = np.floor(pos[:, 0]).astype(np.int32)
+        top = np.floor(pos[:, 1]).astype(np.int32)
+        size = self.size[:count]
+        off_screen = ((left + size[:, 0] < 0) | (left > screen_width) |
+                      (top + size[:, 1] < 0) | (top > screen_height))
+
+        # Kill from the highest slot down so swap-remove never moves a pending slot
+        for index in np.flatnonzero(off_screen)[::-1].tolist():
+            self.sprites[index].kill()
+
+        self.sync_rects()
+
+
+class EnemySwarm(SpriteStore):
+    """Steers every enemy toward the player in one vectorized pass
+
+    Enemy positions are kept as floats, so slow enemies keep their sub-pixel
+    progress instead of losing it to whole-pixel rects every frame.
+    """
+
+    ARRAYS = SpriteStore.ARRAYS + ('speed',)
+
+    def __init__(self, capacity=256):
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        super().__init__(capacity)
+
+    def add(self, enemy):
+        """Start tracking an enemy with its own speed"""
+        super().add(enemy)
+        self.speed[enemy.store_index] = enemy.speed
+
+    def update(self, player_pos):
+        """Move every enemy one step toward player_pos"""
+        count = len(self.sprites)
+        if count == 0:
+            return
+
+        pos = self.pos[:count]
+        delta = np.asarray(player_pos, dtype=np.float64) - (pos + self.size[:count] / 2)
+        distance = np.hypot(delta[:, 0], delta[:, 1])
+
+        # Normalize and scale by speed; enemies already on the player stay put
+        scale = np.divide(self.speed[:count], distance, out=np.zeros(count), where=distance > 0)
+        step = delta * scale[:, None]
+        pos += step
+        self.vel[:count] = step
+
+        self.sync_rects()
@@ -0,0 +1,84 @@
+"""
+Starfield - Scrolling, twinkling background stars stored as NumPy arrays
+"""
+
+import numpy as np
+import pygame
+
+
+class Starfield:
+    """Background stars moved in one vectorized step and drawn with a single Surface.blits call
+
+    Stars are drawn from pre-rendered dots, one per size and brightness
+    level, so drawing costs one blit per star and no per-star math.
+    """
+
+    SIZES = (1, 1, 1, 2, 2, 3)  # More small stars
+    MIN_BRIGHTNESS = 100
+    MAX_BRIGHTNESS = 255
+    BRIGHTNESS_STEPS = 20  # Twinkle brightness is snapped to this many steps
+    TWINKLE_AMOUNT = 30
+
+    def __init__(self, count, screen_width, screen_height, seed=None):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.rng = np.random.default_rng(seed)  # A Generator seed is shared as is
+
+        # Per-star state
+        self.x = self.rng.integers(0, screen_width + 1, count)
+        self.y = self.rng.integers(0, screen_height + 1, count).astype(np.float64)
+        self.size = self.rng.choice(self.SIZES, count)
+        self.brightness = self.rng.integers(150, 256, count)
+        self.speed = self.rng.uniform(0.1, 0.8, count) * (self.size * 0.5)  # Bigger stars move slightly faster
+        # Twinkling effect
+        self.twinkle_speed = self.rng.uniform(0.02, 0.05, count)
+        self.twinkle_offset = self.rng.uniform(0, 6.28, count)  # Random phase
+
+        # Pre-rendered dots indexed by size_index * levels + brightness step
+        self.sizes = sorted(set(self.SIZES))
+        self.size_index = np.searchsorted(self.sizes, self.size)
+        self.levels = self.BRIGHTNESS_STEPS + 1
+        self.dots = [self.render_dot(size, step) for size in self.sizes for step in range(self.levels)]
+
+    def __len__(self):
+        return len(self.x)
+
+    def render_dot(self, size, step):
+        """Render one star dot, matching pygame.draw.circle with radius size"""
+        span = self.MAX_BRIGHTNESS - self.MIN_BRIGHTNESS
+        brightness = round(self.MIN_BRIGHTNESS + step * span / self.BRIGHTNESS_STEPS)
+        # Stars are opaque, so a black colorkey blits faster than per-pixel alpha
+        dot = pygame.Surface((size * 2, size * 2))
+        pygame.draw.circle(dot, (brightness, brightness, brightness), (size, size), size)
+        dot.set_colorkey((0, 0, 0))
+        if pygame.display.get_surface() is not None:
+            dot = dot.convert()
+        return dot
+
+    def update(self):
+        """Scroll every star down, wrapping the ones that left the bottom to a new column at the top"""
+        self.y += self.speed
+        wrapped = np.flatnonzero(self.y > self.screen_height)
+        if wrapped.size:
+            self.y[wrapped] = 0
+            self.x[wrapped] = self.rng.integers(0, self.screen_width + 1, wrapped.size)
+
+    def draw(self, surface, game_time):
+        """Draw every star with its twinkle at game_time"""
+        if len(self.x) == 0:
+            return
+
+        # Twinkling effect using sine wave
+        twinkle = np.sin(game_time * self.twinkle_speed + self.twinkle_offset)
+        brightness = np.clip((self.brightness + twinkle * self.TWINKLE_AMOUNT).astype(np.int32),
+                             self.MIN_BRIGHTNESS, self.MAX_BRIGHTNESS)
+        span = self.MAX_BRIGHTNESS - self.MIN_BRIGHTNESS
+        step = np.rint((brightness - self.MIN_BRIGHTNESS) * (self.BRIGHTNESS_STEPS / span)).astype(np.int32)
+        dot_idx = self.size_index * self.levels + step
+
+        xs = self.x - self.size
+        ys = self.y.astype(np.int32) - self.size
+
+        dots = self.dots
+        surface.blits([(dots[d], (x, y)) for d, x, y in zip(dot_idx.tolist(), xs.tolist(), ys.tolist())],
+                      doreturn=False)
@@ -0,0 +1,69 @@
+"""
+Text Cache - Shared font registry and HUD labels that only re-render when their text changes
+"""
+
+import pygame
+
+# Loaded fonts keyed by (font file, size); None is pygame's default font
+_fonts = {}
+
+
+def get_font(size, name=None):
+    """Return the shared font for a size, loading it on first use"""
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(name, size)
+        _fonts[key] = font
+    return font
+
+
+def preload_fonts(*sizes):
+    """Load fonts ahead of time so the first render does not hitch"""
+    for size in sizes:
+        get_font(size)
+
+
+class TextLabel:
+    """HUD text with a drop shadow that is only re-rendered when its text changes
+
+    Args:
+        size: Font size
+        color: Text color
+        shadow_color: Shadow color, or None for no shadow
+        shadow_offset: Shadow offset from the text in pixels
+        name: Font file, None for pygame's default font
+    """
+
+    def __init__(self, size, color, shadow_color=(0, 0, 0), shadow_offset=(2, 2), name=None):
+        self.font = get_font(size, name)
+        self.color = color
+        self.shadow_color = shadow_color
+        self.shadow_offset = shadow_offset
+
+        # Last rendered text and its surfaces
+        self.text = None
+        self.surface = None
+        self.shadow = None
+
+    def set_text(self, text):
+        """Re-render the label if text differs from what is cached"""
+        if text != self.text:
+            self.text = text
+            self.surface = self.font.render(text, True, self.color)
+            if self.shadow_color is not None:
+                self.shadow = self.font.render(text, True, self.shadow_color)
+
+    def get_width(self):
+        return self.surface.get_width()
+
+    def get_height(self):
+        return self.surface.get_height()
+
+    def draw(self, surface, text, pos):
+        """Draw the label showing text with its top-left corner at pos"""
+        self.set_text(text)
+        x, y = pos
+        if self.shadow is not None:
+            surface.blit(self.shadow, (x + self.shadow_offset[0], y + self.shadow_offset[1]))
+        surface.blit(self.surface, (x, y))